@@ -1,5 +1,6 @@
 """Game entities for Frogger."""
 
+import copy
 import pygame
 from config import *
 
@@ -170,7 +171,18 @@ class Obstacle:
 
 
 class Lane:
-    """A horizontal lane containing obstacles."""
+    """A horizontal lane containing obstacles.
+
+    Road lanes tabulate their occupancy: every obstacle moves at the same
+    constant speed and wraps, so once each has wrapped once the lane repeats
+    exactly every `period` ticks. `occupancy[phase]` is a bitmask of the
+    frog columns an obstacle covers on that tick, which makes collision
+    queries a table lookup and lets the planner look ahead in time.
+
+    The table is filled in as it is needed. Obstacle copies are driven one
+    tick per frame alongside the live ones, and a lookup further ahead
+    drives them on to that tick, so a rebuild costs a frame next to nothing.
+    """
 
     def __init__(self, row, lane_type, speed, size_type, spacing):
         self.row = row
@@ -184,10 +196,91 @@ class Lane:
             x = (i * spacing * GRID_SIZE) % SCREEN_WIDTH
             self.obstacles.append(Obstacle(row, x, lane_type, speed))
 
+        # The frog's collision rect in each column of this row
+        frog_size = FROG_SIZE - 8
+        frog_y = self.row * GRID_SIZE + GRID_SIZE // 2 - FROG_SIZE // 2 + 4
+        self.frog_rects = [pygame.Rect(col * GRID_SIZE + GRID_SIZE // 2 - FROG_SIZE // 2 + 4,
+                                       frog_y, frog_size, frog_size)
+                           for col in range(COLS)]
+
+        # Occupancy table, rebuilt whenever the speed multiplier changes
+        self.tick = 0
+        self.multiplier = None
+        self.occupancy = []
+        self.cycle_start = 0
+        self.period = 1
+        self.sim = None
+        self.wraps = None
+        if self.type != 'log':
+            self.build_occupancy(1.0)
+
+    def build_occupancy(self, speed_multiplier):
+        """Restart the occupancy table from the current positions onward."""
+        self.multiplier = speed_multiplier
+        self.tick = 0
+
+        self.sim = [copy.copy(obs) for obs in self.obstacles]
+        self.occupancy = [self._column_mask()]
+        if self.base_speed * speed_multiplier == 0:
+            self.cycle_start = 0
+            self.period = 1
+            self.sim = None
+        else:
+            self.cycle_start = None
+            self.period = None
+            self.wraps = [[] for _ in self.sim]
+
+    def _column_mask(self):
+        """Bitmask of the frog columns the obstacle copies cover."""
+        mask = 0
+        for obs in self.sim:
+            for col in obs.get_rect().collidelistall(self.frog_rects):
+                mask |= 1 << col
+        return mask
+
+    def _drive_until(self, tick):
+        """Drive the obstacle copies until tick is tabulated or the cycle is known."""
+        # Step copies with the obstacles' own update until every one has
+        # wrapped twice: after its first wrap each repeats the same sequence
+        while self.sim is not None and len(self.occupancy) <= tick:
+            for obs, obs_wraps in zip(self.sim, self.wraps):
+                prev_x = obs.x
+                obs.update(self.multiplier)
+                if (obs.x - prev_x) * obs.speed < 0:
+                    obs_wraps.append(len(self.occupancy))
+            self.occupancy.append(self._column_mask())
+
+            if min(len(w) for w in self.wraps) >= 2:
+                self.cycle_start = max(w[0] for w in self.wraps)
+                self.period = self.wraps[0][1] - self.wraps[0][0]
+                del self.occupancy[self.cycle_start + self.period:]
+                self.sim = self.wraps = None
+
+    def phase(self, tick):
+        """Occupancy table row for a tick counted from the last rebuild."""
+        self._drive_until(tick)
+        if self.cycle_start is None or tick < self.cycle_start:
+            return tick
+        return self.cycle_start + (tick - self.cycle_start) % self.period
+
+    def is_occupied(self, col, tick=None):
+        """Check if an obstacle covers the frog's rect in column col at tick."""
+        if tick is None:
+            tick = self.tick
+        return (self.occupancy[self.phase(tick)] >> col) & 1 == 1
+
     def update(self, speed_multiplier=1.0):
         """Update all obstacles in lane."""
+        if self.type != 'log' and speed_multiplier != self.multiplier:
+            self.build_occupancy(speed_multiplier)
         for obs in self.obstacles:
             obs.update(speed_multiplier)
+        self.tick += 1
+
+        # Keep the table level with the live tick, so a lane the frog has
+        # not entered for a while does not tabulate a whole cycle at once
+        if self.type != 'log':
+            self._drive_until(self.tick)
 
     def draw(self, surface):
         """Draw all obstacles in lane."""
@@ -3,6 +3,7 @@
 import pygame
 from config import *
 from entities import Frog, Lane, Lilypad
+from planner import plan_crossing
 
 
 class Game:
@@ -128,7 +129,7 @@ class Game:
         elif ROAD_START <= frog_row <= ROAD_END:
             for lane in self.lanes:
                 if lane.row == frog_row and lane.type in ['car', 'truck']:
-                    if lane.check_collision(frog_rect):
+                    if lane.is_occupied(self.frog.grid_x):
                         self._death()
                         break
 
@@ -151,6 +152,12 @@ class Game:
         # Missed all lilypads
         self._death()
 
+    def plan_road_crossing(self):
+        """Get per-frame actions for the fastest safe crossing from the frog to the median."""
+        road_lanes = [lane for lane in self.lanes if lane.type in ['car', 'truck']]
+        return plan_crossing(road_lanes, self.frog.grid_x, self.frog.grid_y,
+                             cooldown=self.frog.move_cooldown)
+
     def _death(self):
         """Handle frog death."""
         self.lives -= 1
@@ -0,0 +1,104 @@
+"""Shortest safe road crossing search over lane occupancy tables."""
+
+from config import *
+
+ACTION_MOVES = {
+    'UP': (0, -1),
+    'DOWN': (0, 1),
+    'LEFT': (-1, 0),
+    'RIGHT': (1, 0),
+}
+
+# Give up after this many ticks without reaching the goal row
+MAX_PLAN_TICKS = 3000
+
+
+def plan_crossing(lanes, start_col, start_row=START_ROW, goal_row=ROAD_START,
+                  cooldown=0, max_ticks=MAX_PLAN_TICKS):
+    """
+    Find the fastest way from (start_col, start_row) to goal_row.
+
+    Searches breadth-first over (row, column, tick) in tick order, so the
+    first plan to reach goal_row arrives earliest. Each tick mirrors one
+    game frame: input moves the frog, then the lanes advance and the frog's
+    cell is checked. A move locks the frog in its new cell for
+    FROG_MOVE_COOLDOWN ticks, and every one of those ticks must be clear.
+    Rows without a lane in `lanes` are always safe. Two states with the same
+    cell and the same phase in every lane have identical futures, so only
+    the earliest is expanded.
+
+    Args:
+        lanes: road lanes with occupancy tables, counted from their current tick
+        start_col, start_row: the frog's cell
+        goal_row: row to reach, searched rows lie between it and start_row
+        cooldown: frames left on the frog's move cooldown
+        max_ticks: search horizon
+
+    Returns:
+        List of per-frame actions ('UP', 'DOWN', 'LEFT', 'RIGHT', 'NOOP'),
+        or None if no safe crossing exists within max_ticks.
+    """
+    by_row = {lane.row: lane for lane in lanes}
+    top, bottom = min(start_row, goal_row), max(start_row, goal_row)
+
+    def is_free(col, row, tick):
+        lane = by_row.get(row)
+        return lane is None or not lane.is_occupied(col, lane.tick + tick)
+
+    def phase_key(col, row, tick):
+        return col, row, tuple(lane.phase(lane.tick + tick) for lane in lanes)
+
+    # buckets[t] holds the cells the frog can be in at tick t, ready to move
+    buckets = {cooldown: [(start_col, start_row)]}
+    parents = {(start_col, start_row, cooldown): None}
+    seen = set()
+    for t in range(max_ticks + 1):
+        for col, row in buckets.pop(t, []):
+            if row == goal_row:
+                return _actions_to(parents, (col, row, t))
+            key = phase_key(col, row, t)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            # Stay put for one frame
+            if is_free(col, row, t + 1):
+                _push(buckets, parents, (col, row, t), (col, row, t + 1), 'NOOP')
+
+            # Hop, then sit out the cooldown in the new cell
+            for action, (dx, dy) in ACTION_MOVES.items():
+                new_col, new_row = col + dx, row + dy
+                if not (0 <= new_col < COLS and top <= new_row <= bottom):
+                    continue
+                done = t + FROG_MOVE_COOLDOWN
+                if all(is_free(new_col, new_row, tick) for tick in range(t + 1, done + 1)):
+                    _push(buckets, parents, (col, row, t), (new_col, new_row, done), action)
+
+        if not buckets:
+            break
+
+    return None
+
+
+def _push(buckets, parents, state, next_state, action):
+    """Queue next_state the first time it is reached."""
+    if next_state in parents:
+        return
+    parents[next_state] = (state, action)
+    buckets.setdefault(next_state[2], []).append(next_state[:2])
+
+
+def _actions_to(parents, state):
+    """Expand the parent chain into one action per frame."""
+    actions = []
+    while parents[state] is not None:
+        prev, action = parents[state]
+        if action != 'NOOP':
+            actions.extend(['NOOP'] * (FROG_MOVE_COOLDOWN - 1))
+        actions.append(action)
+        state = prev
+    actions.reverse()
+
+    # A pending cooldown is waited out before the first move
+    first_tick = state[2]
+    return ['NOOP'] * first_tick + actions
@@ -2,8 +2,15 @@
 
 from dataclasses import dataclass
 from enum import Enum
+import math
 import pygame
 
+# Bartender easing rate toward the target position, per second
+BARTENDER_EASE = 10.0
+# Longest step taken while the bartender moves with a mug on the same bar,
+# since the eased motion has no closed-form meeting time with the mug
+BARTENDER_STEP = 1.0 / 120.0
+
 
 class EntityType(Enum):
     CUSTOMER = "customer"
@@ -166,95 +173,154 @@ class GameState:
         return True
 
     def update(self, dt: float) -> None:
-        """Update game state."""
-        if self.game_over:
-            return
-
-        # Update bartender position
-        if self.moving_left:
-            self.bartender_target_x = min(self.bar_width - 40, self.bartender_target_x + self.bartender_speed * dt)
-        if self.moving_right:
-            self.bartender_target_x = max(60, self.bartender_target_x - self.bartender_speed * dt)
+        """Advance the game by dt seconds, one event at a time.
+
+        Customers, drinks and mugs all move at constant speed along their
+        bar, so the time of every spawn, hit, catch and bar-end event is
+        solved directly. The state jumps from event to event, which keeps
+        collisions exact for any dt and lets a headless caller skip idle
+        time in a single call.
+        """
+        while not self.game_over:
+            delay, handler, args = self._next_event()
+            if delay > dt:
+                self._advance(dt)
+                break
+            self._advance(delay)
+            dt -= delay
+            if handler is not None:
+                handler(*args)
+
+    def time_to_next_event(self) -> float:
+        """Seconds until the next spawn, hit, catch or game-ending event."""
+        return self._next_event()[0]
+
+    def _next_event(self):
+        """Find the earliest event as (delay, handler, args).
+
+        Ties go to spawns first, then customers, drinks and mugs. A None
+        handler marks a step boundary where nothing happens.
+        """
+        best = [math.inf, None, ()]
+
+        def consider(delay, handler, *args):
+            delay = max(0.0, delay)
+            if delay < best[0]:
+                best[:] = [delay, handler, args]
+
+        consider(self.spawn_interval - self.spawn_timer, self._on_spawn)
 
-        # Smooth movement
-        diff = self.bartender_target_x - self.bartender_x
-        self.bartender_x += diff * 10.0 * dt
+        for customer in self.customers:
+            consider((self.bar_width - 40 - customer.x) / customer.speed, self._on_customer_at_end)
 
-        # Spawn customers
+        for drink in self.drinks:
+            # The nearest customer within reach ahead of the drink gets served
+            for customer in self.customers:
+                if customer.bar_index != drink.bar_index:
+                    continue
+                gap = customer.x - drink.x
+                if abs(gap) < 30:
+                    consider(0.0, self._on_serve, drink, customer)
+                elif gap > 0 and drink.speed > customer.speed:
+                    consider((gap - 30) / (drink.speed - customer.speed), self._on_serve, drink, customer)
+            consider((self.bar_width - 20 - drink.x) / drink.speed, self._on_drink_at_end, drink)
+
+        bartender_moving = (self.moving_left != self.moving_right
+                            or abs(self.bartender_target_x - self.bartender_x) > 0.01)
+        for mug in self.empty_mugs:
+            if mug.bar_index == self.bartender_bar:
+                gap = mug.x - self.bartender_x
+                if abs(gap) < 30:
+                    consider(0.0, self._on_catch, mug)
+                elif gap > 0:
+                    consider((gap - 30) / mug.speed, self._on_catch, mug)
+                if bartender_moving:
+                    consider(BARTENDER_STEP, None)
+            consider((mug.x - 60) / mug.speed, self._on_mug_fell)
+
+        # Split the step where a held key pins the target at the end of the bar
+        rate = self._target_rate()
+        if rate > 0:
+            consider((self.bar_width - 40 - self.bartender_target_x) / rate,
+                     self._on_target_at_end, self.bar_width - 40)
+        elif rate < 0:
+            consider((60 - self.bartender_target_x) / rate, self._on_target_at_end, 60)
+
+        return best[0], best[1], best[2]
+
+    def _target_rate(self) -> float:
+        """Speed of the bartender's target position from the held keys."""
+        rate = 0.0
+        if self.moving_left and self.bartender_target_x < self.bar_width - 40:
+            rate += self.bartender_speed
+        if self.moving_right and self.bartender_target_x > 60:
+            rate -= self.bartender_speed
+        return rate
+
+    def _advance(self, dt: float) -> None:
+        """Move everything dt seconds along its current path."""
         self.spawn_timer += dt
-        if self.spawn_timer >= self.spawn_interval:
-            self.spawn_timer = 0.0
-            if len(self.customers) < 6:
-                self.spawn_customer()
-
-        # Update customers
         for customer in self.customers:
             customer.update(dt)
-            if customer.is_at_end(self.bar_width):
-                self.game_over = True
-                self.game_over_reason = "Customer reached the bar!"
-                return
-
-        # Update drinks
         for drink in self.drinks:
-            if not drink.active:
-                continue
             drink.update(dt)
-
-            # Check collision with customers
-            for customer in self.customers:
-                if customer.bar_index == drink.bar_index:
-                    if abs(customer.x - drink.x) < 30:
-                        # Hit!
-                        customer.x -= 50  # Push back
-                        drink.active = False
-                        self.score += 50
-
-                        # Check if customer leaves
-                        if customer.x < 0:
-                            self.customers.remove(customer)
-
-                            # Send empty mug back
-                            mug = EmptyMug(
-                                bar_index=drink.bar_index,
-                                x=self.bar_width - 40,
-                                speed=200.0
-                            )
-                            self.empty_mugs.append(mug)
-                        break
-
-            # Check if drink reached end with no customer
-            if drink.active and drink.is_at_end(self.bar_width):
-                drink.active = False
-                # Check if there's any customer on this bar
-                has_customer = any(c.bar_index == drink.bar_index for c in self.customers)
-                if not has_customer:
-                    self.game_over = True
-                    self.game_over_reason = "Drink broke at the end!"
-                    return
-
-        # Update empty mugs
         for mug in self.empty_mugs:
-            if not mug.active:
-                continue
             mug.update(dt)
 
-            # Check collision with bartender
-            if mug.bar_index == self.bartender_bar:
-                if abs(mug.x - self.bartender_x) < 30:
-                    mug.active = False
-                    self.score += 100
-                    continue
+        # Ease toward a target moving at a constant rate, solved exactly
+        rate = self._target_rate()
+        start_target = self.bartender_target_x
+        lag = rate / BARTENDER_EASE
+        decay = math.exp(-BARTENDER_EASE * dt)
+        self.bartender_target_x = min(self.bar_width - 40, max(60, start_target + rate * dt))
+        self.bartender_x = (start_target + rate * dt - lag
+                            + (self.bartender_x - start_target + lag) * decay)
 
-            # Check if mug fell
-            if mug.is_at_end():
-                self.game_over = True
-                self.game_over_reason = "Empty mug fell!"
-                return
+    def _on_target_at_end(self, x: float) -> None:
+        self.bartender_target_x = float(x)
 
-        # Clean up inactive entities
-        self.drinks = [d for d in self.drinks if d.active]
-        self.empty_mugs = [m for m in self.empty_mugs if m.active]
+    def _end_game(self, reason: str) -> None:
+        self.game_over = True
+        self.game_over_reason = reason
+
+    def _on_spawn(self) -> None:
+        self.spawn_timer = 0.0
+        if len(self.customers) < 6:
+            self.spawn_customer()
+
+    def _on_customer_at_end(self) -> None:
+        self._end_game("Customer reached the bar!")
+
+    def _on_serve(self, drink: Drink, customer: Customer) -> None:
+        customer.x -= 50  # Push back
+        drink.active = False
+        self.drinks.remove(drink)
+        self.score += 50
+
+        # Customer leaves and sends the empty mug back
+        if customer.x < 0:
+            self.customers.remove(customer)
+            mug = EmptyMug(
+                bar_index=drink.bar_index,
+                x=self.bar_width - 40,
+                speed=200.0
+            )
+            self.empty_mugs.append(mug)
+
+    def _on_drink_at_end(self, drink: Drink) -> None:
+        drink.active = False
+        self.drinks.remove(drink)
+        # Drinks only break when nobody is on the bar to catch them
+        if not any(c.bar_index == drink.bar_index for c in self.customers):
+            self._end_game("Drink broke at the end!")
+
+    def _on_catch(self, mug: EmptyMug) -> None:
+        mug.active = False
+        self.empty_mugs.remove(mug)
+        self.score += 100
+
+    def _on_mug_fell(self) -> None:
+        self._end_game("Empty mug fell!")
 
     def reset(self) -> None:
         """Reset game state."""
@@ -1,9 +1,16 @@
 """Vector Tapper Soda Dash - A fast-paced arcade game."""
 
+import os
+import random
 import pygame
 import sys
+import time
 from entities import GameState
 
+# Benchmark settings
+BENCH_GAMES = 200
+BENCH_SECONDS = 60.0
+
 
 class Renderer:
     """Handles all rendering for the game."""
@@ -252,5 +259,50 @@ def main():
     sys.exit(0)
 
 
+def serve_policy(state: GameState) -> None:
+    """Chase the empty mug nearest the end, otherwise serve the closest customer."""
+    mugs = [mug for mug in state.empty_mugs if mug.active]
+    if mugs:
+        target = min(mugs, key=lambda mug: mug.x).bar_index
+    elif state.customers:
+        target = max(state.customers, key=lambda customer: customer.x).bar_index
+    else:
+        return
+    while target < state.bartender_bar:
+        state.move_bartender_up()
+    while target > state.bartender_bar:
+        state.move_bartender_down()
+    if not mugs:
+        state.throw_drink()
+
+
+def run_benchmark(games: int = BENCH_GAMES, seconds: float = BENCH_SECONDS) -> None:
+    """Time headless play stepped per 60 fps frame against jumping between events."""
+    for label, frame_dt in (("60 fps frames", 1 / 60), ("event jumps", None)):
+        calls = 0
+        simulated = 0.0
+        score = 0
+        start = time.perf_counter()
+        for seed in range(games):
+            random.seed(seed)
+            state = GameState()
+            elapsed = 0.0
+            while elapsed < seconds and not state.game_over:
+                serve_policy(state)
+                dt = frame_dt or min(state.time_to_next_event(), seconds - elapsed)
+                state.update(dt)
+                elapsed += dt
+                calls += 1
+            simulated += elapsed
+            score += state.score
+        wall = time.perf_counter() - start
+        print(f"{label:14s} {calls / games:8.0f} updates/game  "
+              f"{simulated / wall:10.0f} game s/s  avg score {score / games:.0f}")
+
+
 if __name__ == "__main__":
-    main()
+    if "--bench" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        run_benchmark()
+    else:
+        main()
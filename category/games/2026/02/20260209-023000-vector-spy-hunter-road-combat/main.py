@@ -3,11 +3,14 @@ Vector Spy Hunter: Road Combat
 A high-speed tactical road combat simulator with vector-style graphics.
 """
 
+import os
+import sys
+import time
 import pygame
 import random
 import math
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 # Constants
 SCREEN_WIDTH = 400
@@ -34,6 +37,20 @@ GUN_COOLDOWN = 15
 SMOKE_COOLDOWN = 120
 SMOKE_DURATION = 90
 
+# Road rendering: markings repeat every ROAD_PERIOD rows and are pre-rendered
+# into a tile wide enough to slide ROAD_MARGIN pixels either way on curves
+ROAD_PERIOD = 40
+ROAD_MARGIN = 100
+# Curve resolution of the cached slanted tiles; within one period a step
+# changes the slant by well under a pixel
+ROAD_TILE_STEP = 4
+# Rows above and below the screen covered by the per-frame curve table
+CURVE_TABLE_MARGIN = 64
+SMOKE_ALPHA_LEVELS = 16
+
+# Benchmark settings
+BENCH_FRAMES = 600
+
 @dataclass
 class Vector2:
     x: float
@@ -157,6 +174,9 @@ class Bullet(GameObject):
                         (draw_x + 2, self.y + self.height), 2)
 
 class SmokeParticle(GameObject):
+    # Faded puff sprites keyed by (width, height, alpha level)
+    sprites = {}
+
     def __init__(self, x: float, y: float):
         super().__init__(x, y, random.randint(8, 15), random.randint(8, 15), DIM_GREEN)
         self.life = 60
@@ -168,12 +188,15 @@ class SmokeParticle(GameObject):
         self.x += random.uniform(-0.5, 0.5)
 
     def draw(self, surface: pygame.Surface, offset_x: float = 0):
-        alpha = int((self.life / self.max_life) * 255)
-        color = (*self.color, alpha)
-        draw_x = self.x + offset_x
-        s = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.circle(s, color, (self.width // 2, self.height // 2), self.width // 2)
-        surface.blit(s, (draw_x, self.y))
+        level = self.life * SMOKE_ALPHA_LEVELS // self.max_life
+        key = (self.width, self.height, level)
+        s = SmokeParticle.sprites.get(key)
+        if s is None:
+            color = (*self.color, 255 * level // SMOKE_ALPHA_LEVELS)
+            s = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            pygame.draw.circle(s, color, (self.width // 2, self.height // 2), self.width // 2)
+            SmokeParticle.sprites[key] = s
+        surface.blit(s, (self.x + offset_x, self.y))
 
 class Vehicle(GameObject):
     def __init__(self, x: float, y: float, v_type: str):
@@ -237,6 +260,10 @@ class Road:
         self.curve_direction = 0
         self.curve_target = 0
         self.time_elapsed = 0
+        self.straight_tile: Optional[pygame.Surface] = None
+        self.tiles: Dict[int, pygame.Surface] = {}
+        self.curve_table: List[float] = []
+        self.update_curve_table()
 
     def update(self, speed: float):
         self.offset_y = (self.offset_y + speed) % 40
@@ -247,42 +274,94 @@ class Road:
             self.curve_target = random.randint(-80, 80)
 
         self.curve_offset += (self.curve_target - self.curve_offset) * 0.01
+        self.update_curve_table()
 
     def get_curve_at(self, y: float) -> float:
         # Calculate curve offset based on screen position
         factor = (y / SCREEN_HEIGHT - 0.5) * 2
         return self.curve_offset * factor
 
+    def update_curve_table(self):
+        """Tabulate the curve offset of every scanline on and near the screen."""
+        scale = self.curve_offset * 2 / SCREEN_HEIGHT
+        base = -self.curve_offset
+        self.curve_table = [base + scale * y
+                            for y in range(-CURVE_TABLE_MARGIN, SCREEN_HEIGHT + CURVE_TABLE_MARGIN)]
+
+    def curve_at(self, y: float) -> float:
+        """Curve offset at screen y, looked up from this frame's table."""
+        index = int(y + CURVE_TABLE_MARGIN)
+        return self.curve_table[max(0, min(len(self.curve_table) - 1, index))]
+
+    def build_tile(self) -> pygame.Surface:
+        """Pre-render one dash period of straight road markings."""
+        tile = pygame.Surface((SCREEN_WIDTH + 2 * ROAD_MARGIN, ROAD_PERIOD)).convert()
+        tile.fill(BLACK)
+
+        # Road boundaries
+        for x in (10, SCREEN_WIDTH - 10):
+            pygame.draw.line(tile, DARK_GREEN,
+                           (x + ROAD_MARGIN, 0),
+                           (x + ROAD_MARGIN, 20), 2)
+
+        # Lane markers
+        for lane in range(1, 3):
+            x = LANE_WIDTH * lane + ROAD_MARGIN
+            for dy in range(0, 20, 10):
+                pygame.draw.line(tile, DIM_GREEN,
+                               (x, dy),
+                               (x, dy + 5), 1)
+        return tile
+
+    def sheared_tile(self) -> pygame.Surface:
+        """The road tile with the current curve's per-scanline slant baked in.
+
+        The curve offset is linear in y, so every dash period on screen has
+        the same slant and differs only by a horizontal shift. Tiles are
+        cached per ROAD_TILE_STEP of curve offset, which stays within +/-80.
+        """
+        key = round(self.curve_offset / ROAD_TILE_STEP)
+        tile = self.tiles.get(key)
+        if tile is None:
+            if self.straight_tile is None:
+                self.straight_tile = self.build_tile()
+            straight = self.straight_tile
+            width = straight.get_width()
+            scale = key * ROAD_TILE_STEP * 2 / SCREEN_HEIGHT
+
+            # Copy runs of rows that share a whole-pixel shift in one blit each
+            runs = []
+            run_start = 0
+            run_x = 0
+            for y in range(1, ROAD_PERIOD + 1):
+                x = round(scale * y) if y < ROAD_PERIOD else None
+                if x != run_x:
+                    runs.append((straight, (run_x, run_start), (0, run_start, width, y - run_start)))
+                    run_start = y
+                    run_x = x
+
+            tile = pygame.Surface(straight.get_size()).convert()
+            tile.fill(BLACK)
+            tile.blits(runs, False)
+            # The screen is already cleared, so only the markings need copying
+            tile.set_colorkey(BLACK, pygame.RLEACCEL)
+            self.tiles[key] = tile
+        return tile
+
     def draw(self, surface: pygame.Surface):
-        # Draw road boundaries
-        for y in range(-40, SCREEN_HEIGHT + 40, 40):
-            draw_y = y + self.offset_y - 40
-
-            # Left boundary
-            curve = self.get_curve_at(draw_y)
-            pygame.draw.line(surface, DARK_GREEN,
-                           (10 + curve, draw_y),
-                           (10 + curve, draw_y + 20), 2)
-
-            # Right boundary
-            pygame.draw.line(surface, DARK_GREEN,
-                           (SCREEN_WIDTH - 10 + curve, draw_y),
-                           (SCREEN_WIDTH - 10 + curve, draw_y + 20), 2)
-
-        # Draw lane markers
-        for y in range(-40, SCREEN_HEIGHT + 40, 40):
-            draw_y = y + self.offset_y - 40
-            curve = self.get_curve_at(draw_y)
-
-            for lane in range(1, 3):
-                x = LANE_WIDTH * lane + curve
-                for dy in range(0, 20, 10):
-                    pygame.draw.line(surface, DIM_GREEN,
-                                   (x, draw_y + dy),
-                                   (x, draw_y + dy + 5), 1)
+        """Blit one sheared tile per dash period, scrolled by offset_y and
+        placed at the curve table's offset for the period's first scanline."""
+        tile = self.sheared_tile()
+        table = self.curve_table
+        bands = []
+        for top in range(int(self.offset_y) - ROAD_PERIOD, SCREEN_HEIGHT, ROAD_PERIOD):
+            bands.append((tile, (int(table[top + CURVE_TABLE_MARGIN]) - ROAD_MARGIN, top)))
+        surface.blits(bands, False)
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless: bool = False):
+        # Headless runs simulate and draw sprites but never render the road
+        self.headless = headless
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Vector Spy Hunter: Road Combat")
@@ -309,7 +388,7 @@ class Game:
         base_x = lane * LANE_WIDTH + (LANE_WIDTH - 30) // 2
 
         # Consider road curve when spawning
-        curve = self.road.get_curve_at(-50)
+        curve = self.road.curve_at(-50)
         base_x += curve
 
         roll = random.random()
@@ -390,7 +469,7 @@ class Game:
                     ))
 
         # Update vehicles and check collisions
-        curve_at_player = self.road.get_curve_at(self.player.y)
+        curve_at_player = self.road.curve_at(self.player.y)
 
         for vehicle in self.vehicles[:]:
             vehicle.update(self.player.speed, self.player.x - curve_at_player)
@@ -432,19 +511,18 @@ class Game:
         self.screen.fill(BLACK)
 
         # Draw road
-        self.road.draw(self.screen)
+        if not self.headless:
+            self.road.draw(self.screen)
 
-        # Get curve at different heights for proper rendering
-        curve_offset = 0
-
-        # Draw smoke particles
+        # Draw smoke particles that are on screen
         for smoke in self.smoke_particles:
-            smoke.draw(self.screen, smoke.x - (smoke.x if smoke.x == smoke.x else smoke.x))
+            if smoke.y + smoke.height > 0 and smoke.y < SCREEN_HEIGHT:
+                smoke.draw(self.screen)
 
-        # Draw vehicles
+        # Draw vehicles that are on screen, shifted by the curve at their row
         for vehicle in self.vehicles:
-            curve = self.road.get_curve_at(vehicle.y)
-            vehicle.draw(self.screen, curve)
+            if vehicle.y + vehicle.height + 5 > 0 and vehicle.y < SCREEN_HEIGHT:
+                vehicle.draw(self.screen, self.road.curve_at(vehicle.y))
 
         # Draw bullets
         for bullet in self.bullets:
@@ -502,7 +580,51 @@ class Game:
 
         pygame.quit()
 
+def run_benchmark(frames: int = BENCH_FRAMES):
+    """Time update() and draw() on sweeping curves with smoke, with and without the road."""
+    idle_keys = {pygame.K_LEFT: False, pygame.K_RIGHT: False,
+                 pygame.K_UP: False, pygame.K_DOWN: False}
+    for headless in (False, True):
+        random.seed(0)
+        game = Game(headless=headless)
+        update_total = 0.0
+        draw_total = 0.0
+        peak_smoke = 0
+        for frame in range(frames):
+            if game.game_over:
+                game.reset()
+            # Swing the road hard both ways and keep the weapons busy
+            game.road.curve_target = 80 if (frame // 150) % 2 else -80
+            game.player.update(idle_keys)
+            if game.player.fire_gun():
+                game.bullets.append(Bullet(game.player.x + game.player.width // 2 - 2, game.player.y))
+            if game.player.deploy_smoke():
+                for _ in range(5):
+                    game.smoke_particles.append(SmokeParticle(
+                        game.player.x + random.randint(0, game.player.width),
+                        game.player.y + game.player.height
+                    ))
+
+            start = time.perf_counter()
+            game.update()
+            mid = time.perf_counter()
+            game.draw()
+            end = time.perf_counter()
+            update_total += mid - start
+            draw_total += end - mid
+            peak_smoke = max(peak_smoke, len(game.smoke_particles))
+
+        mode = "headless" if headless else "rendered"
+        print(f"{mode}: update avg {update_total / frames * 1000:.3f} ms/frame, "
+              f"draw avg {draw_total / frames * 1000:.3f} ms/frame, peak smoke {peak_smoke}")
+    pygame.quit()
+
+
 def main():
+    if "--bench" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        run_benchmark()
+        return
     game = Game()
     game.run()
 
@@ -36,8 +36,8 @@ LOW_ATTACK_HITBOX = (50, 25)
 
 # AI
 AIReactionTime = 15  # frames
-AIAttackChance = 0.02
-AIBlockChance = 0.05
+AILookaheadFrames = 30  # frames simulated per candidate action
+AIPreferredDistance = 95  # center distance the AI tries to hold
 
 # Actions
 ACTION_IDLE = "idle"
@@ -5,12 +5,36 @@ from typing import Optional, Tuple
 import config as cfg
 
 
-@dataclass
+@dataclass(frozen=True)
 class AttackInfo:
     attack_type: str
     hitbox: Tuple[int, int, int, int]  # x, y, width, height
     damage: int
     priority: int
+    duration: int  # frames the hitbox stays out
+    cooldown: int  # frames before the next action
+
+
+# Frame data for every attack, shared by all fighters and snapshots
+FRAME_DATA = {
+    cfg.ACTION_ATTACK_HIGH: AttackInfo(cfg.ACTION_ATTACK_HIGH, (0, 10, *cfg.HIGH_ATTACK_HITBOX),
+                                       cfg.HIGH_ATTACK_DAMAGE, 1, cfg.ATTACK_DURATION, cfg.COOLDOWN_FRAMES),
+    cfg.ACTION_ATTACK_LOW: AttackInfo(cfg.ACTION_ATTACK_LOW, (0, 60, *cfg.LOW_ATTACK_HITBOX),
+                                      cfg.LOW_ATTACK_DAMAGE, 2, cfg.ATTACK_DURATION, cfg.COOLDOWN_FRAMES),
+}
+
+
+def rects_overlap(rect1: Tuple[int, int, int, int], rect2: Tuple[int, int, int, int]) -> bool:
+    x1, y1, w1, h1 = rect1
+    x2, y2, w2, h2 = rect2
+    return not (x1 + w1 < x2 or x2 + w2 < x1 or y1 + h1 < y2 or y2 + h2 < y1)
+
+
+def hit_lands(attacker: 'Fighter', defender: 'Fighter') -> bool:
+    if not attacker.is_attacking() or defender.state == cfg.STATE_BLOCKING:
+        return False
+    attack_hitbox = attacker.get_attack_hitbox()
+    return attack_hitbox is not None and rects_overlap(attack_hitbox, defender.rect)
 
 
 class Fighter:
@@ -40,7 +64,6 @@ class Fighter:
 
         # AI state
         self.ai_decision_timer = 0
-        self.ai_cooldown = 0
         self.last_action = cfg.ACTION_IDLE
 
     @property
@@ -51,6 +74,20 @@ class Fighter:
     def rect(self) -> Tuple[int, int, int, int]:
         return (self.x, self.y, self.width, self.height)
 
+    def save_state(self) -> tuple:
+        # Flat snapshot of everything update() and the actions can change;
+        # current_attack is shared frame data, so nothing needs deep copying
+        return (self.x, self.y, self.state, self.facing_right, self.velocity,
+                self.action_timer, self.cooldown_timer, self.stun_timer,
+                self.current_attack, self.score, self.wins,
+                self.ai_decision_timer, self.last_action)
+
+    def load_state(self, state: tuple):
+        (self.x, self.y, self.state, self.facing_right, self.velocity,
+         self.action_timer, self.cooldown_timer, self.stun_timer,
+         self.current_attack, self.score, self.wins,
+         self.ai_decision_timer, self.last_action) = state
+
     def can_act(self) -> bool:
         return (
             self.state not in (cfg.STATE_STUNNED, cfg.STATE_HIT, cfg.STATE_VICTORY, cfg.STATE_DEFEAT)
@@ -121,20 +158,11 @@ class Fighter:
         if not self.can_act():
             return
 
+        attack = FRAME_DATA.get(attack_type, FRAME_DATA[cfg.ACTION_ATTACK_LOW])
         self.state = cfg.STATE_ATTACKING
-        self.action_timer = cfg.ATTACK_DURATION
-        self.cooldown_timer = cfg.COOLDOWN_FRAMES
-
-        if attack_type == cfg.ACTION_ATTACK_HIGH:
-            hitbox = (0, 10, *cfg.HIGH_ATTACK_HITBOX)
-            priority = 1
-            damage = cfg.HIGH_ATTACK_DAMAGE
-        else:  # ACTION_ATTACK_LOW
-            hitbox = (0, 60, *cfg.LOW_ATTACK_HITBOX)
-            priority = 2
-            damage = cfg.LOW_ATTACK_DAMAGE
-
-        self.current_attack = AttackInfo(attack_type, hitbox, damage, priority)
+        self.action_timer = attack.duration
+        self.cooldown_timer = attack.cooldown
+        self.current_attack = attack
 
     def block(self):
         if not self.can_act():
@@ -144,6 +172,18 @@ class Fighter:
         self.action_timer = cfg.BLOCK_DURATION
         self.cooldown_timer = cfg.COOLDOWN_FRAMES
 
+    def perform(self, action: str):
+        if action == cfg.ACTION_MOVE_LEFT:
+            self.move(-1)
+        elif action == cfg.ACTION_MOVE_RIGHT:
+            self.move(1)
+        elif action in FRAME_DATA:
+            self.attack(action)
+        elif action == cfg.ACTION_BLOCK:
+            self.block()
+        else:
+            self.stop_move()
+
     def take_hit(self, damage: int):
         self.state = cfg.STATE_HIT
         self.stun_timer = 15
@@ -181,10 +221,67 @@ class Fighter:
 
 
 class AIFighter(Fighter):
+    CANDIDATE_ACTIONS = (
+        cfg.ACTION_IDLE,
+        cfg.ACTION_MOVE_LEFT,
+        cfg.ACTION_MOVE_RIGHT,
+        cfg.ACTION_ATTACK_HIGH,
+        cfg.ACTION_ATTACK_LOW,
+        cfg.ACTION_BLOCK,
+    )
+    # Opponent inputs each candidate is tested against; None keeps its current state
+    OPPONENT_REPLIES = (None, cfg.ACTION_ATTACK_HIGH, cfg.ACTION_ATTACK_LOW)
+
     def __init__(self, x: int):
         super().__init__(x, is_player=False)
         self.reaction_timer = 0
 
+    def save_state(self) -> tuple:
+        return super().save_state() + (self.reaction_timer,)
+
+    def load_state(self, state: tuple):
+        super().load_state(state[:-1])
+        self.reaction_timer = state[-1]
+
+    def rollout(self, opponent: 'Fighter', action: str, reply: Optional[str]) -> float:
+        # Play action now and reply next frame, then step both fighters the
+        # way Game.update does until a hit lands or the lookahead runs out
+        self.perform(action)
+        for frame in range(cfg.AILookaheadFrames):
+            if frame > 0:
+                if frame == 1 and reply is not None:
+                    opponent.perform(reply)
+                opponent.update()
+                self.update()
+            if hit_lands(opponent, self):
+                return -1.0 + frame / cfg.AILookaheadFrames
+            if hit_lands(self, opponent):
+                return 1.0 - frame / cfg.AILookaheadFrames
+
+        # No hit either way: prefer ending up at striking range
+        distance = abs(self.center_x - opponent.center_x)
+        return -abs(distance - cfg.AIPreferredDistance) / cfg.SCREEN_WIDTH
+
+    def choose_action(self, opponent: 'Fighter') -> str:
+        # Score each candidate by its worst outcome over the opponent's
+        # replies, restoring both fighters from snapshots between rollouts
+        own_state = self.save_state()
+        opponent_state = opponent.save_state()
+        best_action = cfg.ACTION_IDLE
+        best_value = float('-inf')
+        for action in self.CANDIDATE_ACTIONS:
+            value = float('inf')
+            for reply in self.OPPONENT_REPLIES:
+                value = min(value, self.rollout(opponent, action, reply))
+                self.load_state(own_state)
+                opponent.load_state(opponent_state)
+                if value <= best_value:
+                    break
+            if value > best_value:
+                best_action = action
+                best_value = value
+        return best_action
+
     def update_ai(self, opponent: 'Fighter'):
         if not self.can_act():
             return
@@ -193,58 +290,8 @@ class AIFighter(Fighter):
         if self.reaction_timer < cfg.AIReactionTime:
             return
 
-        distance = abs(self.center_x - opponent.center_x)
-        opponent_to_left = opponent.center_x < self.center_x
-
-        # React to opponent attack
-        if opponent.is_attacking() and distance < 120:
-            if self.ai_cooldown == 0:
-                self.block()
-                self.ai_cooldown = 30
-                self.reaction_timer = 0
-                return
-
-        # Decision making
-        import random
-        roll = random.random()
-
-        if distance > 200:
-            # Close distance
-            if opponent_to_left:
-                self.move(-1)
-            else:
-                self.move(1)
-        elif distance < 80:
-            # Too close, maybe back up
-            if roll < 0.3:
-                if opponent_to_left:
-                    self.move(1)
-                else:
-                    self.move(-1)
-            elif roll < cfg.AIAttackChance + 0.3:
-                attack_type = cfg.ACTION_ATTACK_HIGH if roll < 0.4 else cfg.ACTION_ATTACK_LOW
-                self.attack(attack_type)
-                self.reaction_timer = 0
-            else:
-                self.stop_move()
-        else:
-            # Attack range
-            if roll < cfg.AIAttackChance:
-                attack_type = cfg.ACTION_ATTACK_HIGH if roll < cfg.AIAttackChance / 2 else cfg.ACTION_ATTACK_LOW
-                self.attack(attack_type)
-                self.reaction_timer = 0
-            elif roll < cfg.AIAttackChance + cfg.AIBlockChance:
-                self.block()
-                self.reaction_timer = 0
-            else:
-                # Slight movement
-                if roll < 0.55:
-                    if opponent_to_left:
-                        self.move(-1)
-                    else:
-                        self.move(1)
-                else:
-                    self.stop_move()
-
-        if self.ai_cooldown > 0:
-            self.ai_cooldown -= 1
+        action = self.choose_action(opponent)
+        self.perform(action)
+        self.last_action = action
+        if action in FRAME_DATA or action == cfg.ACTION_BLOCK:
+            self.reaction_timer = 0
@@ -1,10 +1,16 @@
 """Core game logic for Vector Karate Champ."""
 
+import os
 import pygame
 import sys
+import time
 from typing import Optional, Tuple
 import config as cfg
-from entities import Fighter, AIFighter
+from entities import Fighter, AIFighter, hit_lands, rects_overlap
+
+# Benchmark settings
+BENCH_FRAMES = 600
+BENCH_SNAPSHOTS = 100000
 
 
 class Game:
@@ -57,32 +63,24 @@ class Game:
                         self.player.block()
 
     def check_collision(self, rect1: Tuple[int, int, int, int], rect2: Tuple[int, int, int, int]) -> bool:
-        x1, y1, w1, h1 = rect1
-        x2, y2, w2, h2 = rect2
-        return not (x1 + w1 < x2 or x2 + w2 < x1 or y1 + h1 < y2 or y2 + h2 < y1)
+        return rects_overlap(rect1, rect2)
 
     def check_hits(self):
         # Check player hitting opponent
-        if self.player.is_attacking():
-            attack_hitbox = self.player.get_attack_hitbox()
-            if attack_hitbox and self.opponent.state != cfg.STATE_BLOCKING:
-                if self.check_collision(attack_hitbox, self.opponent.rect):
-                    damage = self.opponent.take_hit(1)
-                    self.player.score_point()
-                    self.show_message("HIT!", 30)
-                    self.check_round_end()
-                    return
+        if hit_lands(self.player, self.opponent):
+            damage = self.opponent.take_hit(1)
+            self.player.score_point()
+            self.show_message("HIT!", 30)
+            self.check_round_end()
+            return
 
         # Check opponent hitting player
-        if self.opponent.is_attacking():
-            attack_hitbox = self.opponent.get_attack_hitbox()
-            if attack_hitbox and self.player.state != cfg.STATE_BLOCKING:
-                if self.check_collision(attack_hitbox, self.player.rect):
-                    damage = self.player.take_hit(1)
-                    self.opponent.score_point()
-                    self.show_message("OUCH!", 30)
-                    self.check_round_end()
-                    return
+        if hit_lands(self.opponent, self.player):
+            damage = self.player.take_hit(1)
+            self.opponent.score_point()
+            self.show_message("OUCH!", 30)
+            self.check_round_end()
+            return
 
     def check_round_end(self):
         if self.player.score >= cfg.POINTS_TO_WIN:
@@ -108,6 +106,19 @@ class Game:
             self.game_state = "match_end"
             self.show_message("YOU LOSE THE MATCH!", 180)
 
+    def save_state(self) -> tuple:
+        # Match snapshot: both fighters plus round flow, no pygame objects
+        return (self.player.save_state(), self.opponent.save_state(), self.game_state,
+                self.round_winner, self.match_winner, self.round_timer,
+                self.message, self.message_timer)
+
+    def load_state(self, state: tuple):
+        (player_state, opponent_state, self.game_state,
+         self.round_winner, self.match_winner, self.round_timer,
+         self.message, self.message_timer) = state
+        self.player.load_state(player_state)
+        self.opponent.load_state(opponent_state)
+
     def show_message(self, text: str, duration: int):
         self.message = text
         self.message_timer = duration
@@ -247,7 +258,50 @@ class Game:
         sys.exit()
 
 
+def run_benchmark(frames: int = BENCH_FRAMES, snapshots: int = BENCH_SNAPSHOTS):
+    # Time match snapshots and the AI's lookahead against a player that
+    # walks in and throws attacks on a fixed rhythm
+    game = Game()
+
+    start = time.perf_counter()
+    for _ in range(snapshots):
+        game.load_state(game.save_state())
+    snapshot_us = (time.perf_counter() - start) / snapshots * 1e6
+
+    decisions = 0
+    think_total = 0.0
+    worst = 0.0
+    for frame in range(frames):
+        if game.game_state == "playing":
+            if frame % 45 == 0:
+                game.player.attack(cfg.ACTION_ATTACK_HIGH if frame % 90 else cfg.ACTION_ATTACK_LOW)
+            elif game.player.x < game.opponent.x - 90:
+                game.player.move(1)
+            else:
+                game.player.stop_move()
+        elif game.game_state == "match_end":
+            game.reset_match()
+
+        start = time.perf_counter()
+        game.update()
+        elapsed = time.perf_counter() - start
+        think_total += elapsed
+        worst = max(worst, elapsed)
+        decisions += game.opponent.reaction_timer >= cfg.AIReactionTime
+
+    rollouts = len(AIFighter.CANDIDATE_ACTIONS) * len(AIFighter.OPPONENT_REPLIES)
+    print(f"match save+load {snapshot_us:.2f} us")
+    print(f"update avg {think_total / frames * 1000:.3f} ms/frame, worst {worst * 1000:.3f} ms, "
+          f"up to {rollouts} rollouts x {cfg.AILookaheadFrames} frames per decision, "
+          f"{decisions} decision frames, score {game.player.wins}-{game.opponent.wins}")
+    pygame.quit()
+
+
 def main():
+    if "--bench" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        run_benchmark()
+        return
     game = Game()
     game.run()
 
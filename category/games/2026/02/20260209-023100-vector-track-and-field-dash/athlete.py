@@ -2,15 +2,46 @@
 Athlete physics and input handling.
 """
 
+import math
+from collections import deque
 from pygame import K_LEFT, K_RIGHT
 from game_state import State, GameState
 
 
 class Athlete:
-    """Handles athlete movement and input processing."""
+    """Handles athlete movement and input processing.
+
+    Physics runs in fixed State.STEP increments of the race clock. Key
+    presses are queued with the race time they happened at and applied at
+    the first step boundary after it, so a race plays out the same at any
+    frame rate.
+    """
 
     def __init__(self, state: State):
         self.state = state
+        self.pending = deque()
+
+    def queue_input(self, key, at: float):
+        """Queue a key press made `at` seconds into the race."""
+        self.pending.append((at, key))
+
+    def advance_to(self, t: float):
+        """Run fixed steps until the race clock reaches t seconds."""
+        while self.state.clock + self.state.STEP <= t:
+            self.step()
+
+    def step(self):
+        """Apply the presses that are due, then advance one fixed step."""
+        clock = self.state.clock
+        while self.pending and self.pending[0][0] <= clock:
+            self.handle_input(self.pending.popleft()[1])
+
+        self.update(self.state.STEP)
+        self.state.steps += 1
+
+        # Check if stumble is over
+        if self.state.state == GameState.STUMBLE and not self.state.is_stumbling():
+            self.state.state = GameState.RUNNING
 
     def handle_input(self, key):
         """Process keyboard input for acceleration."""
@@ -40,7 +71,7 @@ class Athlete:
         )
 
     def update(self, dt: float):
-        """Update physics for one frame."""
+        """Update physics for one step of dt seconds."""
         if self.state.state != GameState.RUNNING:
             return
 
@@ -48,9 +79,6 @@ class Athlete:
         if self.state.is_stumbling():
             return
 
-        # Apply friction
-        self.state.velocity = max(0, self.state.velocity * (1 - self.state.FRICTION))
-
         # Update stamina
         if self.state.is_sprinting():
             self.state.stamina = max(0, self.state.stamina - self.state.STAMINA_DRAIN_RATE * dt)
@@ -60,13 +88,22 @@ class Athlete:
                 self.state.stamina + self.state.STAMINA_RECOVERY_RATE * dt
             )
 
-        # Move athlete
-        pixels_per_meter = 7.5
-        self.state.distance += self.state.velocity * dt
-        self.state.time_elapsed += dt
+        # Move athlete, integrating the friction decay exactly over the step
+        rate = self.state.FRICTION_RATE
+        velocity = self.state.velocity
+        travel = velocity * (1 - math.exp(-rate * dt)) / rate
+        remaining = self.state.TARGET_DISTANCE - self.state.distance
 
-        # Check finish
-        if self.state.distance >= self.state.TARGET_DISTANCE:
+        # Check finish, timed at the exact crossing within the step
+        if travel >= remaining:
+            crossing = -math.log(1 - remaining * rate / velocity) / rate
+            self.state.velocity = velocity * math.exp(-rate * crossing)
             self.state.state = GameState.FINISHED
-            self.state.finish_time = self.state.time_elapsed
+            self.state.finish_time = self.state.time_elapsed + crossing
+            self.state.time_elapsed = self.state.finish_time
             self.state.distance = self.state.TARGET_DISTANCE
+            return
+
+        self.state.velocity = velocity * math.exp(-rate * dt)
+        self.state.distance += travel
+        self.state.time_elapsed += dt
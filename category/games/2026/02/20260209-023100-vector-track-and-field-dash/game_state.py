@@ -4,7 +4,7 @@ Game state management for Track and Field Dash.
 
 from enum import Enum
 from dataclasses import dataclass
-import time
+import math
 
 
 class GameState(Enum):
@@ -27,23 +27,33 @@ class State:
     state: GameState = GameState.MENU
     stumble_start: float = 0.0
     stumble_duration: float = 1.5
+    steps: int = 0
 
     TARGET_DISTANCE = 100.0
     MAX_VELOCITY = 12.0
     VELOCITY_INCREMENT = 0.8
+    # Velocity lost per 1/60 s, applied as a continuous exponential decay
     FRICTION = 0.02
+    FRICTION_RATE = -math.log(1 - FRICTION) * 60
+    # Fixed physics step in seconds
+    STEP = 1.0 / 120.0
     STUMBLE_VELOCITY_PENALTY = 3.0
     STAMINA_DRAIN_RATE = 15.0
     STAMINA_RECOVERY_RATE = 8.0
     STAMINA_THRESHOLD = 0.9
 
+    @property
+    def clock(self) -> float:
+        """Race time in seconds, counted in fixed steps since the start."""
+        return self.steps * self.STEP
+
     def is_stumbling(self) -> bool:
         return (self.state == GameState.STUMBLE and
-                time.time() - self.stumble_start < self.stumble_duration)
+                self.clock - self.stumble_start < self.stumble_duration)
 
     def trigger_stumble(self):
         self.state = GameState.STUMBLE
-        self.stumble_start = time.time()
+        self.stumble_start = self.clock
         self.velocity = max(0, self.velocity - self.STUMBLE_VELOCITY_PENALTY)
 
     def reset(self):
@@ -54,6 +64,7 @@ class State:
         self.time_elapsed = 0.0
         self.finish_time = None
         self.state = GameState.MENU
+        self.steps = 0
 
     def calculate_score(self) -> int:
         if self.finish_time is None or self.finish_time <= 0:
@@ -12,6 +12,11 @@ from athlete import Athlete
 from renderer import Renderer
 
 
+def event_time(event) -> int:
+    """SDL timestamp of an event in ms, or the current ticks if it has none."""
+    return getattr(event, "timestamp", None) or pygame.time.get_ticks()
+
+
 def main():
     """Main game loop."""
     pygame.init()
@@ -26,10 +31,11 @@ def main():
     state = State()
     athlete = Athlete(state)
     renderer = Renderer(screen)
+    race_start = 0  # Ticks in ms when the current race started
 
     running = True
     while running:
-        dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
+        clock.tick(FPS)
 
         # Event handling
         for event in pygame.event.get():
@@ -41,21 +47,18 @@ def main():
                     running = False
 
                 elif event.key == pygame.K_SPACE:
-                    if state.state == GameState.MENU:
-                        state.state = GameState.RUNNING
-                    elif state.state == GameState.FINISHED:
+                    if state.state in (GameState.MENU, GameState.FINISHED):
                         state.reset()
+                        athlete.pending.clear()
                         state.state = GameState.RUNNING
+                        race_start = event_time(event)
 
-                elif state.state == GameState.RUNNING:
-                    athlete.handle_input(event.key)
+                elif state.state in (GameState.RUNNING, GameState.STUMBLE):
+                    athlete.queue_input(event.key, (event_time(event) - race_start) / 1000.0)
 
-        # Update game state
-        athlete.update(dt)
-
-        # Check if stumble is over
-        if state.state == GameState.STUMBLE and not state.is_stumbling():
-            state.state = GameState.RUNNING
+        # Catch the fixed-step simulation up with real time
+        if state.state in (GameState.RUNNING, GameState.STUMBLE):
+            athlete.advance_to((pygame.time.get_ticks() - race_start) / 1000.0)
 
         # Render
         renderer.draw_background()
@@ -0,0 +1,91 @@
+"""
+Headless replay of recorded key presses for Track and Field Dash.
+
+Feeds the same press timings through the fixed-step simulation at several
+frame rates and checks that every run finishes in the same time.
+
+Usage: python replay.py [presses.json]
+
+The file holds a list of [seconds, "LEFT" | "RIGHT"] pairs measured from the
+start of the race. Without one, a seeded button-mashing run is generated.
+"""
+
+import json
+import os
+import random
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from pygame import K_LEFT, K_RIGHT
+from game_state import State, GameState
+from athlete import Athlete
+
+KEYS = {"LEFT": K_LEFT, "RIGHT": K_RIGHT}
+FRAME_RATES = (24, 30, 60, 75, 144, 240)
+# Give up on a replay that has not finished after this many seconds
+TIME_LIMIT = 120.0
+
+
+def generate_presses(seed: int = 0, duration: float = 40.0) -> list:
+    """Mash alternating keys at a varying rhythm, doubling a key now and then."""
+    rng = random.Random(seed)
+    presses = []
+    key = "LEFT"
+    t = 0.0
+    while t < duration:
+        t += rng.uniform(0.04, 0.14)
+        if rng.random() > 0.03:
+            key = "RIGHT" if key == "LEFT" else "LEFT"
+        presses.append([round(t, 3), key])
+    return presses
+
+
+def run_replay(presses: list, fps: float, jitter: float = 0.0, seed: int = 0) -> State:
+    """Play presses back the way a game drawing at fps would deliver them.
+
+    Each frame drains the presses made since the previous one and then
+    catches the simulation up to the frame's time. With jitter, frame
+    lengths vary randomly by up to that fraction.
+    """
+    rng = random.Random(seed)
+    state = State()
+    state.state = GameState.RUNNING
+    athlete = Athlete(state)
+
+    now = 0.0
+    index = 0
+    while state.state != GameState.FINISHED and now < TIME_LIMIT:
+        now += (1.0 / fps) * (1 + rng.uniform(-jitter, jitter))
+        while index < len(presses) and presses[index][0] <= now:
+            at, key = presses[index]
+            athlete.queue_input(KEYS[key], at)
+            index += 1
+        athlete.advance_to(now)
+    return state
+
+
+def main():
+    """Replay at every frame rate and report whether finish times agree."""
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as f:
+            presses = json.load(f)
+    else:
+        presses = generate_presses()
+
+    runs = [(f"{fps} fps", run_replay(presses, fps)) for fps in FRAME_RATES]
+    runs.append(("60 fps, jittered", run_replay(presses, 60, jitter=0.5)))
+
+    for label, state in runs:
+        finish = f"{state.finish_time:.6f}s" if state.finish_time is not None else "did not finish"
+        print(f"{label:18s} {finish}  score {state.calculate_score()}")
+
+    finish_times = {state.finish_time for _, state in runs}
+    if len(finish_times) != 1:
+        print("Finish times differ across frame rates")
+        sys.exit(1)
+    print(f"Identical across {len(runs)} runs of {len(presses)} presses")
+
+
+if __name__ == "__main__":
+    main()
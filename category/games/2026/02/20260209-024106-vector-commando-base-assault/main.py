@@ -1,5 +1,8 @@
 """Vector Commando: Base Assault - A top-down tactical shooter game."""
 
+import os
+import sys
+import time
 import pygame
 import random
 import math
@@ -14,6 +17,16 @@ FPS = 60
 PLAYER_SPEED = 5
 BULLET_SPEED = 10
 SCROLL_SPEED = 1
+LEVEL_LENGTH = 3000
+
+# Level streaming: entities are bucketed by world y, and only those within
+# ACTIVE_MARGIN of the screen are updated and collided
+SECTOR_HEIGHT = 200
+ACTIVE_MARGIN = 100
+
+# Stress test settings
+STRESS_LEVEL_LENGTHS = (LEVEL_LENGTH, 100 * LEVEL_LENGTH)
+STRESS_FRAMES = 400
 
 # Colors
 COLOR_BG = (34, 139, 34)  # Forest green
@@ -77,7 +90,7 @@ class Player(Entity):
         self.invincible_frames = 0
         self.facing = Direction.UP
 
-    def update(self, keys, obstacles):
+    def update(self, keys, obstacles, scroll_offset: float = 0):
         """Update player state based on input."""
         if not self.alive:
             return
@@ -125,7 +138,7 @@ class Player(Entity):
         new_y = max(0, min(SCREEN_HEIGHT - self.height, new_y))
 
         # Check collision with obstacles
-        temp_rect = pygame.Rect(int(new_x), int(new_y), self.width, self.height)
+        temp_rect = pygame.Rect(int(new_x), int(new_y + scroll_offset), self.width, self.height)
         blocked = False
         for obstacle in obstacles:
             if obstacle.blocking and temp_rect.colliderect(obstacle.get_rect()):
@@ -144,26 +157,26 @@ class Player(Entity):
         """Check if player can throw grenade."""
         return self.grenade_cooldown == 0
 
-    def shoot(self) -> 'Bullet':
+    def shoot(self, scroll_offset: float = 0) -> 'Bullet':
         """Fire a bullet in facing direction."""
         self.shoot_cooldown = 15
         dx, dy = self.facing.value
         return Bullet(
             self.x + self.width / 2 + dx * 15,
-            self.y + self.height / 2 + dy * 15,
+            self.y + self.height / 2 + dy * 15 + scroll_offset,
             dx * BULLET_SPEED,
             dy * BULLET_SPEED,
             COLOR_BULLET,
             is_player_bullet=True
         )
 
-    def throw_grenade(self) -> 'Grenade':
+    def throw_grenade(self, scroll_offset: float = 0) -> 'Grenade':
         """Throw a grenade in facing direction."""
         self.grenade_cooldown = 60
         dx, dy = self.facing.value
         return Grenade(
             self.x + self.width / 2 + dx * 15,
-            self.y + self.height / 2 + dy * 15,
+            self.y + self.height / 2 + dy * 15 + scroll_offset,
             dx * BULLET_SPEED * 0.8,
             dy * BULLET_SPEED * 0.8
         )
@@ -205,14 +218,15 @@ class Bullet(Entity):
         self.dy = dy
         self.is_player_bullet = is_player_bullet
 
-    def update(self):
+    def update(self, scroll_offset: float = 0):
         """Update bullet position."""
         self.x += self.dx
         self.y += self.dy
 
         # Remove if off screen
+        screen_y = self.y - scroll_offset
         if (self.x < -50 or self.x > SCREEN_WIDTH + 50 or
-                self.y < -50 or self.y > SCREEN_HEIGHT + 50):
+                screen_y < -50 or screen_y > SCREEN_HEIGHT + 50):
             self.alive = False
 
     def draw(self, surface: pygame.Surface):
@@ -270,24 +284,22 @@ class Enemy(Entity):
         super().__init__(x, y, width, height, color)
         self.shoot_timer = random.randint(60, 180)
 
-    def update(self, player: Player):
-        """Update enemy behavior."""
+    def update(self, target: tuple):
+        """Update enemy behavior; target is the player's center in world space."""
         self.shoot_timer -= 1
 
     def can_shoot(self) -> bool:
         """Check if enemy can shoot."""
         return self.shoot_timer <= 0
 
-    def shoot_at(self, player: Player) -> Bullet:
-        """Fire at player."""
+    def shoot_at(self, target: tuple) -> Bullet:
+        """Fire at the target point."""
         self.shoot_timer = random.randint(90, 200)
         center_x = self.x + self.width / 2
         center_y = self.y + self.height / 2
-        player_center_x = player.x + player.width / 2
-        player_center_y = player.y + player.height / 2
 
-        dx = player_center_x - center_x
-        dy = player_center_y - center_y
+        dx = target[0] - center_x
+        dy = target[1] - center_y
         length = math.sqrt(dx * dx + dy * dy)
         if length > 0:
             dx /= length
@@ -310,17 +322,15 @@ class Infantry(Enemy):
         super().__init__(x, y, 18, 18, COLOR_ENEMY_INFANTRY)
         self.speed = 1.5
 
-    def update(self, player: Player):
+    def update(self, target: tuple):
         """Move toward player."""
-        super().update(player)
+        super().update(target)
 
         center_x = self.x + self.width / 2
         center_y = self.y + self.height / 2
-        player_center_x = player.x + player.width / 2
-        player_center_y = player.y + player.height / 2
 
-        dx = player_center_x - center_x
-        dy = player_center_y - center_y
+        dx = target[0] - center_x
+        dy = target[1] - center_y
         length = math.sqrt(dx * dx + dy * dy)
         if length > 0:
             self.x += (dx / length) * self.speed
@@ -380,6 +390,62 @@ class Flag(Entity):
         pygame.draw.polygon(surface, self.color, points)
 
 
+class SectorIndex:
+    """Entities bucketed into horizontal sectors of world y.
+
+    Sectors are stored in y order, so everything inside a band of the level
+    is found by walking a few adjacent buckets. Entities outside the band are
+    never visited and sleep until the camera scrolls them in.
+    """
+
+    def __init__(self, level_length: int, sector_height: int = SECTOR_HEIGHT):
+        self.sector_height = sector_height
+        self.sectors = [[] for _ in range(level_length // sector_height + 2)]
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def sector_of(self, y: float) -> int:
+        """Bucket number for a world y, clamped to the level."""
+        return max(0, min(len(self.sectors) - 1, int(y // self.sector_height)))
+
+    def insert(self, entity: Entity):
+        """Add an entity to the bucket for its current y."""
+        entity.sector = self.sector_of(entity.y)
+        self.sectors[entity.sector].append(entity)
+        self.count += 1
+
+    def query(self, top: float, bottom: float) -> list:
+        """Entities with top < y < bottom."""
+        found = []
+        for i in range(self.sector_of(top), self.sector_of(bottom) + 1):
+            for entity in self.sectors[i]:
+                if top < entity.y < bottom:
+                    found.append(entity)
+        return found
+
+    def refresh(self, top: float, bottom: float):
+        """Drop dead entities and re-bucket moved ones in the sectors covering a band."""
+        moved = []
+        for i in range(self.sector_of(top), self.sector_of(bottom) + 1):
+            sector = self.sectors[i]
+            kept = []
+            for entity in sector:
+                if not entity.alive:
+                    self.count -= 1
+                elif self.sector_of(entity.y) != i:
+                    moved.append(entity)
+                else:
+                    kept.append(entity)
+            if len(kept) != len(sector):
+                self.sectors[i] = kept
+
+        for entity in moved:
+            entity.sector = self.sector_of(entity.y)
+            self.sectors[entity.sector].append(entity)
+
+
 class Game:
     """Main game controller."""
 
@@ -393,16 +459,16 @@ class Game:
 
         self.reset_game()
 
-    def reset_game(self):
+    def reset_game(self, level_length: int = LEVEL_LENGTH):
         """Reset all game state."""
         self.player = Player(SCREEN_WIDTH // 2 - 10, SCREEN_HEIGHT - 100)
         self.bullets = []
         self.grenades = []
-        self.enemies = []
-        self.obstacles = []
+        self.enemies = SectorIndex(level_length)
+        self.obstacles = SectorIndex(level_length)
         self.flags = []
         self.scroll_offset = 0
-        self.level_length = 3000
+        self.level_length = level_length
         self.game_over = False
         self.victory = False
         self.wave = 1
@@ -417,7 +483,7 @@ class Game:
             if random.random() < 0.3:
                 river_width = random.randint(100, 200)
                 river_x = random.randint(50, SCREEN_WIDTH - 50 - river_width)
-                self.obstacles.append(
+                self.obstacles.insert(
                     Obstacle(river_x, y, river_width, 40, COLOR_RIVER, blocking=True)
                 )
 
@@ -426,7 +492,7 @@ class Game:
                 for i in range(random.randint(2, 4)):
                     bag_x = random.randint(50, SCREEN_WIDTH - 100)
                     bag_y = y + random.randint(-30, 30)
-                    self.obstacles.append(
+                    self.obstacles.insert(
                         Obstacle(bag_x, bag_y, 60, 15, COLOR_SANDBAG, blocking=False)
                     )
 
@@ -435,12 +501,12 @@ class Game:
             # Infantry group
             for _ in range(random.randint(2, 4)):
                 ex = random.randint(50, SCREEN_WIDTH - 70)
-                self.enemies.append(Infantry(ex, y))
+                self.enemies.insert(Infantry(ex, y))
 
             # Turrets
             if random.random() < 0.5:
                 tx = random.choice([100, SCREEN_WIDTH - 150])
-                self.enemies.append(Turret(tx, y + 50))
+                self.enemies.insert(Turret(tx, y + 50))
 
         # Place flag at end
         self.flags.append(Flag(SCREEN_WIDTH // 2 - 15, self.level_length - 100))
@@ -452,7 +518,7 @@ class Game:
             if spawn_y < self.level_length - 200:
                 enemy_type = random.choice([Infantry, Turret])
                 ex = random.randint(50, SCREEN_WIDTH - 70)
-                self.enemies.append(enemy_type(ex, spawn_y))
+                self.enemies.insert(enemy_type(ex, spawn_y))
 
     def handle_input(self):
         """Process keyboard input."""
@@ -470,23 +536,27 @@ class Game:
                         return False
                 else:
                     if event.key == pygame.K_z and self.player.can_shoot():
-                        self.bullets.append(self.player.shoot())
+                        self.bullets.append(self.player.shoot(self.scroll_offset))
                     elif event.key == pygame.K_x and self.player.can_throw_grenade():
-                        self.grenades.append(self.player.throw_grenade())
+                        self.grenades.append(self.player.throw_grenade(self.scroll_offset))
 
         if not self.game_over and not self.victory:
-            self.player.update(keys, self.get_visible_obstacles())
+            self.player.update(keys, self.get_visible_obstacles(), self.scroll_offset)
 
         return True
 
+    def active_band(self) -> tuple:
+        """World y range around the screen in which entities are awake."""
+        return (self.scroll_offset - ACTIVE_MARGIN,
+                self.scroll_offset + SCREEN_HEIGHT + ACTIVE_MARGIN)
+
     def get_visible_obstacles(self):
         """Get obstacles currently on screen."""
-        visible = []
-        for obs in self.obstacles:
-            screen_y = obs.y - self.scroll_offset
-            if -100 < screen_y < SCREEN_HEIGHT + 100:
-                visible.append(obs)
-        return visible
+        return self.obstacles.query(*self.active_band())
+
+    def player_world_rect(self) -> pygame.Rect:
+        """Player collision rectangle in world space."""
+        return self.player.get_rect().move(0, int(self.scroll_offset))
 
     def update(self):
         """Update all game objects."""
@@ -504,63 +574,60 @@ class Game:
 
         # Update bullets
         for bullet in self.bullets:
-            bullet.update()
+            bullet.update(self.scroll_offset)
 
         # Update grenades
         for grenade in self.grenades:
             grenade.update()
 
-        # Update enemies (only those on screen)
-        visible_enemies = []
-        for enemy in self.enemies:
-            screen_y = enemy.y - self.scroll_offset
-            if -100 < screen_y < SCREEN_HEIGHT + 100:
-                enemy.update(self.player)
-                visible_enemies.append(enemy)
-            elif screen_y >= SCREEN_HEIGHT + 100:
-                visible_enemies.append(enemy)  # Keep off-screen but ahead
+        # Wake the enemies in the band around the screen; the rest sleep
+        band = self.active_band()
+        active_enemies = self.enemies.query(*band)
+        target = (self.player.x + self.player.width / 2,
+                  self.player.y + self.player.height / 2 + self.scroll_offset)
+        for enemy in active_enemies:
+            enemy.update(target)
 
         # Enemy shooting
-        for enemy in visible_enemies:
+        for enemy in active_enemies:
             screen_y = enemy.y - self.scroll_offset
             if 0 < screen_y < SCREEN_HEIGHT and enemy.can_shoot():
-                self.bullets.append(enemy.shoot_at(self.player))
+                self.bullets.append(enemy.shoot_at(target))
 
         # Update flags
         for flag in self.flags:
             flag.update()
 
         # Check collisions
-        self.check_collisions()
+        self.check_collisions(active_enemies)
 
         # Remove dead entities
         self.bullets = [b for b in self.bullets if b.alive]
         self.grenades = [g for g in self.grenades if g.alive]
-        self.enemies = [e for e in self.enemies if e.alive]
+        self.enemies.refresh(*band)
 
         # Check game state
         if not self.player.alive:
             self.game_over = True
 
         # Check victory
+        player_rect = self.player_world_rect()
         for flag in self.flags:
-            if not flag.captured:
-                screen_y = flag.y - self.scroll_offset
-                if screen_y < SCREEN_HEIGHT and self.player.collides_with(flag):
-                    flag.captured = True
-                    self.player.score += 500
+            if not flag.captured and player_rect.colliderect(flag.get_rect()):
+                flag.captured = True
+                self.player.score += 500
 
         if all(flag.captured for flag in self.flags):
             self.victory = True
 
-    def check_collisions(self):
-        """Handle all collision detection."""
+    def check_collisions(self, active_enemies):
+        """Handle all collision detection against the awake enemies."""
         # Player bullets vs enemies
         for bullet in self.bullets:
             if not bullet.is_player_bullet:
                 continue
 
-            for enemy in self.enemies:
+            for enemy in active_enemies:
                 if enemy.alive and bullet.collides_with(enemy):
                     enemy.alive = False
                     bullet.alive = False
@@ -568,12 +635,12 @@ class Game:
                     break
 
         # Enemy bullets vs player
+        player_rect = self.player_world_rect()
         for bullet in self.bullets:
             if bullet.is_player_bullet:
                 continue
 
-            screen_y = bullet.y - self.scroll_offset
-            if 0 < screen_y < SCREEN_HEIGHT and bullet.collides_with(self.player):
+            if player_rect.colliderect(bullet.get_rect()):
                 bullet.alive = False
                 self.player.take_damage()
 
@@ -581,17 +648,15 @@ class Game:
         for grenade in self.grenades:
             if grenade.exploded:
                 explosion_rect = grenade.get_explosion_rect()
-                for enemy in self.enemies:
-                    enemy_screen_rect = enemy.get_rect()
-                    enemy_screen_rect.y -= self.scroll_offset
-                    if explosion_rect.colliderect(enemy_screen_rect):
+                for enemy in active_enemies:
+                    if enemy.alive and explosion_rect.colliderect(enemy.get_rect()):
                         enemy.alive = False
                         self.player.score += 100
 
         # Player vs enemies (contact damage)
-        for enemy in self.enemies:
+        for enemy in active_enemies:
             screen_y = enemy.y - self.scroll_offset
-            if 0 < screen_y < SCREEN_HEIGHT and enemy.collides_with(self.player):
+            if enemy.alive and 0 < screen_y < SCREEN_HEIGHT and player_rect.colliderect(enemy.get_rect()):
                 self.player.take_damage()
 
     def draw(self):
@@ -599,12 +664,10 @@ class Game:
         self.screen.fill(COLOR_BG)
 
         # Draw obstacles
-        for obs in self.obstacles:
-            screen_y = obs.y - self.scroll_offset
-            if -100 < screen_y < SCREEN_HEIGHT + 100:
-                draw_rect = obs.get_rect()
-                draw_rect.y = screen_y
-                pygame.draw.rect(self.screen, obs.color, draw_rect)
+        for obs in self.get_visible_obstacles():
+            draw_rect = obs.get_rect()
+            draw_rect.y = obs.y - self.scroll_offset
+            pygame.draw.rect(self.screen, obs.color, draw_rect)
 
         # Draw flags
         for flag in self.flags:
@@ -629,12 +692,10 @@ class Game:
                     pygame.draw.polygon(self.screen, flag.color, points)
 
         # Draw enemies
-        for enemy in self.enemies:
-            screen_y = enemy.y - self.scroll_offset
-            if -50 < screen_y < SCREEN_HEIGHT + 50:
-                draw_rect = enemy.get_rect()
-                draw_rect.y = screen_y
-                pygame.draw.rect(self.screen, enemy.color, draw_rect)
+        for enemy in self.enemies.query(self.scroll_offset - 50, self.scroll_offset + SCREEN_HEIGHT + 50):
+            draw_rect = enemy.get_rect()
+            draw_rect.y = enemy.y - self.scroll_offset
+            pygame.draw.rect(self.screen, enemy.color, draw_rect)
 
         # Draw player
         self.player.draw(self.screen)
@@ -750,8 +811,43 @@ class Game:
         pygame.quit()
 
 
+def run_stress_test(level_lengths=STRESS_LEVEL_LENGTHS, frames: int = STRESS_FRAMES) -> None:
+    """Time update() while advancing through levels of very different length."""
+    game = Game()
+    for level_length in level_lengths:
+        random.seed(0)
+        game.reset_game(level_length)
+        start_count = len(game.enemies)
+
+        total = 0.0
+        worst = 0.0
+        for frame in range(frames):
+            # Keep the player alive, advancing and firing
+            game.player.invincible_frames = 1
+            game.player.y -= PLAYER_SPEED
+            if frame % 8 == 0:
+                game.bullets.append(game.player.shoot(game.scroll_offset))
+            if frame % 60 == 0:
+                game.grenades.append(game.player.throw_grenade(game.scroll_offset))
+
+            start = time.perf_counter()
+            game.update()
+            elapsed = time.perf_counter() - start
+            total += elapsed
+            worst = max(worst, elapsed)
+
+        avg_ms = total / frames * 1000
+        print(f"level {level_length}: {start_count} enemies, score {game.player.score}, "
+              f"update avg {avg_ms:.3f} ms/frame, worst {worst * 1000:.3f} ms")
+    pygame.quit()
+
+
 def main():
     """Entry point for the game."""
+    if "--stress" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        run_stress_test()
+        return
     game = Game()
     game.run()
 
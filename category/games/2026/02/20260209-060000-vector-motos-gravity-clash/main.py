@@ -3,6 +3,8 @@ import math
 import random
 from typing import List, Tuple, Optional
 
+from particles import ParticleSystem
+
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -24,6 +26,7 @@ COLOR_ENEMY_HEAVY = (255, 150, 50)
 COLOR_ENEMY_FAST = (255, 100, 255)
 COLOR_TEXT = (220, 220, 220)
 COLOR_PARTICLE = (255, 255, 150)
+PARTICLE_CAPACITY = 4096
 
 
 class Vector:
@@ -61,34 +64,6 @@ class Vector:
         return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
 
 
-class Particle:
-    """Visual particle effect."""
-
-    def __init__(self, x: float, y: float, vx: float, vy: float, lifetime: int):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = random.randint(2, 5)
-
-    def update(self) -> bool:
-        self.x += self.vx
-        self.y += self.vy
-        self.vx *= 0.95
-        self.vy *= 0.95
-        self.lifetime -= 1
-        return self.lifetime > 0
-
-    def draw(self, surface):
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color = (*COLOR_PARTICLE, alpha)
-        s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(s, color, (self.size, self.size), self.size)
-        surface.blit(s, (int(self.x) - self.size, int(self.y) - self.size))
-
-
 class Unit:
     """Base class for all game units."""
 
@@ -307,7 +282,7 @@ class Game:
         self.level = 1
         self.lives = 3
         self.time_bonus = 1000
-        self.particles: List[Particle] = []
+        self.particles = ParticleSystem(PARTICLE_CAPACITY, drag=0.95)
         self.setup_level()
 
     def setup_level(self):
@@ -389,13 +364,7 @@ class Game:
                     self.create_particles(collision_point.x, collision_point.y, 5)
 
     def create_particles(self, x: float, y: float, count: int):
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(1, 4)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            lifetime = random.randint(20, 40)
-            self.particles.append(Particle(x, y, vx, vy, lifetime))
+        self.particles.emit(x, y, count, [COLOR_PARTICLE], life=(20, 40), size=(2, 5), speed=(1, 4))
 
     def update(self):
         if self.state != "playing":
@@ -441,7 +410,7 @@ class Game:
             self.enemies.remove(enemy)
 
         # Update particles
-        self.particles = [p for p in self.particles if p.update()]
+        self.particles.update()
 
         # Update time bonus
         self.time_bonus -= 1
@@ -501,8 +470,7 @@ class Game:
         self.arena.draw(self.screen, len(self.particles) > 0)
 
         # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        self.particles.draw(self.screen)
 
         # Draw enemies
         for enemy in self.enemies:
@@ -4,10 +4,13 @@ Vector Frenzy: Fruit Ninja Lite
 A simplified 2D physics-based slicing game. Slice falling fruits while avoiding bombs.
 """
 
+import os
+import sys
+import time
 import pygame
 import random
 import math
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 # Constants
 SCREEN_WIDTH = 800
@@ -38,24 +41,99 @@ BOMB_RADIUS = 35
 GRAVITY = 0.15
 SLICE_THRESHOLD = 0.02  # Minimum speed to count as a slice
 
+# Slice trail
+TRAIL_CAPACITY = 256  # Ring buffer size; oldest points are overwritten
+TRAIL_DECAY = 0.05  # Life lost per frame
+TRAIL_WIDTH = 3
+
+# Benchmark settings
+BENCH_FRUIT_COUNT = 300
+BENCH_FRAMES = 600
+BENCH_SEGMENTS_PER_FRAME = 16  # Simulates a ~1000 Hz mouse
+
+# Unit semicircle outline (y up, like pygame.draw.arc) for drawing fruit halves
+HALF_ARC_STEPS = 12
+HALF_ARC = [(math.cos(math.pi * i / HALF_ARC_STEPS), -math.sin(math.pi * i / HALF_ARC_STEPS))
+            for i in range(HALF_ARC_STEPS + 1)]
+
+# Sprite caches
+SPRITE_COLORKEY = (255, 0, 255)  # Never used as a game color
+PARTICLE_ALPHA_STEPS = 16  # Fade levels pre-rendered per particle sprite
+HALF_ROTATION_STEP = 5  # Degrees a fruit half turns per frame
+
 # Scoring
 FRUIT_SCORE = 10
 MISS_PENALTY = -5
 BOMB_PENALTY = "Game Over"
 
 
-class TrailPoint:
-    """A point in the slice trail."""
+class SliceTrail:
+    """Fixed-size ring buffer of slice trail points.
+
+    Every point decays at the same rate, so the oldest points always expire
+    first and dead points are dropped by advancing the start index. A point
+    that is not connected starts a new stroke.
+    """
+
+    def __init__(self, capacity: int = TRAIL_CAPACITY):
+        self.capacity = capacity
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.life = [0.0] * capacity
+        self.connected = [False] * capacity
+        self.start = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        """Drop all points."""
+        self.start = 0
+        self.count = 0
+
+    def push(self, x: float, y: float, connected: bool = True) -> None:
+        """Add a point, overwriting the oldest one when full."""
+        if self.count == self.capacity:
+            idx = self.start
+            self.start = (self.start + 1) % self.capacity
+        else:
+            idx = (self.start + self.count) % self.capacity
+            self.count += 1
+        self.xs[idx] = x
+        self.ys[idx] = y
+        self.life[idx] = 1.0
+        self.connected[idx] = connected
+
+    def last(self) -> Optional[Tuple[float, float]]:
+        """Get the newest point, or None if empty."""
+        if self.count == 0:
+            return None
+        idx = (self.start + self.count - 1) % self.capacity
+        return self.xs[idx], self.ys[idx]
 
-    def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
-        self.life = 1.0  # Life from 1.0 to 0.0
+    def update(self) -> None:
+        """Age all points and drop the expired ones."""
+        cap = self.capacity
+        life = self.life
+        for i in range(self.count):
+            life[(self.start + i) % cap] -= TRAIL_DECAY
+        while self.count and life[self.start] <= 0:
+            self.start = (self.start + 1) % cap
+            self.count -= 1
 
-    def update(self) -> bool:
-        """Update trail point life. Returns False when dead."""
-        self.life -= 0.05
-        return self.life > 0
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw each stroke as line segments fading with age."""
+        cap = self.capacity
+        prev = self.start
+        for i in range(1, self.count):
+            idx = (self.start + i) % cap
+            if self.connected[idx]:
+                fade = self.life[idx] * 0.6
+                color = tuple(int(c * fade) for c in SLICE_TRAIL_COLOR)
+                pygame.draw.line(surface, color, (self.xs[prev], self.ys[prev]),
+                                 (self.xs[idx], self.ys[idx]), TRAIL_WIDTH)
+            prev = idx
 
 
 class GameObject:
@@ -93,6 +171,19 @@ class GameObject:
         dy = self.y - py
         return dx * dx + dy * dy <= self.radius * self.radius
 
+    def intersects_segment(self, x1: float, y1: float, x2: float, y2: float) -> bool:
+        """Check if the segment from (x1, y1) to (x2, y2) passes through this object."""
+        sx = x2 - x1
+        sy = y2 - y1
+        length_sq = sx * sx + sy * sy
+        if length_sq == 0:
+            return self.contains_point(x1, y1)
+
+        # Closest point on the segment to the center
+        t = ((self.x - x1) * sx + (self.y - y1) * sy) / length_sq
+        t = max(0.0, min(1.0, t))
+        return self.contains_point(x1 + sx * t, y1 + sy * t)
+
 
 class Fruit(GameObject):
     """A sliceable fruit."""
@@ -103,8 +194,7 @@ class Fruit(GameObject):
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the fruit with a simple outline."""
-        pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
-        pygame.draw.circle(surface, (255, 255, 255), (int(self.x), int(self.y)), self.radius, 2)
+        surface.blit(fruit_sprite(self.color), (int(self.x) - FRUIT_RADIUS, int(self.y) - FRUIT_RADIUS))
 
     def slice(self) -> Tuple['FruitHalf', 'FruitHalf']:
         """Slice the fruit into two halves."""
@@ -139,25 +229,13 @@ class FruitHalf(GameObject):
         self.rotation = 0
 
     def update(self) -> bool:
-        self.rotation += self.direction * 5
+        self.rotation = (self.rotation + self.direction * HALF_ROTATION_STEP) % 360
         return super().update()
 
     def draw(self, surface: pygame.Surface) -> None:
-        """Draw the half fruit."""
-        # Draw a semicircle
-        rect = pygame.Rect(
-            int(self.x - self.radius),
-            int(self.y - self.radius),
-            int(self.radius * 2),
-            int(self.radius * 2)
-        )
-
-        start_angle = self.rotation
-        end_angle = self.rotation + 180
-
-        pygame.draw.arc(surface, self.color, rect, math.radians(start_angle), math.radians(end_angle), int(self.radius))
-        # Draw outline
-        pygame.draw.arc(surface, (255, 255, 255), rect, math.radians(start_angle), math.radians(end_angle), 2)
+        """Draw the half fruit from the sprite for its color and rotation."""
+        image, center = half_sprite(self.color, self.rotation)
+        surface.blit(image, (int(self.x) - center, int(self.y) - center))
 
 
 class Bomb(GameObject):
@@ -195,6 +273,65 @@ class Bomb(GameObject):
         pygame.draw.circle(surface, BOMB_SPIKE_COLOR, (int(self.x), int(self.y)), 6)
 
 
+_particle_sprites: Dict[Tuple[Tuple[int, int, int], int], List[pygame.Surface]] = {}
+_fruit_sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+_half_sprites: Dict[Tuple[Tuple[int, int, int], int], Tuple[pygame.Surface, int]] = {}
+
+
+def colorkey_surface(size: int) -> pygame.Surface:
+    """Blank square sprite with a colorkey background."""
+    image = pygame.Surface((size, size))
+    image.fill(SPRITE_COLORKEY)
+    image.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+    return image
+
+
+def particle_sprites(color: Tuple[int, int, int], radius: int) -> List[pygame.Surface]:
+    """Particle dot of one color and radius at every fade level, faintest first."""
+    key = (color, radius)
+    frames = _particle_sprites.get(key)
+    if frames is None:
+        frames = []
+        for step in range(PARTICLE_ALPHA_STEPS + 1):
+            image = colorkey_surface(radius * 2)
+            pygame.draw.circle(image, color, (radius, radius), radius)
+            image.set_alpha((step + 1) * 255 // (PARTICLE_ALPHA_STEPS + 1))
+            frames.append(image)
+        _particle_sprites[key] = frames
+    return frames
+
+
+def fruit_sprite(color: Tuple[int, int, int]) -> pygame.Surface:
+    """Whole fruit with its outline, rendered on first use."""
+    image = _fruit_sprites.get(color)
+    if image is None:
+        image = colorkey_surface(FRUIT_RADIUS * 2 + 1)
+        pygame.draw.circle(image, color, (FRUIT_RADIUS, FRUIT_RADIUS), FRUIT_RADIUS)
+        pygame.draw.circle(image, (255, 255, 255), (FRUIT_RADIUS, FRUIT_RADIUS), FRUIT_RADIUS, 2)
+        _fruit_sprites[color] = image
+    return image
+
+
+def half_sprite(color: Tuple[int, int, int], rotation: int) -> Tuple[pygame.Surface, int]:
+    """Fruit half outline at one rotation and its center offset, rendered on first use."""
+    key = (color, rotation)
+    entry = _half_sprites.get(key)
+    if entry is None:
+        radius = FRUIT_RADIUS * 0.7
+        center = int(radius) + 2  # Room for the outline
+        angle = math.radians(rotation)
+        cos_a = math.cos(angle) * radius
+        sin_a = math.sin(angle) * radius
+        points = [(center + ux * cos_a + uy * sin_a, center - ux * sin_a + uy * cos_a)
+                  for ux, uy in HALF_ARC]
+
+        image = colorkey_surface(center * 2 + 1)
+        pygame.draw.polygon(image, color, points)
+        pygame.draw.lines(image, (255, 255, 255), False, points, 2)
+        entry = _half_sprites[key] = (image, center)
+    return entry
+
+
 class Particle:
     """A particle for visual effects."""
 
@@ -207,7 +344,8 @@ class Particle:
         self.vy = math.sin(angle) * speed
         self.color = color
         self.life = 1.0
-        self.radius = random.uniform(2, 5)
+        self.radius = int(random.uniform(2, 5))
+        self.frames = particle_sprites(color, self.radius)
 
     def update(self) -> bool:
         """Update particle. Returns False when dead."""
@@ -217,15 +355,14 @@ class Particle:
         self.life -= 0.02
         return self.life > 0
 
+    def sprite(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Shared sprite for the current fade level and its blit position."""
+        radius = self.radius
+        return self.frames[int(self.life * PARTICLE_ALPHA_STEPS)], (int(self.x) - radius, int(self.y) - radius)
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the particle."""
-        alpha = int(self.life * 255)
-        if alpha > 0:
-            color = (*self.color, alpha)
-            # Create a surface for alpha blending
-            s = pygame.Surface((int(self.radius * 2), int(self.radius * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(s, color, (int(self.radius), int(self.radius)), int(self.radius))
-            surface.blit(s, (int(self.x - self.radius), int(self.y - self.radius)))
+        surface.blit(*self.sprite())
 
 
 class Game:
@@ -246,13 +383,12 @@ class Game:
         self.objects: List[GameObject] = []
         self.halves: List[FruitHalf] = []
         self.particles: List[Particle] = []
-        self.trail: List[TrailPoint] = []
+        self.trail = SliceTrail()
         self.score = 0
         self.lives = 3
         self.game_over = False
         self.spawn_timer = 0
         self.difficulty = 1.0
-        self.last_mouse_pos = None
         self.mouse_speed = 0
 
     def spawn_object(self) -> None:
@@ -279,12 +415,21 @@ class Game:
         for _ in range(10):
             self.particles.append(Particle(x, y, color))
 
-    def check_collisions(self, mouse_pos: Tuple[int, int], mouse_speed: float) -> bool:
-        """Check collisions with mouse slice. Returns True if bomb hit."""
-        mx, my = mouse_pos
+    def check_collisions(self, segments: List[Tuple[float, float, float, float]]) -> bool:
+        """Check swept slice segments in input order. Returns True if bomb hit."""
+        for x1, y1, x2, y2 in segments:
+            # Segment bounding box grown by the largest object radius
+            min_x = min(x1, x2) - BOMB_RADIUS
+            max_x = max(x1, x2) + BOMB_RADIUS
+            min_y = min(y1, y2) - BOMB_RADIUS
+            max_y = max(y1, y2) + BOMB_RADIUS
+
+            for obj in self.objects:
+                if obj.sliced or not (min_x <= obj.x <= max_x and min_y <= obj.y <= max_y):
+                    continue
+                if not obj.intersects_segment(x1, y1, x2, y2):
+                    continue
 
-        for obj in self.objects[:]:
-            if obj.contains_point(mx, my) and not obj.sliced:
                 if isinstance(obj, Bomb):
                     obj.sliced = True
                     self.create_slice_particles(obj.x, obj.y, BOMB_COLOR)
@@ -295,8 +440,23 @@ class Game:
                     self.score += FRUIT_SCORE
                     self.create_slice_particles(obj.x, obj.y, obj.color)
 
+        self.objects = [obj for obj in self.objects if obj.alive]
         return False
 
+    def handle_swipe(self, segments: List[Tuple[float, float, float, float]]) -> None:
+        """Slice and extend the trail with this frame's mouse motion."""
+        self.mouse_speed = sum(math.hypot(x2 - x1, y2 - y1) for x1, y1, x2, y2 in segments)
+        if self.game_over or self.mouse_speed <= SLICE_THRESHOLD * 100:
+            return
+
+        for x1, y1, x2, y2 in segments:
+            if self.trail.last() != (x1, y1):
+                self.trail.push(x1, y1, connected=False)
+            self.trail.push(x2, y2)
+
+        if self.check_collisions(segments):
+            self.game_over = True
+
     def update(self) -> None:
         """Update game state."""
         if self.game_over:
@@ -313,47 +473,33 @@ class Game:
             self.spawn_object()
 
         # Update objects
-        for obj in self.objects[:]:
-            if not obj.update():
-                self.objects.remove(obj)
-                if isinstance(obj, Fruit) and not obj.sliced:
-                    # Missed a fruit
-                    self.score += MISS_PENALTY
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.game_over = True
+        remaining = []
+        for obj in self.objects:
+            if obj.update():
+                remaining.append(obj)
+            elif isinstance(obj, Fruit) and not obj.sliced:
+                # Missed a fruit
+                self.score += MISS_PENALTY
+                self.lives -= 1
+                if self.lives <= 0:
+                    self.game_over = True
+        self.objects = remaining
 
         # Update halves
-        for half in self.halves[:]:
-            if not half.update():
-                self.halves.remove(half)
+        self.halves = [half for half in self.halves if half.update()]
 
         # Update particles
-        for particle in self.particles[:]:
-            if not particle.update():
-                self.particles.remove(particle)
+        self.particles = [particle for particle in self.particles if particle.update()]
 
         # Update trail
-        for point in self.trail[:]:
-            if not point.update():
-                self.trail.remove(point)
-
-        # Add current mouse position to trail if moving fast enough
-        if self.mouse_speed > SLICE_THRESHOLD * 100:
-            mx, my = pygame.mouse.get_pos()
-            self.trail.append(TrailPoint(mx, my))
+        self.trail.update()
 
     def draw(self) -> None:
         """Draw everything."""
         self.screen.fill(BACKGROUND)
 
         # Draw trail
-        for i, point in enumerate(self.trail):
-            alpha = int(point.life * 150)
-            if alpha > 0:
-                s = pygame.Surface((10, 10), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*SLICE_TRAIL_COLOR, alpha), (5, 5), 3)
-                self.screen.blit(s, (int(point.x) - 5, int(point.y) - 5))
+        self.trail.draw(self.screen)
 
         # Draw objects
         for obj in self.objects:
@@ -363,9 +509,8 @@ class Game:
         for half in self.halves:
             half.draw(self.screen)
 
-        # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        # Draw particles in one call from the shared sprites
+        self.screen.blits([particle.sprite() for particle in self.particles], doreturn=False)
 
         # Draw UI
         score_text = self.font.render(f"Score: {self.score}", True, TEXT_COLOR)
@@ -394,29 +539,23 @@ class Game:
         running = True
 
         while running:
-            # Calculate mouse speed
-            mouse_pos = pygame.mouse.get_pos()
-            if self.last_mouse_pos:
-                dx = mouse_pos[0] - self.last_mouse_pos[0]
-                dy = mouse_pos[1] - self.last_mouse_pos[1]
-                self.mouse_speed = math.sqrt(dx * dx + dy * dy)
-            self.last_mouse_pos = mouse_pos
-
-            # Handle events
+            # Handle events, keeping every mouse motion since the last frame
+            segments = []
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.MOUSEMOTION:
+                    x, y = event.pos
+                    dx, dy = event.rel
+                    segments.append((x - dx, y - dy, x, y))
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
                     elif event.key == pygame.K_SPACE and self.game_over:
                         self.reset()
 
-            # Check collisions if mouse is moving fast enough
-            if not self.game_over and self.mouse_speed > SLICE_THRESHOLD * 100:
-                bomb_hit = self.check_collisions(mouse_pos, self.mouse_speed)
-                if bomb_hit:
-                    self.game_over = True
+            # Slice along every segment if the mouse is moving fast enough
+            self.handle_swipe(segments)
 
             # Update and draw
             self.update()
@@ -426,8 +565,56 @@ class Game:
         pygame.quit()
 
 
+def run_benchmark(fruit_count: int = BENCH_FRUIT_COUNT, frames: int = BENCH_FRAMES) -> None:
+    """Time full frames with hundreds of fruits on screen and a constant swipe."""
+    random.seed(0)
+    game = Game()
+    total = 0.0
+    worst = 0.0
+    sliced = 0
+    angle = 0.0
+
+    for _ in range(frames):
+        # Keep the screen full of fruit and never run out of lives
+        while len(game.objects) < fruit_count:
+            game.objects.append(Fruit(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT),
+                                      random.uniform(-3, 3), random.uniform(-8, 0)))
+        game.lives = 3
+        game.spawn_timer = 0  # No random spawns, so no bombs
+
+        # A circular swipe sampled at input rate
+        segments = []
+        for _ in range(BENCH_SEGMENTS_PER_FRAME):
+            x1 = SCREEN_WIDTH / 2 + math.cos(angle) * 250
+            y1 = SCREEN_HEIGHT / 2 + math.sin(angle) * 250
+            angle += 0.02
+            x2 = SCREEN_WIDTH / 2 + math.cos(angle) * 250
+            y2 = SCREEN_HEIGHT / 2 + math.sin(angle) * 250
+            segments.append((x1, y1, x2, y2))
+
+        before = len(game.objects)
+        start = time.perf_counter()
+        game.handle_swipe(segments)
+        sliced += before - len(game.objects)
+        game.update()
+        game.draw()
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        worst = max(worst, elapsed)
+
+    avg_ms = total / frames * 1000
+    print(f"{fruit_count} fruits, {frames} frames, {BENCH_SEGMENTS_PER_FRAME} segments/frame")
+    print(f"avg {avg_ms:.2f} ms/frame ({1000 / avg_ms:.0f} FPS), worst {worst * 1000:.2f} ms, {sliced} slices")
+    pygame.quit()
+
+
 def main() -> None:
     """Entry point."""
+    if "--bench" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        run_benchmark()
+        return
+
     game = Game()
     game.run()
 
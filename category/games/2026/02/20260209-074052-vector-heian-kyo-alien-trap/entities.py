@@ -1,10 +1,13 @@
 """Game entities for Heian-Kyo Alien Trap."""
 
-from typing import List, Tuple, Optional, Set
+from typing import Iterable, List, Tuple, Optional, Set
 from enum import Enum
 import random
 from config import *
 
+# Random source for forward-model rollouts, kept apart from live play
+rollout_rng = random.Random()
+
 
 class Direction(Enum):
     UP = (-1, 0)
@@ -16,6 +19,8 @@ class Direction(Enum):
 class Alien:
     """Represents an alien enemy."""
 
+    __slots__ = ('row', 'col', 'in_hole', 'hole_time', 'is_buried', 'move_timer', 'pursuit_mode')
+
     def __init__(self, row: int, col: int):
         self.row = row
         self.col = col
@@ -26,7 +31,7 @@ class Alien:
         self.pursuit_mode = False
 
     def update(self, player_row: int, player_col: int, walls: Set[Tuple[int, int]],
-               holes: Set[Tuple[int, int]], grid_rows: int, grid_cols: int) -> None:
+               holes: Set[Tuple[int, int]], grid_rows: int, grid_cols: int, rng=random) -> None:
         """Update alien AI movement."""
         if self.in_hole:
             self.hole_time += 1
@@ -39,16 +44,16 @@ class Alien:
         self.move_timer = 0
 
         # Simple AI: sometimes move randomly, sometimes pursue player
-        if random.random() < 0.6:
-            self._move_randomly(walls, holes, grid_rows, grid_cols)
+        if rng.random() < 0.6:
+            self._move_randomly(walls, holes, grid_rows, grid_cols, rng)
         else:
             self._move_toward_player(player_row, player_col, walls, holes, grid_rows, grid_cols)
 
     def _move_randomly(self, walls: Set[Tuple[int, int]], holes: Set[Tuple[int, int]],
-                      grid_rows: int, grid_cols: int) -> None:
+                      grid_rows: int, grid_cols: int, rng=random) -> None:
         """Move in a random valid direction."""
         directions = list(Direction)
-        random.shuffle(directions)
+        rng.shuffle(directions)
 
         for direction in directions:
             dr, dc = direction.value
@@ -93,7 +98,16 @@ class Alien:
 
 
 class GameState:
-    """Represents the current state of the game."""
+    """Represents the current state of the game.
+
+    Walls are a frozenset shared between snapshots, so ``snapshot`` only
+    copies the holes, a few scalars and one flat tuple per alien.
+    """
+
+    __slots__ = ('level', 'lives', 'score', 'total_reward', 'game_over', 'level_complete',
+                 'grid_rows', 'grid_cols', 'walls', 'holes',
+                 'player_row', 'player_col', 'action_progress', 'current_action', 'action_pos',
+                 'aliens', 'rng')
 
     def __init__(self, level: int = 1):
         self.level = level
@@ -106,7 +120,7 @@ class GameState:
         # Grid state
         self.grid_rows = GRID_ROWS
         self.grid_cols = GRID_COLS
-        self.walls: Set[Tuple[int, int]] = set()
+        self.walls: frozenset = frozenset()
         self.holes: Set[Tuple[int, int]] = set()
 
         # Player state
@@ -119,21 +133,24 @@ class GameState:
         # Aliens
         self.aliens: List[Alien] = []
 
+        # Random source for alien moves; swapped out during rollouts
+        self.rng = random
+
         self._load_level(level)
 
     def _load_level(self, level: int) -> None:
         """Load a level based on difficulty."""
-        self.walls.clear()
+        walls = set()
         self.holes.clear()
         self.aliens.clear()
 
         # Create border walls
         for r in range(self.grid_rows):
-            self.walls.add((r, 0))
-            self.walls.add((r, self.grid_cols - 1))
+            walls.add((r, 0))
+            walls.add((r, self.grid_cols - 1))
         for c in range(self.grid_cols):
-            self.walls.add((0, c))
-            self.walls.add((self.grid_rows - 1, c))
+            walls.add((0, c))
+            walls.add((self.grid_rows - 1, c))
 
         # Add internal walls (more walls in higher levels)
         num_internal_walls = 10 + level * 3
@@ -141,10 +158,12 @@ class GameState:
             while True:
                 r = random.randint(2, self.grid_rows - 3)
                 c = random.randint(2, self.grid_cols - 3)
-                if (r, c) not in self.walls and (r, c) != (1, 1):
-                    self.walls.add((r, c))
+                if (r, c) not in walls and (r, c) != (1, 1):
+                    walls.add((r, c))
                     break
 
+        self.walls = frozenset(walls)
+
         # Spawn player at safe position
         self.player_row = 1
         self.player_col = 1
@@ -261,7 +280,7 @@ class GameState:
                 continue
 
             alien.update(self.player_row, self.player_col, self.walls, self.holes,
-                        self.grid_rows, self.grid_cols)
+                        self.grid_rows, self.grid_cols, self.rng)
 
             # Check if alien falls into a hole
             if (alien.row, alien.col) in self.holes and not alien.in_hole:
@@ -339,6 +358,55 @@ class GameState:
 
         return state
 
+    def snapshot(self) -> tuple:
+        """Capture the full game state as an immutable tuple."""
+        return (self.level, self.lives, self.score, self.total_reward,
+                self.game_over, self.level_complete, self.walls, frozenset(self.holes),
+                self.player_row, self.player_col, self.action_progress,
+                self.current_action, self.action_pos,
+                tuple((a.row, a.col, a.in_hole, a.hole_time, a.is_buried, a.move_timer, a.pursuit_mode)
+                      for a in self.aliens))
+
+    def restore(self, snapshot: tuple) -> None:
+        """Restore state captured by snapshot(), reusing existing Alien objects."""
+        (self.level, self.lives, self.score, self.total_reward,
+         self.game_over, self.level_complete, self.walls, holes,
+         self.player_row, self.player_col, self.action_progress,
+         self.current_action, self.action_pos, alien_states) = snapshot
+        self.holes = set(holes)
+
+        if len(self.aliens) != len(alien_states):
+            self.aliens = [Alien(0, 0) for _ in alien_states]
+        for alien, state in zip(self.aliens, alien_states):
+            (alien.row, alien.col, alien.in_hole, alien.hole_time,
+             alien.is_buried, alien.move_timer, alien.pursuit_mode) = state
+
+    def simulate(self, actions: Iterable[int], rng: Optional[random.Random] = None) -> Tuple[bool, float]:
+        """Roll out actions without changing live state. Returns (done, total reward) like step().
+
+        The reward is the change in ``total_reward`` over the rollout, so
+        trapping and burying aliens count as well as deaths and the level win.
+        The rollout stops early on game over or level completion. Alien moves
+        draw from ``rng`` (a shared rollout generator by default), so the live
+        random sequence is left untouched as well.
+        """
+        saved = self.snapshot()
+        live_rng = self.rng
+        self.rng = rng if rng is not None else rollout_rng
+        start_reward = self.total_reward
+        done = False
+        try:
+            for action in actions:
+                self.step(action)
+                if self.game_over or self.level_complete:
+                    done = True
+                    break
+            total = self.total_reward - start_reward
+        finally:
+            self.rng = live_rng
+            self.restore(saved)
+        return done, total
+
     def reset(self) -> None:
         """Reset the current level."""
         self.score = 0
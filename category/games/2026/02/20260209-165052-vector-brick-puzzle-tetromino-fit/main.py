@@ -6,7 +6,7 @@ A 10x10 grid puzzle game where players place tetromino pieces to clear lines.
 import pygame
 import random
 import sys
-from typing import List, Tuple, Optional, Set
+from typing import Dict, List, Tuple, Optional, Set
 
 # Initialize Pygame
 pygame.init()
@@ -64,6 +64,204 @@ EXTENDED_SHAPES = {
 ALL_SHAPES = {**TETROMINOES, **EXTENDED_SHAPES}
 SHAPE_NAMES = list(ALL_SHAPES.keys())
 
+# Bitboard layout: cell (x, y) is bit y * GRID_SIZE + x
+ROW_MASKS = [((1 << GRID_SIZE) - 1) << (y * GRID_SIZE) for y in range(GRID_SIZE)]
+COL_MASKS = [sum(1 << (y * GRID_SIZE + x) for y in range(GRID_SIZE)) for x in range(GRID_SIZE)]
+LINE_MASKS = tuple(ROW_MASKS + COL_MASKS)
+
+
+def cell_bit(x: int, y: int) -> int:
+    """Return the bitboard bit for a grid cell."""
+    return 1 << (y * GRID_SIZE + x)
+
+
+def build_placements(cells: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Tuple[int, Tuple[int, ...]]]:
+    """Precompute the mask and touched line masks for every in-bounds offset."""
+    placements = {}
+    for grid_y in range(GRID_SIZE):
+        for grid_x in range(GRID_SIZE):
+            if any(grid_x + dx >= GRID_SIZE or grid_y + dy >= GRID_SIZE for dx, dy in cells):
+                continue
+            mask = 0
+            for dx, dy in cells:
+                mask |= cell_bit(grid_x + dx, grid_y + dy)
+            rows = {grid_y + dy for _, dy in cells}
+            cols = {grid_x + dx for dx, _ in cells}
+            lines = tuple(ROW_MASKS[y] for y in sorted(rows)) + tuple(COL_MASKS[x] for x in sorted(cols))
+            placements[(grid_x, grid_y)] = (mask, lines)
+    return placements
+
+
+PLACEMENTS = {name: build_placements(cells) for name, cells in ALL_SHAPES.items()}
+
+# Most cells each shape can put into a single row and a single column, which
+# caps how empty a line can be for one placement to complete it
+LINE_REACH = {
+    name: tuple(max(sum(1 for dx, dy in cells if (dy if axis == 0 else dx) == i)
+                    for i in range(GRID_SIZE))
+                for axis in (0, 1))
+    for name, cells in ALL_SHAPES.items()
+}
+
+# Placements of each shape grouped by the line masks they touch
+PLACEMENTS_BY_LINE = {
+    name: {line: [(pos, mask, lines) for pos, (mask, lines) in placements.items() if line in lines]
+           for line in LINE_MASKS}
+    for name, placements in PLACEMENTS.items()
+}
+
+# Placements of each shape with the touched lines also as bits, bit i
+# standing for LINE_MASKS[i]
+LINE_INDEX = {line: i for i, line in enumerate(LINE_MASKS)}
+SEARCH_PLACEMENTS = {
+    name: [(pos, mask, lines, sum(1 << LINE_INDEX[line] for line in lines))
+           for pos, (mask, lines) in placements.items()]
+    for name, placements in PLACEMENTS.items()
+}
+
+
+def clear_lines(board: int, lines: Tuple[int, ...]) -> Tuple[int, int]:
+    """Clear the full lines among the given masks. Returns (board, lines cleared)."""
+    cleared = 0
+    clear_mask = 0
+    for line in lines:
+        if board & line == line:
+            clear_mask |= line
+            cleared += 1
+    return board & ~clear_mask, cleared
+
+
+def placement_score(block_count: int, lines: int) -> int:
+    """Score for placing a piece and clearing lines."""
+    return block_count * 10 + lines * 100 * lines
+
+
+def reachable_lines(board: int, row_reach: int, col_reach: int) -> int:
+    """Line bits of the rows and columns with at most row_reach / col_reach empty cells."""
+    free = ~board
+    reachable = 0
+    for index, line in enumerate(ROW_MASKS):
+        if (line & free).bit_count() <= row_reach:
+            reachable |= 1 << index
+    for index, line in enumerate(COL_MASKS, GRID_SIZE):
+        if (line & free).bit_count() <= col_reach:
+            reachable |= 1 << index
+    return reachable
+
+
+def best_single_placement(board: int, name: str,
+                          inert_only: bool = False) -> Tuple[int, int, Optional[Tuple[str, int, int]]]:
+    """Best placement for one piece, only scoring placements that touch near-full lines.
+
+    With inert_only, a placement that clears nothing only counts if it
+    touches no line the piece could ever complete.
+    """
+    block_count = len(ALL_SHAPES[name])
+    row_reach, col_reach = LINE_REACH[name]
+    best_score, best_move = -1, None
+    reachable = reachable_lines(board, row_reach, col_reach)
+    for index, line in enumerate(LINE_MASKS):
+        if not reachable >> index & 1:
+            continue
+        for (grid_x, grid_y), mask, lines in PLACEMENTS_BY_LINE[name][line]:
+            if board & mask or (board | mask) & line != line:
+                continue
+            _, cleared = clear_lines(board | mask, lines)
+            score = placement_score(block_count, cleared)
+            if score > best_score:
+                best_score, best_move = score, (name, grid_x, grid_y)
+
+    if best_move is not None:
+        return 1, best_score, best_move
+
+    # Nothing can clear a line, so any fit scores the same
+    if not inert_only:
+        reachable = 0
+    for (grid_x, grid_y), mask, _, line_bits in SEARCH_PLACEMENTS[name]:
+        if not board & mask and not line_bits & reachable:
+            return 1, placement_score(block_count, 0), (name, grid_x, grid_y)
+    return 0, 0, None
+
+
+def find_best_move(board: int, shape_names: List[Optional[str]]) -> Optional[Tuple[int, int, int]]:
+    """Search all tray orderings and placements for the best-scoring sequence.
+
+    Sequences that place more pieces win over higher-scoring shorter ones.
+    Returns (tray index, grid x, grid y) for the first move, or None if no
+    piece fits.
+
+    Orderings that cannot change the outcome are skipped:
+
+    - A placement touching no line that the remaining pieces together could
+      complete takes no part in any clear, so it can be moved to the end of
+      the sequence. Once one is made, the rest of the sequence is searched
+      the same way, and the first such tail that places every piece is as
+      good as any other.
+    - Two placements in a row that clear nothing leave the same board in
+      either order, so they are only tried with piece names in sorted order.
+    """
+    Result = Tuple[int, int, Optional[Tuple[str, int, int]]]
+    memo: Dict[Tuple[int, Tuple[str, ...], str, bool], Result] = {}
+
+    def search(board: int, remaining: Tuple[str, ...], after: str = "", inert: bool = False) -> Result:
+        """Best (placed, score, first move) for remaining on board.
+
+        after names the piece of a preceding placement that cleared nothing,
+        and inert marks the tail of the sequence.
+        """
+        key = (board, remaining, after, inert)
+        if key in memo:
+            return memo[key]
+        if len(remaining) == 1:
+            memo[key] = best_single_placement(board, remaining[0], remaining[0] < after)
+            return memo[key]
+
+        clearable = reachable_lines(board, sum(LINE_REACH[name][0] for name in remaining),
+                                    sum(LINE_REACH[name][1] for name in remaining))
+        inert = inert or not clearable
+        tail_done = False
+        best_placed, best_score, best_move = 0, -1, None
+        for i, name in enumerate(remaining):
+            if i and name == remaining[i - 1]:
+                continue
+            if inert and tail_done:
+                break
+            rest = remaining[:i] + remaining[i + 1:]
+            block_count = len(ALL_SHAPES[name])
+            for (grid_x, grid_y), mask, lines, line_bits in SEARCH_PLACEMENTS[name]:
+                if board & mask:
+                    continue
+                starts_tail = inert or not line_bits & clearable
+                if starts_tail and tail_done:
+                    continue
+                next_board = board | mask
+                cleared = 0
+                if line_bits & clearable:
+                    next_board, cleared = clear_lines(next_board, lines)
+                    if not cleared and not inert and name < after:
+                        continue
+                placed, score = 1, placement_score(block_count, cleared)
+                if rest:
+                    rest_placed, rest_score, _ = search(
+                        next_board, rest, "" if cleared or starts_tail else name, starts_tail)
+                    placed += rest_placed
+                    score += rest_score
+                if placed > best_placed or (placed == best_placed and score > best_score):
+                    best_placed, best_score, best_move = placed, score, (name, grid_x, grid_y)
+                if starts_tail and placed == len(remaining):
+                    tail_done = True
+
+        best = (best_placed, max(best_score, 0), best_move)
+        memo[key] = best
+        return best
+
+    remaining = tuple(sorted(name for name in shape_names if name is not None))
+    _, _, move = search(board, remaining)
+    if move is None:
+        return None
+    name, grid_x, grid_y = move
+    return shape_names.index(name), grid_x, grid_y
+
 
 class Piece:
     """Represents a tetromino piece."""
@@ -81,21 +279,14 @@ class Piece:
         max_y = max(c[1] for c in self.cells) + 1
         return max_x, max_y
 
-    def can_place(self, grid: List[List[bool]], grid_x: int, grid_y: int) -> bool:
+    def can_place(self, board: int, grid_x: int, grid_y: int) -> bool:
         """Check if piece can be placed at grid position."""
-        for dx, dy in self.cells:
-            x, y = grid_x + dx, grid_y + dy
-            if x < 0 or x >= GRID_SIZE or y < 0 or y >= GRID_SIZE:
-                return False
-            if grid[y][x]:
-                return False
-        return True
+        placement = PLACEMENTS[self.shape_name].get((grid_x, grid_y))
+        return placement is not None and not board & placement[0]
 
-    def place(self, grid: List[List[bool]], grid_x: int, grid_y: int) -> None:
-        """Place piece on grid."""
-        for dx, dy in self.cells:
-            x, y = grid_x + dx, grid_y + dy
-            grid[y][x] = True
+    def place(self, board: int, grid_x: int, grid_y: int) -> int:
+        """Place piece on board. Returns the new board."""
+        return board | PLACEMENTS[self.shape_name][(grid_x, grid_y)][0]
 
     def get_block_count(self) -> int:
         """Return number of blocks in piece."""
@@ -116,7 +307,7 @@ class Game:
 
     def reset_game(self) -> None:
         """Reset game state."""
-        self.grid: List[List[bool]] = [[False] * GRID_SIZE for _ in range(GRID_SIZE)]
+        self.board = 0
         self.score = 0
         self.pieces: List[Optional[Piece]] = []
         self.dragging_piece: Optional[int] = None
@@ -161,32 +352,7 @@ class Game:
 
     def check_lines(self) -> int:
         """Check and clear complete lines. Returns number of lines cleared."""
-        lines_cleared = 0
-        rows_to_clear = []
-        cols_to_clear = []
-
-        # Check rows
-        for y in range(GRID_SIZE):
-            if all(self.grid[y][x] for x in range(GRID_SIZE)):
-                rows_to_clear.append(y)
-
-        # Check columns
-        for x in range(GRID_SIZE):
-            if all(self.grid[y][x] for y in range(GRID_SIZE)):
-                cols_to_clear.append(x)
-
-        # Clear rows
-        for y in rows_to_clear:
-            for x in range(GRID_SIZE):
-                self.grid[y][x] = False
-            lines_cleared += 1
-
-        # Clear columns
-        for x in cols_to_clear:
-            for y in range(GRID_SIZE):
-                self.grid[y][x] = False
-            lines_cleared += 1
-
+        self.board, lines_cleared = clear_lines(self.board, LINE_MASKS)
         return lines_cleared
 
     def can_place_any_piece(self) -> bool:
@@ -194,12 +360,46 @@ class Game:
         for piece in self.pieces:
             if piece is None:
                 continue
-            for y in range(GRID_SIZE):
-                for x in range(GRID_SIZE):
-                    if piece.can_place(self.grid, x, y):
-                        return True
+            for mask, _ in PLACEMENTS[piece.shape_name].values():
+                if not self.board & mask:
+                    return True
         return False
 
+    def get_best_move(self) -> Optional[Tuple[int, int, int]]:
+        """Return the AI's best (tray index, grid x, grid y) move, or None."""
+        return find_best_move(self.board, [p.shape_name if p else None for p in self.pieces])
+
+    def place_piece(self, index: int, grid_x: int, grid_y: int) -> bool:
+        """Place a tray piece on the grid and resolve scoring. Returns success."""
+        piece = self.pieces[index]
+        if piece is None or not piece.can_place(self.board, grid_x, grid_y):
+            return False
+
+        # Place piece
+        self.board = piece.place(self.board, grid_x, grid_y)
+
+        # Add placement score
+        self.score += piece.get_block_count() * 10
+
+        # Remove piece from tray
+        self.pieces[index] = None
+
+        # Check for line clears
+        lines = self.check_lines()
+        if lines > 0:
+            # Bonus for multiple lines
+            self.score += lines * 100 * lines
+
+        # Check if all pieces placed
+        if all(p is None for p in self.pieces):
+            self.generate_new_pieces()
+
+        # Check game over
+        if not self.can_place_any_piece():
+            self.game_over = True
+
+        return True
+
     def handle_click(self, pos: Tuple[int, int]) -> None:
         """Handle mouse click."""
         if self.game_over:
@@ -244,30 +444,7 @@ class Game:
         grid_x -= width // 2
         grid_y -= height // 2
 
-        if piece.can_place(self.grid, grid_x, grid_y):
-            # Place piece
-            piece.place(self.grid, grid_x, grid_y)
-
-            # Add placement score
-            self.score += piece.get_block_count() * 10
-
-            # Remove piece from tray
-            self.pieces[self.dragging_piece] = None
-
-            # Check for line clears
-            lines = self.check_lines()
-            if lines > 0:
-                # Bonus for multiple lines
-                self.score += lines * 100 * lines
-
-            # Check if all pieces placed
-            if all(p is None for p in self.pieces):
-                self.generate_new_pieces()
-
-            # Check game over
-            if not self.can_place_any_piece():
-                self.game_over = True
-
+        self.place_piece(self.dragging_piece, grid_x, grid_y)
         self.dragging_piece = None
 
     def draw_grid(self) -> None:
@@ -281,7 +458,7 @@ class Game:
                     CELL_SIZE,
                     CELL_SIZE
                 )
-                color = COLORS["block_active"] if self.grid[y][x] else COLORS["grid_cell"]
+                color = COLORS["block_active"] if self.board & cell_bit(x, y) else COLORS["grid_cell"]
                 pygame.draw.rect(self.screen, color, rect)
                 pygame.draw.rect(self.screen, COLORS["grid_line"], rect, 1)
 
@@ -350,7 +527,7 @@ class Game:
         grid_x -= width // 2
         grid_y -= height // 2
 
-        valid = piece.can_place(self.grid, grid_x, grid_y)
+        valid = piece.can_place(self.board, grid_x, grid_y)
         self.draw_piece_on_grid(piece, grid_x, grid_y, valid)
 
     def draw_score(self) -> None:
@@ -422,6 +599,10 @@ class Game:
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
                         self.reset_game()
+                    elif event.key == pygame.K_a and not self.game_over:
+                        move = self.get_best_move()
+                        if move is not None:
+                            self.place_piece(*move)
                     elif event.key == pygame.K_ESCAPE:
                         running = False
 
@@ -5,6 +5,7 @@ A 1-on-1 blob volleyball game with physics-based jumping and spiking.
 
 import pygame
 import math
+import sys
 
 # Constants
 SCREEN_WIDTH = 800
@@ -35,6 +36,14 @@ NET_WIDTH = 10
 
 FLOOR_Y = SCREEN_HEIGHT - 30
 
+# Give up predicting a ball still in the air after this many frames
+MAX_PREDICT_FRAMES = 600
+
+# AI blob settings
+AI_OFFSET = 22        # How far behind the landing point to stand
+AI_JUMP_FRAMES = 9    # Jump when the ball is this many frames from landing
+AI_JUMP_RANGE = 60    # ...and at most this far away horizontally
+
 
 class Vector:
     """Simple 2D vector class for physics calculations."""
@@ -111,6 +120,81 @@ class Ball:
             self.pos = Vector(SCREEN_WIDTH - 150, 100)
 
 
+def bounce_off_net(ball):
+    """Push the ball out of the net and send it back the way it came."""
+    net_rect = pygame.Rect(NET_X - NET_WIDTH // 2, FLOOR_Y - NET_HEIGHT, NET_WIDTH, NET_HEIGHT)
+
+    ball_rect = pygame.Rect(
+        ball.pos.x - ball.radius,
+        ball.pos.y - ball.radius,
+        ball.radius * 2,
+        ball.radius * 2
+    )
+
+    if net_rect.colliderect(ball_rect):
+        # Determine bounce direction
+        if ball.pos.x < NET_X:
+            ball.vel.x = -abs(ball.vel.x) * BOUNCE_DAMPING
+            ball.pos.x = NET_X - NET_WIDTH // 2 - ball.radius
+        else:
+            ball.vel.x = abs(ball.vel.x) * BOUNCE_DAMPING
+            ball.pos.x = NET_X + NET_WIDTH // 2 + ball.radius
+
+
+class TrajectoryPredictor:
+    """Predicts where and when the ball lands if no blob touches it.
+
+    The flight is simulated with Ball.update and bounce_off_net, frame by
+    frame as Game.update runs them, so the prediction is exact. Every state
+    along the flight is remembered: while the ball stays on that path a
+    query is a single lookup, and only a touch or a serve puts the ball on
+    a new path and costs a fresh simulation.
+    """
+
+    def __init__(self, max_frames=MAX_PREDICT_FRAMES):
+        self.max_frames = max_frames
+        self.simulations = 0
+        self._path = {}
+        self._landing_x = None
+        self._landing_frame = 0
+
+    def predict(self, ball):
+        """Return (landing_x, frames_to_land), or None if the ball stays up too long.
+
+        frames_to_land counts the game frames until check_scoring sees the
+        ball on the floor.
+        """
+        frame = self._path.get(self._key(ball))
+        if frame is None:
+            self._simulate(ball)
+            frame = 0
+        if self._landing_x is None:
+            return None
+        return self._landing_x, self._landing_frame - frame
+
+    @staticmethod
+    def _key(ball):
+        return (ball.pos.x, ball.pos.y, ball.vel.x, ball.vel.y)
+
+    def _simulate(self, ball):
+        """Fly a copy of the ball until it reaches the floor."""
+        self.simulations += 1
+        ghost = Ball(ball.pos.x, ball.pos.y)
+        ghost.vel = Vector(ball.vel.x, ball.vel.y)
+        ghost.radius = ball.radius
+
+        self._path = {self._key(ghost): 0}
+        self._landing_x = None
+        for frame in range(1, self.max_frames + 1):
+            ghost.update()
+            bounce_off_net(ghost)
+            if ghost.pos.y + ghost.radius >= FLOOR_Y:
+                self._landing_x = ghost.pos.x
+                self._landing_frame = frame
+                return
+            self._path[self._key(ghost)] = frame
+
+
 class Blob:
     """Player character blob."""
 
@@ -217,10 +301,49 @@ class Blob:
         )
 
 
+class BlobAI:
+    """Steers a blob to meet the ball where the predictor says it comes down."""
+
+    def __init__(self, blob):
+        self.blob = blob
+        self.predictor = TrajectoryPredictor()
+        if blob.is_left:
+            self.left_key, self.right_key, self.jump_key = pygame.K_a, pygame.K_d, pygame.K_w
+            self.home_x = NET_X / 2
+        else:
+            self.left_key, self.right_key, self.jump_key = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP
+            self.home_x = NET_X + NET_X / 2
+
+    def keys(self, ball):
+        """Return this frame's key states for the blob."""
+        keys = {self.left_key: False, self.right_key: False, self.jump_key: False}
+
+        # Wait mid-court until the ball is coming down on our side
+        target_x = self.home_x
+        prediction = self.predictor.predict(ball)
+        if prediction is not None:
+            landing_x, frames = prediction
+            if (landing_x < NET_X) == self.blob.is_left:
+                if frames < AI_JUMP_FRAMES and abs(ball.pos.x - self.blob.pos.x) < AI_JUMP_RANGE:
+                    # Jump into the ball, driving toward the net to carry it over
+                    keys[self.jump_key] = True
+                    keys[self.right_key if self.blob.is_left else self.left_key] = True
+                    return keys
+                # Stand behind the ball so the hit carries it toward the net
+                target_x = landing_x - AI_OFFSET if self.blob.is_left else landing_x + AI_OFFSET
+
+        if target_x < self.blob.pos.x - self.blob.speed:
+            keys[self.left_key] = True
+        elif target_x > self.blob.pos.x + self.blob.speed:
+            keys[self.right_key] = True
+        return keys
+
+
 class Game:
     """Main game state and logic."""
 
-    def __init__(self):
+    def __init__(self, ai_player2=False):
+        self.ai_player2 = ai_player2
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Vector Volleyball Blob Jump")
@@ -234,6 +357,7 @@ class Game:
         """Reset entire game."""
         self.player1 = Blob(150, FLOOR_Y - 25, PLAYER1_COLOR, True)
         self.player2 = Blob(SCREEN_WIDTH - 150, FLOOR_Y - 25, PLAYER2_COLOR, False)
+        self.ai = BlobAI(self.player2) if self.ai_player2 else None
 
         self.ball = Ball(150, 100)
         self.server = 1
@@ -292,23 +416,7 @@ class Game:
 
     def check_net_collision(self):
         """Check if ball hits the net."""
-        net_rect = pygame.Rect(NET_X - NET_WIDTH // 2, FLOOR_Y - NET_HEIGHT, NET_WIDTH, NET_HEIGHT)
-
-        ball_rect = pygame.Rect(
-            self.ball.pos.x - self.ball.radius,
-            self.ball.pos.y - self.ball.radius,
-            self.ball.radius * 2,
-            self.ball.radius * 2
-        )
-
-        if net_rect.colliderect(ball_rect):
-            # Determine bounce direction
-            if self.ball.pos.x < NET_X:
-                self.ball.vel.x = -abs(self.ball.vel.x) * BOUNCE_DAMPING
-                self.ball.pos.x = NET_X - NET_WIDTH // 2 - self.ball.radius
-            else:
-                self.ball.vel.x = abs(self.ball.vel.x) * BOUNCE_DAMPING
-                self.ball.pos.x = NET_X + NET_WIDTH // 2 + self.ball.radius
+        bounce_off_net(self.ball)
 
     def check_scoring(self):
         """Check if a point is scored."""
@@ -377,7 +485,7 @@ class Game:
 
         # Update players
         self.player1.update(keys)
-        self.player2.update(keys)
+        self.player2.update(self.ai.keys(self.ball) if self.ai else keys)
 
         # Update ball
         self.ball.update()
@@ -480,7 +588,7 @@ class Game:
 
 def main():
     """Entry point."""
-    game = Game()
+    game = Game(ai_player2="--ai" in sys.argv)
     game.run()
 
 
@@ -1,7 +1,17 @@
 import pygame
+import os
 import sys
+import copy
 import math
 import random
+import time
+
+# Tick value for events that never happen
+NEVER = sys.maxsize
+
+# Stress test settings
+STRESS_BUBBLES = 400
+STRESS_FRAMES = 600
 
 
 class Bubble:
@@ -12,49 +22,125 @@ class Bubble:
         (100, 200, 100),  # Medium - Green
         (100, 100, 255)   # Small - Blue
     ]
+    GRAVITY = 0.15
 
-    def __init__(self, x, y, size_index, vx=0):
-        self.x = x
-        self.y = y
+    # Motion is stored in closed form. Between bounces, n ticks after
+    # x_tick / y_tick the bubble is at
+    #     x = x0 + vx * n
+    #     y = y0 + vy0 * n + GRAVITY * n * (n + 1) / 2
+    # which matches stepping vy += GRAVITY; y += vy once per tick. The tick
+    # of the next wall and ground bounce is solved when a segment starts, so
+    # advancing costs two comparisons per tick and any future position can be
+    # found by walking bounces instead of ticks.
+
+    def __init__(self):
+        self.active = False
+        self.slot = -1
+
+    def launch(self, tick, x, y, size_index, vx, arena_width, ground_y):
+        self.active = True
         self.size_index = size_index
         self.radius = self.SIZES[size_index]
         self.color = self.COLORS[size_index]
-        self.vx = vx if vx != 0 else random.choice([-3, 3])
-        self.vy = -self.BOUNCE_SPEED[size_index]
-        self.gravity = 0.15
+        self.arena_width = arena_width
+        self.ground_y = ground_y
+        self.tick = tick
         self.on_ground = False
+        self.start_x(tick, x, vx if vx != 0 else random.choice([-3, 3]))
+        self.start_y(tick, y, -self.BOUNCE_SPEED[size_index])
+
+    @property
+    def x(self):
+        return self.x0 + self.vx * (self.tick - self.x_tick)
+
+    @property
+    def y(self):
+        if self.on_ground:
+            return self.y0
+        n = self.tick - self.y_tick
+        return self.y0 + self.vy0 * n + self.GRAVITY * n * (n + 1) / 2
+
+    @property
+    def vy(self):
+        if self.on_ground:
+            return 0
+        return self.vy0 + self.GRAVITY * (self.tick - self.y_tick)
+
+    def hits_wall(self, n):
+        x = self.x0 + self.vx * n
+        if self.vx < 0:
+            return x - self.radius < 0
+        return x + self.radius > self.arena_width
+
+    def hits_ground(self, n):
+        return self.y0 + self.vy0 * n + self.GRAVITY * n * (n + 1) / 2 + self.radius > self.ground_y
+
+    def start_x(self, tick, x, vx):
+        self.x0 = x
+        self.vx = vx
+        self.x_tick = tick
+        if vx == 0:
+            self.wall_tick = NEVER
+            return
 
-    def update(self, screen_width, screen_height, ground_y):
-        # Apply gravity
-        self.vy += self.gravity
-
-        # Update position
-        self.x += self.vx
-        self.y += self.vy
-
-        # Wall collision
-        if self.x - self.radius < 0:
-            self.x = self.radius
-            self.vx *= -1
-        elif self.x + self.radius > screen_width:
-            self.x = screen_width - self.radius
-            self.vx *= -1
-
-        # Ground collision
-        if self.y + self.radius > ground_y:
-            self.y = ground_y - self.radius
-            if abs(self.vy) < 2:
-                self.vy = 0
+        # First tick past the wall in the direction of travel
+        room = (x - self.radius) / -vx if vx < 0 else (self.arena_width - self.radius - x) / vx
+        n = max(1, int(room) + 1)
+        while n > 1 and self.hits_wall(n - 1):
+            n -= 1
+        while not self.hits_wall(n):
+            n += 1
+        self.wall_tick = tick + n
+
+    def start_y(self, tick, y, vy):
+        self.y0 = y
+        self.vy0 = vy
+        self.y_tick = tick
+
+        # First tick below the ground: root of the quadratic, then nudged
+        # so the integer tick agrees exactly with hits_ground
+        a = self.GRAVITY / 2
+        b = vy + a
+        c = y + self.radius - self.ground_y
+        disc = max(0.0, b * b - 4 * a * c)
+        n = max(1, int((-b + math.sqrt(disc)) / (2 * a)) + 1)
+        while n > 1 and self.hits_ground(n - 1):
+            n -= 1
+        while not self.hits_ground(n):
+            n += 1
+        self.ground_tick = tick + n
+
+    def advance(self, tick):
+        self.tick = tick
+
+        while self.wall_tick <= tick:
+            x = self.radius if self.vx < 0 else self.arena_width - self.radius
+            self.start_x(self.wall_tick, x, -self.vx)
+
+        while self.ground_tick <= tick:
+            bounce_tick = self.ground_tick
+            vy = self.vy0 + self.GRAVITY * (bounce_tick - self.y_tick)
+            if abs(vy) < 2:
+                # Come to rest on the ground
+                self.y0 = self.ground_y - self.radius
+                self.vy0 = 0
+                self.y_tick = bounce_tick
+                self.ground_tick = NEVER
                 self.on_ground = True
-            else:
-                self.vy *= -0.95  # Slight energy loss on bounce
-                # Ensure minimum bounce for the game to work
-                min_bounce = self.BOUNCE_SPEED[self.size_index] * 0.7
-                if abs(self.vy) < min_bounce:
-                    self.vy = -min_bounce
-                self.on_ground = False
-        else:
-            self.on_ground = False
+                break
+
+            vy *= -0.95  # Slight energy loss on bounce
+            # Ensure minimum bounce for the game to work
+            min_bounce = self.BOUNCE_SPEED[self.size_index] * 0.7
+            if abs(vy) < min_bounce:
+                vy = -min_bounce
+            self.start_y(bounce_tick, self.ground_y - self.radius, vy)
+
+    def position_at(self, tick):
+        # Position at any later tick without stepping the game
+        probe = copy.copy(self)
+        probe.advance(tick)
+        return probe.x, probe.y
 
     def draw(self, surface):
         # Draw main bubble
@@ -80,6 +166,41 @@ class Bubble:
         )
 
 
+class BubblePool:
+    # Live bubbles stay packed in a list with swap-remove; popped bubbles go
+    # to a free list and are relaunched by later splits instead of reallocated
+    def __init__(self, capacity=64):
+        self.live = []
+        self.free = [Bubble() for _ in range(capacity)]
+
+    def __len__(self):
+        return len(self.live)
+
+    def __iter__(self):
+        return iter(self.live)
+
+    def spawn(self, tick, x, y, size_index, vx, arena_width, ground_y):
+        bubble = self.free.pop() if self.free else Bubble()
+        bubble.launch(tick, x, y, size_index, vx, arena_width, ground_y)
+        bubble.slot = len(self.live)
+        self.live.append(bubble)
+        return bubble
+
+    def release(self, bubble):
+        last = self.live.pop()
+        if last is not bubble:
+            self.live[bubble.slot] = last
+            last.slot = bubble.slot
+        bubble.active = False
+        self.free.append(bubble)
+
+    def clear(self):
+        for bubble in self.live:
+            bubble.active = False
+            self.free.append(bubble)
+        self.live.clear()
+
+
 class Player:
     def __init__(self, x, y):
         self.x = x
@@ -176,7 +297,8 @@ class PangGame:
         self.ground_y = self.height - 50
         self.player = Player(self.width // 2, self.ground_y)
         self.wire = WireShot()
-        self.bubbles = []
+        self.bubbles = BubblePool()
+        self.tick = 0
 
         self.score = 0
         self.level = 1
@@ -200,7 +322,7 @@ class PangGame:
         num_bubbles = min(1 + (self.level - 1) // 2, 4)
         for i in range(num_bubbles):
             x = 150 + i * (self.width - 300) // max(1, num_bubbles - 1)
-            self.bubbles.append(Bubble(x, 200, 0))
+            self.bubbles.spawn(self.tick, x, 200, 0, 0, self.width, self.ground_y)
 
         self.time_remaining = self.time_limit
 
@@ -208,8 +330,9 @@ class PangGame:
         if parent_bubble.size_index < 2:  # Can split further
             new_size = parent_bubble.size_index + 1
             # Create two bubbles moving in opposite directions
-            bubble1 = Bubble(parent_bubble.x, parent_bubble.y, new_size, -3)
-            bubble2 = Bubble(parent_bubble.x, parent_bubble.y, new_size, 3)
+            x, y = parent_bubble.x, parent_bubble.y
+            bubble1 = self.bubbles.spawn(self.tick, x, y, new_size, -3, self.width, self.ground_y)
+            bubble2 = self.bubbles.spawn(self.tick, x, y, new_size, 3, self.width, self.ground_y)
             return [bubble1, bubble2]
         return []
 
@@ -266,16 +389,16 @@ class PangGame:
                 self.wire.head_size * 2
             )
 
-            for bubble in self.bubbles[:]:
-                # Check collision using distance
+            for bubble in self.bubbles:
+                # Reject on x before evaluating the trajectory's y
+                reach = bubble.radius + self.wire.head_size
                 dx = self.wire.x - bubble.x
+                if abs(dx) >= reach:
+                    continue
                 dy = self.wire.y - bubble.y
-                distance = math.sqrt(dx * dx + dy * dy)
 
-                if distance < bubble.radius + self.wire.head_size:
+                if dx * dx + dy * dy < reach * reach:
                     # Hit!
-                    self.bubbles.remove(bubble)
-
                     # Score based on size
                     points = [100, 200, 500][bubble.size_index]
                     self.score += points
@@ -283,9 +406,9 @@ class PangGame:
                     # Create explosion effect
                     self.create_explosion(bubble.x, bubble.y, bubble.color)
 
-                    # Spawn smaller bubbles if not smallest
-                    new_bubbles = self.spawn_split_bubbles(bubble)
-                    self.bubbles.extend(new_bubbles)
+                    # Spawn smaller bubbles if not smallest, then free the slot
+                    self.spawn_split_bubbles(bubble)
+                    self.bubbles.release(bubble)
 
                     # Deactivate wire
                     self.wire.active = False
@@ -295,15 +418,19 @@ class PangGame:
         # Check player collision with bubbles
         player_rect = self.player.get_rect()
         for bubble in self.bubbles:
+            x = bubble.x
+            if x <= player_rect.left - bubble.radius or x >= player_rect.right + bubble.radius:
+                continue
+            y = bubble.y
+
             # Closest point on rectangle to circle center
-            closest_x = max(player_rect.left, min(bubble.x, player_rect.right))
-            closest_y = max(player_rect.top, min(bubble.y, player_rect.bottom))
+            closest_x = max(player_rect.left, min(x, player_rect.right))
+            closest_y = max(player_rect.top, min(y, player_rect.bottom))
 
-            dx = bubble.x - closest_x
-            dy = bubble.y - closest_y
-            distance = math.sqrt(dx * dx + dy * dy)
+            dx = x - closest_x
+            dy = y - closest_y
 
-            if distance < bubble.radius:
+            if dx * dx + dy * dy < bubble.radius * bubble.radius:
                 self.game_over = True
                 return
 
@@ -324,9 +451,10 @@ class PangGame:
         # Update wire
         self.wire.update()
 
-        # Update bubbles
+        # Advance bubbles along their trajectories
+        self.tick += 1
         for bubble in self.bubbles:
-            bubble.update(self.width, self.height, self.ground_y)
+            bubble.advance(self.tick)
 
         # Check collisions
         self.check_collisions()
@@ -462,6 +590,42 @@ class PangGame:
         sys.exit()
 
 
-if __name__ == "__main__":
+def run_stress_test(bubbles=STRESS_BUBBLES, frames=STRESS_FRAMES):
+    # Time update() with a deep split tree and the wire firing constantly
+    random.seed(0)
     game = PangGame()
-    game.run()
+    game.bubbles.clear()
+    for _ in range(bubbles):
+        game.bubbles.spawn(game.tick, random.uniform(60, game.width - 60), random.uniform(100, 400),
+                           random.randint(0, 2), 0, game.width, game.ground_y)
+    start_count = len(game.bubbles)
+
+    total = 0.0
+    worst = 0.0
+    for frame in range(frames):
+        # Park the player below the arena and keep the wire sweeping
+        game.game_over = False
+        game.player.y = game.height * 10
+        if not game.wire.active:
+            game.wire.fire(40 + (frame * 37) % (game.width - 80), game.ground_y, 50)
+
+        start = time.perf_counter()
+        game.update()
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        worst = max(worst, elapsed)
+
+    avg_ms = total / frames * 1000
+    print(f"{start_count} bubbles at start, {len(game.bubbles)} left, "
+          f"{len(game.bubbles.free)} pooled, score {game.score}")
+    print(f"update avg {avg_ms:.3f} ms/frame, worst {worst * 1000:.3f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    if "--stress" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        run_stress_test()
+    else:
+        game = PangGame()
+        game.run()
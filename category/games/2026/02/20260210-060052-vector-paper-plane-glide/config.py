@@ -32,6 +32,12 @@ MIN_GAP_HEIGHT = 150
 MAX_GAP_HEIGHT = 300
 SEGMENT_WIDTH = 50
 CAVE_SMOOTHNESS = 5
+CORRIDOR_BUFFER_SIZE = 64  # Ring buffer slots for segment heights
+
+# Lidar observation
+LIDAR_RANGE = 400  # Max reading in pixels
+LIDAR_STEP = 2  # Sample spacing along each ray
+LIDAR_FOV = 180  # Degrees, centered on straight ahead
 
 # Air Currents (collectibles)
 AIR_CURRENT_RADIUS = 12
@@ -2,19 +2,28 @@
 
 import pygame
 import random
-import math
+import numpy as np
 from config import *
 
 
 class Corridor:
-    """Scrolling cave corridor with smooth terrain."""
+    """Scrolling cave corridor with smooth terrain.
+
+    Ceiling and floor heights live in NumPy ring buffers. Segment i (counted
+    from the leftmost live segment) is stored in slot (head + i) % capacity,
+    so scrolling a segment off screen only advances head, and the segment
+    under screen x is found directly as (x + scroll_offset) // SEGMENT_WIDTH.
+    """
 
     def __init__(self):
         self.reset()
 
     def reset(self):
         """Reset corridor to initial state."""
-        self.segments = []
+        self.ceilings = np.zeros(CORRIDOR_BUFFER_SIZE)
+        self.floors = np.zeros(CORRIDOR_BUFFER_SIZE)
+        self.head = 0
+        self.count = 0
         self.air_currents = []
         self.scroll_offset = 0
         self.scroll_speed = BASE_SCROLL_SPEED
@@ -29,38 +38,51 @@ class Corridor:
         floor_y = ceiling_y + gap_height
 
         for i in range(30):
-            self.segments.append({
-                'ceiling': ceiling_y,
-                'floor': floor_y
-            })
+            self.push_segment(ceiling_y, floor_y)
+
+    def slot(self, index):
+        """Ring buffer slot holding segment index."""
+        return (self.head + index) % len(self.ceilings)
+
+    def push_segment(self, ceiling, floor):
+        """Append a segment, growing the ring buffers if they are full."""
+        capacity = len(self.ceilings)
+        if self.count == capacity:
+            order = np.arange(self.head, self.head + capacity) % capacity
+            self.ceilings = np.concatenate((self.ceilings[order], np.zeros(capacity)))
+            self.floors = np.concatenate((self.floors[order], np.zeros(capacity)))
+            self.head = 0
+
+        slot = self.slot(self.count)
+        self.ceilings[slot] = ceiling
+        self.floors[slot] = floor
+        self.count += 1
 
     def add_segment(self):
         """Add new segment at the end."""
-        last = self.segments[-1]
+        last = self.slot(self.count - 1)
+        last_ceiling = float(self.ceilings[last])
+        last_floor = float(self.floors[last])
 
         # Random gap height change
         gap_change = random.randint(-30, 30)
         new_gap = max(MIN_GAP_HEIGHT, min(MAX_GAP_HEIGHT,
-                                          (last['floor'] - last['ceiling']) + gap_change))
+                                          (last_floor - last_ceiling) + gap_change))
 
         # Vertical position change (gradual)
         vertical_shift = random.randint(-20, 20)
-        total_height = last['floor'] - last['ceiling']
-        center_y = (last['ceiling'] + last['floor']) / 2 + vertical_shift * 0.3
+        center_y = (last_ceiling + last_floor) / 2 + vertical_shift * 0.3
 
         # Keep within screen bounds
         new_ceiling = max(50, min(SCREEN_HEIGHT // 2 - 50, center_y - new_gap / 2))
         new_floor = new_ceiling + new_gap
 
-        self.segments.append({
-            'ceiling': new_ceiling,
-            'floor': new_floor
-        })
+        self.push_segment(new_ceiling, new_floor)
 
         # Maybe spawn air current
         if random.random() < AIR_CURRENT_SPAWN_CHANCE:
             self.air_currents.append({
-                'x': len(self.segments) * SEGMENT_WIDTH,
+                'x': self.count * SEGMENT_WIDTH,
                 'y': new_ceiling + new_gap / 2,
                 'collected': False
             })
@@ -72,60 +94,95 @@ class Corridor:
         self.scroll_speed += SCROLL_SPEED_INCREMENT * (dt / 16.67)
 
         # Add new segments as needed
-        while (len(self.segments) * SEGMENT_WIDTH) < (SCREEN_WIDTH + self.scroll_offset + 200):
+        while (self.count * SEGMENT_WIDTH) < (SCREEN_WIDTH + self.scroll_offset + 200):
             self.add_segment()
 
-        # Remove old segments
+        # Drop old segments by advancing the ring head
         segments_to_remove = int(self.scroll_offset // SEGMENT_WIDTH)
         if segments_to_remove > 0:
-            self.segments = self.segments[segments_to_remove:]
+            self.head = self.slot(segments_to_remove)
+            self.count -= segments_to_remove
             self.scroll_offset %= SEGMENT_WIDTH
 
             # Update air currents positions
             for ac in self.air_currents:
                 ac['x'] -= segments_to_remove * SEGMENT_WIDTH
 
-        # Remove off-screen air currents
-        self.air_currents = [ac for ac in self.air_currents if ac['x'] > -50]
+            # Remove off-screen air currents
+            self.air_currents = [ac for ac in self.air_currents if ac['x'] > -50]
+
+    def segment_index(self, x):
+        """Index of the segment under screen x."""
+        return int((x + self.scroll_offset) // SEGMENT_WIDTH)
+
+    def heights_at(self, x):
+        """Get (ceiling, floor) of the segment under screen x."""
+        slot = self.slot(max(0, min(self.count - 1, self.segment_index(x))))
+        return float(self.ceilings[slot]), float(self.floors[slot])
+
+    def segment_heights(self):
+        """Get ceiling and floor heights of all live segments, left to right."""
+        order = np.arange(self.head, self.head + self.count) % len(self.ceilings)
+        return self.ceilings[order], self.floors[order]
 
     def check_collision(self, rect):
         """Check if rect collides with cave walls."""
-        # Check each visible segment
-        for i, seg in enumerate(self.segments):
-            seg_x = i * SEGMENT_WIDTH - self.scroll_offset
-            seg_rect = pygame.Rect(seg_x, 0, SEGMENT_WIDTH, SCREEN_HEIGHT)
-
-            if seg_rect.colliderect(rect):
-                # Check ceiling
-                ceiling_rect = pygame.Rect(seg_x, 0, SEGMENT_WIDTH, seg['ceiling'])
-                if ceiling_rect.colliderect(rect):
-                    return True
-
-                # Check floor
-                floor_rect = pygame.Rect(seg_x, seg['floor'], SEGMENT_WIDTH, SCREEN_HEIGHT - seg['floor'])
-                if floor_rect.colliderect(rect):
-                    return True
+        # Only the segments under the rect's horizontal span can touch it.
+        # Edges are truncated to whole pixels the way pygame.Rect would.
+        first = max(0, self.segment_index(rect.left) - 1)
+        last = min(self.count - 1, self.segment_index(rect.right))
+
+        for index in range(first, last + 1):
+            seg_x = int(index * SEGMENT_WIDTH - self.scroll_offset)
+            if seg_x >= rect.right or seg_x + SEGMENT_WIDTH <= rect.left:
+                continue
+            slot = self.slot(index)
+            if rect.top < int(self.ceilings[slot]) or rect.bottom > int(self.floors[slot]):
+                return True
 
         return False
 
     def check_air_current(self, center):
         """Check if plane center collects an air current."""
         cx, cy = center
+        reach = (AIR_CURRENT_RADIUS + 10) ** 2
         for ac in self.air_currents:
             if not ac['collected']:
-                dist = math.sqrt((cx - ac['x']) ** 2 + (cy - ac['y']) ** 2)
-                if dist < AIR_CURRENT_RADIUS + 10:
+                dx = cx - ac['x']
+                dy = cy - ac['y']
+                if dx * dx + dy * dy < reach:
                     ac['collected'] = True
                     return True
         return False
 
+    def cast_rays(self, origin, angles, max_range=LIDAR_RANGE):
+        """Distances from origin to the cave walls along each ray angle.
+
+        Every ray is sampled every LIDAR_STEP pixels and all samples are
+        tested against the ring buffers in one vectorized pass. Rays that hit
+        nothing within max_range read max_range.
+        """
+        ox, oy = origin
+        steps = np.arange(LIDAR_STEP, max_range + LIDAR_STEP, LIDAR_STEP, dtype=float)
+        xs = ox + np.cos(angles)[:, None] * steps
+        ys = oy + np.sin(angles)[:, None] * steps
+
+        index = np.floor((xs + self.scroll_offset) / SEGMENT_WIDTH).astype(int)
+        slots = (self.head + np.clip(index, 0, self.count - 1)) % len(self.ceilings)
+        hit = (ys < self.ceilings[slots]) | (ys > self.floors[slots])
+        hit |= (ys <= 0) | (ys >= SCREEN_HEIGHT)
+
+        first = hit.argmax(axis=1)
+        return np.where(hit.any(axis=1), steps[first], float(max_range))
+
     def draw(self, screen):
         """Draw the cave corridor."""
+        xs = (np.arange(self.count) * SEGMENT_WIDTH - self.scroll_offset).tolist()
+        ceilings, floors = self.segment_heights()
+
         # Draw ceiling
         ceiling_points = [(0, 0)]
-        for i, seg in enumerate(self.segments):
-            x = i * SEGMENT_WIDTH - self.scroll_offset
-            ceiling_points.append((x, seg['ceiling']))
+        ceiling_points.extend(zip(xs, ceilings.tolist()))
         ceiling_points.append((SCREEN_WIDTH, 0))
 
         if len(ceiling_points) > 2:
@@ -134,9 +191,7 @@ class Corridor:
 
         # Draw floor
         floor_points = [(0, SCREEN_HEIGHT)]
-        for i, seg in enumerate(self.segments):
-            x = i * SEGMENT_WIDTH - self.scroll_offset
-            floor_points.append((x, seg['floor']))
+        floor_points.extend(zip(xs, floors.tolist()))
         floor_points.append((SCREEN_WIDTH, SCREEN_HEIGHT))
 
         if len(floor_points) > 2:
@@ -1,6 +1,7 @@
 """Main game loop and rendering."""
 
 import pygame
+import numpy as np
 from config import *
 from plane import Plane
 from corridor import Corridor
@@ -23,6 +24,7 @@ class Game:
         self.distance = 0
         self.start_time = 0
         self.game_state = "ready"  # ready, playing, game_over
+        self.lidar_angles = {}  # Ray angles keyed by ray count
 
         # Fonts
         self.score_font = pygame.font.Font(None, SCORE_FONT_SIZE)
@@ -143,12 +145,13 @@ class Game:
 
         pygame.display.flip()
 
-    def step_ai(self, action):
+    def step_ai(self, action, lidar_rays=0):
         """
         Execute an AI action and return observation, reward, done.
 
         Args:
             action: 0 = release lift, 1 = apply lift
+            lidar_rays: number of lidar rays to include in the observation
 
         Returns:
             (observation, reward, done)
@@ -176,22 +179,20 @@ class Game:
             reward = REWARD_COLLISION
             done = True
 
-        return self.get_observation(), reward, done
+        return self.get_observation(lidar_rays), reward, done
 
-    def get_observation(self):
-        """Return current game state for AI."""
-        # Find nearest ceiling and floor
-        plane_center_x = self.plane.x + self.plane.width // 2
-
-        ceiling_y = 0
-        floor_y = SCREEN_HEIGHT
+    def get_observation(self, lidar_rays=0):
+        """
+        Return current game state for AI.
 
-        for i, seg in enumerate(self.corridor.segments):
-            seg_x = i * SEGMENT_WIDTH - self.corridor.scroll_offset
-            if seg_x <= plane_center_x <= seg_x + SEGMENT_WIDTH:
-                ceiling_y = seg['ceiling']
-                floor_y = seg['floor']
-                break
+        Args:
+            lidar_rays: if nonzero, add "lidar", the distances to the cave
+                walls along that many rays fanned evenly across LIDAR_FOV
+                from the plane's center, ordered from up to down
+        """
+        # Ceiling and floor of the segment under the plane
+        plane_center_x = self.plane.x + self.plane.width // 2
+        ceiling_y, floor_y = self.corridor.heights_at(plane_center_x)
 
         # Find nearest air current
         nearest_current = None
@@ -224,6 +225,14 @@ class Game:
             obs["air_current_dist_x"] = 999
             obs["air_current_dist_y"] = 0
 
+        if lidar_rays:
+            angles = self.lidar_angles.get(lidar_rays)
+            if angles is None:
+                half_fov = np.radians(LIDAR_FOV) / 2
+                angles = np.linspace(-half_fov, half_fov, lidar_rays)
+                self.lidar_angles[lidar_rays] = angles
+            obs["lidar"] = self.corridor.cast_rays(self.plane.get_center(), angles).tolist()
+
         return obs
 
     def run(self):
@@ -0,0 +1,261 @@
+"""Vectorized headless rinks for Vector Ice Hockey Slapshot.
+
+BatchHockey keeps N independent games as struct-of-arrays numpy state and
+advances them all with the same per-frame rules as Game.update, driven the
+way Game.step drives a single game. Every arithmetic step mirrors the scalar
+code, so each rink follows exactly the trajectory a Game would.
+"""
+
+import numpy as np
+from config import *
+
+GOAL_TOP = (WINDOW_HEIGHT - GOAL_WIDTH) / 2
+GOAL_BOTTOM = (WINDOW_HEIGHT + GOAL_WIDTH) / 2
+RESTITUTION = 0.9
+
+# Per-player horizontal limits, left side first
+PLAYER_MIN_X = (RINK_MARGIN + PLAYER_RADIUS, WINDOW_WIDTH / 2 + PLAYER_RADIUS)
+PLAYER_MAX_X = (WINDOW_WIDTH / 2 - PLAYER_RADIUS, WINDOW_WIDTH - RINK_MARGIN - PLAYER_RADIUS)
+PLAYER_START_X = (150, WINDOW_WIDTH - 150)
+
+# Winner codes in BatchHockey.winner
+NO_WINNER = 0
+PLAYER1_WINS = 1
+PLAYER2_WINS = 2
+
+
+class BatchHockey:
+    """N rinks advanced together, one numpy array per state field.
+
+    Players are stored as (2, n) arrays, row 0 for Player 1 and row 1 for
+    Player 2; the puck, scores and timers are (n,) arrays.
+    """
+
+    FIELDS = (
+        "px", "py", "pvx", "pvy", "cooldown",
+        "bx", "by", "bvx", "bvy",
+        "p1_score", "p2_score", "goal_reset_timer", "winner",
+    )
+
+    def __init__(self, n, frame_skip=FRAME_SKIP):
+        self.n = n
+        self.frame_skip = frame_skip
+
+        self.px = np.empty((2, n))
+        self.py = np.empty((2, n))
+        self.pvx = np.zeros((2, n))
+        self.pvy = np.zeros((2, n))
+        self.cooldown = np.zeros((2, n), dtype=np.int64)
+        self.bx = np.empty(n)
+        self.by = np.empty(n)
+        self.bvx = np.zeros(n)
+        self.bvy = np.zeros(n)
+        self.p1_score = np.zeros(n, dtype=np.int64)
+        self.p2_score = np.zeros(n, dtype=np.int64)
+        self.goal_reset_timer = np.zeros(n, dtype=np.int64)
+        self.winner = np.zeros(n, dtype=np.int8)
+
+        self.reset_positions(np.ones(n, dtype=bool))
+
+    def reset(self, mask=None):
+        """Reset the masked rinks (all by default) as Game.reset_game does."""
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        self.p1_score[mask] = 0
+        self.p2_score[mask] = 0
+        self.winner[mask] = NO_WINNER
+        self.reset_positions(mask)
+
+    def reset_positions(self, mask):
+        """Put players and puck of the masked rinks back on their marks."""
+        for side in (0, 1):
+            self.px[side, mask] = PLAYER_START_X[side]
+            self.py[side, mask] = WINDOW_HEIGHT / 2
+            self.pvx[side, mask] = 0
+            self.pvy[side, mask] = 0
+        self.bx[mask] = WINDOW_WIDTH / 2
+        self.by[mask] = WINDOW_HEIGHT / 2
+        self.bvx[mask] = 0
+        self.bvy[mask] = 0
+
+    def step(self, actions, opponent_actions=None):
+        """Play frame_skip frames in every rink and return (state, reward, done).
+
+        actions is an (n, 3) array of [vx, vy, slapshot] rows for Player 1,
+        held for every frame as Game.step holds them; opponent_actions does
+        the same for Player 2, who glides without input when it is None.
+        Rinks that have been won do not advance until reset().
+        """
+        actions = np.asarray(actions, dtype=float)
+        if opponent_actions is not None:
+            opponent_actions = np.asarray(opponent_actions, dtype=float)
+
+        for _ in range(self.frame_skip):
+            finished = self.winner != NO_WINNER
+            if finished.all():
+                break
+            saved = self._save(finished) if finished.any() else None
+
+            self.set_action(0, actions)
+            if opponent_actions is not None:
+                self.set_action(1, opponent_actions)
+            self.update()
+
+            if saved is not None:
+                self._restore(finished, saved)
+
+        return self.get_state(), self.get_reward(1), self.is_done()
+
+    def set_action(self, side, actions):
+        """Apply [vx, vy, slapshot] rows to one player as Game.set_action does."""
+        self.pvx[side] = np.maximum(-PLAYER_SPEED, np.minimum(PLAYER_SPEED, actions[:, 0]))
+        self.pvy[side] = np.maximum(-PLAYER_SPEED, np.minimum(PLAYER_SPEED, actions[:, 1]))
+        self.handle_slapshot(side, actions[:, 2] > 0.5)
+
+    def update(self):
+        """Advance every rink one frame with no keys held."""
+        self.update_players()
+        self.update_puck()
+        self.handle_collisions()
+        self.check_goals()
+
+        timing = self.goal_reset_timer > 0
+        self.goal_reset_timer[timing] -= 1
+        self.reset_positions(timing & (self.goal_reset_timer == 0))
+
+    def update_players(self):
+        """Speed limit, friction, movement and rink bounds for both players."""
+        mag = np.sqrt(self.pvx * self.pvx + self.pvy * self.pvy)
+        fast = mag > PLAYER_SPEED
+        self.pvx = np.where(fast, self.pvx / np.where(fast, mag, 1) * PLAYER_SPEED, self.pvx)
+        self.pvy = np.where(fast, self.pvy / np.where(fast, mag, 1) * PLAYER_SPEED, self.pvy)
+
+        self.pvx *= PLAYER_FRICTION
+        self.pvy *= PLAYER_FRICTION
+        self.px += self.pvx
+        self.py += self.pvy
+
+        for side in (0, 1):
+            self.px[side] = np.maximum(PLAYER_MIN_X[side], np.minimum(PLAYER_MAX_X[side], self.px[side]))
+        self.py = np.maximum(RINK_MARGIN + PLAYER_RADIUS,
+                             np.minimum(WINDOW_HEIGHT - RINK_MARGIN - PLAYER_RADIUS, self.py))
+
+        self.cooldown[self.cooldown > 0] -= 1
+
+    def update_puck(self):
+        """Move the puck, apply friction, bounce off the boards and cap its speed."""
+        self.bx += self.bvx
+        self.by += self.bvy
+        self.bvx *= PUCK_FRICTION
+        self.bvy *= PUCK_FRICTION
+
+        top = self.by - PUCK_RADIUS < RINK_MARGIN
+        bottom = ~top & (self.by + PUCK_RADIUS > WINDOW_HEIGHT - RINK_MARGIN)
+        self.by[top] = RINK_MARGIN + PUCK_RADIUS
+        self.by[bottom] = WINDOW_HEIGHT - RINK_MARGIN - PUCK_RADIUS
+        self.bvy[top | bottom] *= -1
+
+        boards = ~((GOAL_TOP < self.by) & (self.by < GOAL_BOTTOM))
+        left = boards & (self.bx - PUCK_RADIUS < RINK_MARGIN)
+        self.bx[left] = RINK_MARGIN + PUCK_RADIUS
+        right = boards & (self.bx + PUCK_RADIUS > WINDOW_WIDTH - RINK_MARGIN)
+        self.bx[right] = WINDOW_WIDTH - RINK_MARGIN - PUCK_RADIUS
+        self.bvx[left | right] *= -1
+
+        mag = np.sqrt(self.bvx * self.bvx + self.bvy * self.bvy)
+        fast = mag > PUCK_MAX_SPEED
+        if fast.any():
+            self.bvx[fast] = self.bvx[fast] / mag[fast] * PUCK_MAX_SPEED
+            self.bvy[fast] = self.bvy[fast] / mag[fast] * PUCK_MAX_SPEED
+
+    def handle_collisions(self):
+        """Resolve player-puck contact; only the first player touching counts."""
+        contact = np.zeros(self.n, dtype=bool)
+        min_dist = PLAYER_RADIUS + PUCK_RADIUS
+        for side in (0, 1):
+            dx = self.bx - self.px[side]
+            dy = self.by - self.py[side]
+            dist = np.sqrt(dx * dx + dy * dy)
+            hit = ~contact & (dist < min_dist)
+            contact |= hit
+            if not hit.any():
+                continue
+
+            dx, dy, dist = dx[hit], dy[hit], dist[hit]
+            safe = np.where(dist == 0, 1, dist)
+            nx = np.where(dist == 0, 0.0, dx / safe)
+            ny = np.where(dist == 0, 0.0, dy / safe)
+
+            # Separate puck from player
+            overlap = min_dist - dist
+            self.bx[hit] += nx * overlap
+            self.by[hit] += ny * overlap
+
+            # Transfer momentum when moving towards each other
+            vn = (self.bvx[hit] - self.pvx[side, hit]) * nx + (self.bvy[hit] - self.pvy[side, hit]) * ny
+            impulse = np.where(vn < 0, -(1 + RESTITUTION) * vn, 0.0)
+            closing = vn < 0
+            bvx, bvy = self.bvx[hit], self.bvy[hit]
+            self.bvx[hit] = np.where(closing, bvx + nx * impulse, bvx)
+            self.bvy[hit] = np.where(closing, bvy + ny * impulse, bvy)
+        return contact
+
+    def check_goals(self):
+        """Score pucks inside either goal mouth and record winners."""
+        mouth = (GOAL_TOP < self.by) & (self.by < GOAL_BOTTOM)
+        p2_goal = mouth & (self.bx < RINK_MARGIN)
+        p1_goal = mouth & ~p2_goal & (self.bx > WINDOW_WIDTH - RINK_MARGIN)
+
+        self.p2_score += p2_goal
+        self.p1_score += p1_goal
+        self.goal_reset_timer[p2_goal | p1_goal] = GOAL_RESET_DELAY
+        self.winner[p2_goal & (self.p2_score >= WINNING_SCORE)] = PLAYER2_WINS
+        self.winner[p1_goal & (self.p1_score >= WINNING_SCORE)] = PLAYER1_WINS
+
+    def handle_slapshot(self, side, wants):
+        """Fire slapshots for one player where requested and off cooldown."""
+        shoot = wants & (self.cooldown[side] == 0)
+        if not shoot.any():
+            return
+        dx = self.bx - self.px[side]
+        dy = self.by - self.py[side]
+        dist = np.sqrt(dx * dx + dy * dy)
+        strike = shoot & (dist < SLAPSHOT_RANGE)
+        safe = np.where(dist == 0, 1, dist)
+        self.bvx = np.where(strike, self.bvx + np.where(dist == 0, 0.0, dx / safe) * SLAPSHOT_FORCE, self.bvx)
+        self.bvy = np.where(strike, self.bvy + np.where(dist == 0, 0.0, dy / safe) * SLAPSHOT_FORCE, self.bvy)
+        self.cooldown[side, shoot] = SLAPSHOT_COOLDOWN
+
+    def _save(self, mask):
+        """Copy the masked rinks' state so a frame can be undone for them."""
+        return [getattr(self, name)[..., mask].copy() for name in self.FIELDS]
+
+    def _restore(self, mask, saved):
+        for name, values in zip(self.FIELDS, saved):
+            getattr(self, name)[..., mask] = values
+
+    # AI interface, batched versions of the Game methods
+
+    def get_state(self):
+        """State arrays keyed as in Game.get_state, one row per rink."""
+        return {
+            "player1_pos": np.stack((self.px[0], self.py[0]), axis=1),
+            "player1_vel": np.stack((self.pvx[0], self.pvy[0]), axis=1),
+            "player2_pos": np.stack((self.px[1], self.py[1]), axis=1),
+            "player2_vel": np.stack((self.pvx[1], self.pvy[1]), axis=1),
+            "puck_pos": np.stack((self.bx, self.by), axis=1),
+            "puck_vel": np.stack((self.bvx, self.bvy), axis=1),
+            "scores": np.stack((self.p1_score, self.p2_score), axis=1),
+        }
+
+    def get_reward(self, player_id):
+        """Per-rink reward as Game.get_reward computes it."""
+        own, other = (self.p1_score, self.p2_score) if player_id == 1 else (self.p2_score, self.p1_score)
+        reward = np.full(self.n, -0.01)
+        reward += own * REWARD_STRUCTURE["goal_scored"]
+        reward += other * REWARD_STRUCTURE["goal_conceded"]
+        return reward
+
+    def is_done(self):
+        """Per-rink flags for games that have been won."""
+        return self.winner != NO_WINNER
@@ -0,0 +1,85 @@
+"""Throughput benchmark for headless Vector Ice Hockey Slapshot rollouts."""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from game import Game
+from batch import BatchHockey
+
+BENCH_SEED = 1234
+# Random actions cover a little more than the clamped velocity range
+ACTION_RANGE = 6.0
+
+# (label, rinks, frames); rinks of None runs one headless Game through step()
+MODES = [
+    ("Game.step", None, 20000),
+    ("batch x1", 1, 20000),
+    ("batch x64", 64, 400000),
+    ("batch x1024", 1024, 4000000),
+    ("batch x8192", 8192, 16000000),
+]
+
+
+def random_actions(rng, n):
+    """Uniform velocities past the clamp range, slapshot on about half the rows."""
+    actions = rng.uniform(-ACTION_RANGE, ACTION_RANGE, (n, 3))
+    actions[:, 2] = rng.random(n)
+    return actions
+
+
+def run_game(frames, seed):
+    """Step one headless game with random actions; return (frames, games, seconds)."""
+    rng = np.random.default_rng(seed)
+    game = Game(headless=True)
+    steps = frames // game.frame_skip
+    actions = random_actions(rng, steps).tolist()
+    opponent = random_actions(rng, steps).tolist()
+
+    games = 1
+    start = time.perf_counter()
+    for i in range(steps):
+        _, _, done = game.step(actions[i], opponent[i])
+        if done:
+            game.reset_game()
+            games += 1
+    elapsed = time.perf_counter() - start
+    return steps * game.frame_skip, games, elapsed
+
+
+def run_batch(rinks, frames, seed):
+    """Step a batch of rinks with random actions; return (frames, games, seconds)."""
+    rng = np.random.default_rng(seed)
+    batch = BatchHockey(rinks)
+    steps = max(1, frames // (rinks * batch.frame_skip))
+
+    games = rinks
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, _, done = batch.step(random_actions(rng, rinks), random_actions(rng, rinks))
+        if done.any():
+            batch.reset(done)
+            games += int(done.sum())
+    elapsed = time.perf_counter() - start
+    return steps * rinks * batch.frame_skip, games, elapsed
+
+
+def main():
+    """Print simulated frames per second and per hour on one core."""
+    scale = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    for label, rinks, frames in MODES:
+        frames = int(frames * scale)
+        if rinks is None:
+            done_frames, games, elapsed = run_game(frames, BENCH_SEED)
+        else:
+            done_frames, games, elapsed = run_batch(rinks, frames, BENCH_SEED)
+        rate = done_frames / elapsed
+        print(f"{label:12s} {rate:12.0f} frames/s  {rate * 3600 / 1e6:10.1f}M frames/hour  ({games} games)")
+
+
+if __name__ == "__main__":
+    main()
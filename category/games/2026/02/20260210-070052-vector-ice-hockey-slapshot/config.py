@@ -38,6 +38,7 @@ WINNING_SCORE = 5
 GOAL_RESET_DELAY = 60  # frames
 
 # AI Integration
+FRAME_SKIP = 4  # frames advanced per step() call
 STATE_SPACE = {
     "player1_pos": 2,      # (x, y)
     "player1_vel": 2,      # (vx, vy)
@@ -2,8 +2,12 @@
 
 import pygame
 import math
+from collections import defaultdict
 from config import *
 
+# Key state with nothing held, for frames driven through the AI interface
+NO_KEYS = defaultdict(bool)
+
 
 class Vector2:
     """Simple 2D vector class for physics calculations."""
@@ -22,7 +26,9 @@ class Vector2:
         return Vector2(self.x * scalar, self.y * scalar)
 
     def magnitude(self):
-        return math.sqrt(self.x ** 2 + self.y ** 2)
+        # Squares by multiplication are exactly rounded everywhere, which
+        # keeps BatchHockey bit-for-bit in step with this class
+        return math.sqrt(self.x * self.x + self.y * self.y)
 
     def normalize(self):
         mag = self.magnitude()
@@ -34,7 +40,9 @@ class Vector2:
         return self.x * other.x + self.y * other.y
 
     def distance_to(self, other):
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return math.sqrt(dx * dx + dy * dy)
 
     def to_tuple(self):
         return (self.x, self.y)
@@ -173,13 +181,23 @@ class Puck:
 class Game:
     """Main game class for Vector Ice Hockey Slapshot."""
 
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("Vector Ice Hockey Slapshot")
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.large_font = pygame.font.Font(None, 72)
+    def __init__(self, headless=False, frame_skip=FRAME_SKIP):
+        """Create the game.
+
+        A headless game opens no window and loads no fonts; it is driven
+        through step() and cannot run(). Each step() call advances
+        frame_skip frames.
+        """
+        self.headless = headless
+        self.frame_skip = frame_skip
+
+        if not headless:
+            pygame.init()
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+            pygame.display.set_caption("Vector Ice Hockey Slapshot")
+            self.clock = pygame.time.Clock()
+            self.font = pygame.font.Font(None, 36)
+            self.large_font = pygame.font.Font(None, 72)
 
         # Initialize entities
         self.player1 = Player(150, WINDOW_HEIGHT / 2, COLOR_P1, True)
@@ -346,6 +364,37 @@ class Game:
                 self.puck.vel = self.puck.vel + to_puck * SLAPSHOT_FORCE
             player.do_slapshot()
 
+    def update(self, keys):
+        """Advance one frame with the given key states."""
+        # Update Player 1 (Arrow keys + Space)
+        p1_slapshot = self.player1.update(
+            keys, pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE
+        )
+        if p1_slapshot:
+            self.handle_slapshot(self.player1, 1)
+
+        # Update Player 2 (WASD + Shift)
+        p2_slapshot = self.player2.update(
+            keys, pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d, pygame.K_LSHIFT
+        )
+        if p2_slapshot:
+            self.handle_slapshot(self.player2, -1)
+
+        # Update puck
+        self.puck.update()
+
+        # Handle collisions
+        self.handle_collisions()
+
+        # Check for goals
+        self.check_goals()
+
+        # Handle goal reset
+        if self.goal_reset_timer > 0:
+            self.goal_reset_timer -= 1
+            if self.goal_reset_timer == 0:
+                self.reset_positions()
+
     def run(self):
         """Main game loop."""
         while self.running:
@@ -360,37 +409,7 @@ class Game:
                         self.reset_game()
 
             if not self.winner:
-                # Get key states
-                keys = pygame.key.get_pressed()
-
-                # Update Player 1 (Arrow keys + Space)
-                p1_slapshot = self.player1.update(
-                    keys, pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE
-                )
-                if p1_slapshot:
-                    self.handle_slapshot(self.player1, 1)
-
-                # Update Player 2 (WASD + Shift)
-                p2_slapshot = self.player2.update(
-                    keys, pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d, pygame.K_LSHIFT
-                )
-                if p2_slapshot:
-                    self.handle_slapshot(self.player2, -1)
-
-                # Update puck
-                self.puck.update()
-
-                # Handle collisions
-                self.handle_collisions()
-
-                # Check for goals
-                scorer = self.check_goals()
-
-                # Handle goal reset
-                if self.goal_reset_timer > 0:
-                    self.goal_reset_timer -= 1
-                    if self.goal_reset_timer == 0:
-                        self.reset_positions()
+                self.update(pygame.key.get_pressed())
 
             # Draw everything
             self.draw_rink()
@@ -424,6 +443,23 @@ class Game:
             "scores": (self.p1_score, self.p2_score),
         }
 
+    def step(self, action, opponent_action=None):
+        """Play frame_skip frames and return (state, reward, done) for Player 1.
+
+        Actions are [vx, vy, slapshot] as taken by set_action and are applied
+        again on every frame they are held. Player 2 follows opponent_action,
+        or glides without input when it is None. Stepping stops early once
+        the game is won, and a finished game does not advance.
+        """
+        for _ in range(self.frame_skip):
+            if self.winner:
+                break
+            self.set_action(1, action)
+            if opponent_action is not None:
+                self.set_action(2, opponent_action)
+            self.update(NO_KEYS)
+        return self.get_state(), self.get_reward(1), self.is_done()
+
     def set_action(self, player_id, action):
         """Set action for AI-controlled player."""
         player = self.player1 if player_id == 1 else self.player2
@@ -3,10 +3,13 @@ Vector Missile Command Defense
 Defend your cities from incoming ballistic missiles in this classic vector-style defense simulator.
 """
 
+import os
+import sys
+import time
 import pygame
 import random
 import math
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 
 # Constants
@@ -42,6 +45,21 @@ INTERCEPTOR_SPEED = 12
 
 ENEMY_MISSILE_BASE_SPEED = 1.0
 ENEMY_MISSILE_SPAWN_BASE = 120  # Frames between spawns
+ENEMY_TRAIL_LENGTH = 20
+
+# MIRVs split into several warheads partway down the screen
+MIRV_START_WAVE = 4
+MIRV_CHANCE_PER_WAVE = 0.08  # Added per wave from MIRV_START_WAVE on
+MIRV_WARHEADS = 3
+MIRV_SPLIT_MIN_Y = 100
+MIRV_SPLIT_MAX_Y = 300
+
+# Broadphase cell size for explosion/missile lookups
+COLLISION_CELL_SIZE = BLAST_RADIUS * 2
+
+# Stress mode
+STRESS_MIRVS = 150
+STRESS_FRAMES = 600
 
 # Scoring
 SCORE_INTERCEPT = 25
@@ -177,6 +195,9 @@ class Battery:
 class Explosion:
     """An explosion that destroys enemy missiles."""
 
+    # Glow sprites by radius, drawn fully opaque and faded with set_alpha
+    glow_cache: Dict[int, pygame.Surface] = {}
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -212,9 +233,13 @@ class Explosion:
 
         # Outer glow
         if current_radius > 5:
-            glow_surface = pygame.Surface((current_radius * 2, current_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*COLOR_ORANGE, alpha // 2),
-                             (current_radius, current_radius), current_radius)
+            glow_surface = Explosion.glow_cache.get(current_radius)
+            if glow_surface is None:
+                glow_surface = pygame.Surface((current_radius * 2, current_radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surface, COLOR_ORANGE,
+                                 (current_radius, current_radius), current_radius)
+                Explosion.glow_cache[current_radius] = glow_surface
+            glow_surface.set_alpha(alpha // 2)
             surface.blit(glow_surface, (center[0] - current_radius, center[1] - current_radius))
 
         # Main explosion
@@ -228,10 +253,53 @@ class Explosion:
         pygame.draw.circle(surface, COLOR_RED, center, current_radius, 2)
 
     def affects_position(self, pos: Vector2) -> bool:
+        return self.affects_point(pos.x, pos.y)
+
+    def affects_point(self, x: float, y: float) -> bool:
         if not self.active:
             return False
-        explosion_pos = Vector2(self.x, self.y)
-        return explosion_pos.distance_to(pos) <= self.radius
+        dx = x - self.x
+        dy = y - self.y
+        return dx * dx + dy * dy <= self.radius * self.radius
+
+
+class SpatialGrid:
+    """Coarse uniform grid for explosion and missile lookups, rebuilt as needed."""
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], list] = {}
+
+    def clear(self) -> None:
+        self.cells.clear()
+
+    def insert(self, item, x: float, y: float, radius: float = 0.0) -> None:
+        """Add an item to every cell its bounding box overlaps."""
+        cs = self.cell_size
+        cells = self.cells
+        for cx in range(int((x - radius) // cs), int((x + radius) // cs) + 1):
+            for cy in range(int((y - radius) // cs), int((y + radius) // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    bucket.append(item)
+
+    def query(self, x: float, y: float, radius: float = 0.0) -> list:
+        """Items in the cells a circle overlaps (may contain duplicates)."""
+        cs = self.cell_size
+        x0, x1 = int((x - radius) // cs), int((x + radius) // cs)
+        y0, y1 = int((y - radius) // cs), int((y + radius) // cs)
+        if x0 == x1 and y0 == y1:
+            return self.cells.get((x0, y0), [])
+
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
 
 
 class InterceptorMissile:
@@ -273,70 +341,134 @@ class InterceptorMissile:
         pygame.draw.circle(surface, COLOR_WHITE, end, 3)
 
 
-class EnemyMissile:
-    """An incoming enemy missile targeting cities or batteries."""
-
-    def __init__(self, speed_multiplier: float = 1.0):
-        # Start from top of screen
-        self.start_pos = Vector2(random.uniform(50, SCREEN_WIDTH - 50), 0)
-
-        # Choose target (city or battery)
-        targets = []
-        for city in game_state['cities']:
-            if city.alive:
-                targets.append(city.get_center())
-        for battery in game_state['batteries']:
-            if battery.active:
-                targets.append(battery.get_position())
-
-        if not targets:
-            self.target_pos = Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 50)
-        else:
-            self.target_pos = random.choice(targets)
-
-        self.current_pos = Vector2(self.start_pos.x, self.start_pos.y)
-        self.speed = ENEMY_MISSILE_BASE_SPEED * speed_multiplier
-        self.active = True
-        self.trail_points: List[Tuple[float, float]] = []
+def choose_target() -> Vector2:
+    """Pick a random living city or battery to aim at."""
+    targets = []
+    for city in game_state['cities']:
+        if city.alive:
+            targets.append(city.get_center())
+    for battery in game_state['batteries']:
+        if battery.active:
+            targets.append(battery.get_position())
 
-        # Calculate velocity
-        direction = Vector2(self.target_pos.x - self.start_pos.x,
-                          self.target_pos.y - self.start_pos.y)
-        self.velocity = direction.normalize() * self.speed
+    if not targets:
+        return Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 50)
+    return random.choice(targets)
 
-    def update(self) -> None:
-        if not self.active:
-            return
 
-        # Store trail point
-        self.trail_points.append((self.current_pos.x, self.current_pos.y))
-        if len(self.trail_points) > 20:
-            self.trail_points.pop(0)
+class EnemyMissiles:
+    """All incoming enemy missiles, stored as parallel arrays.
 
-        self.current_pos = self.current_pos + self.velocity
+    Missile i lives at index i of every list, and removal swaps the last
+    missile into the freed index. Each trail is a ring of ENEMY_TRAIL_LENGTH
+    points in the flat trail_x/trail_y lists starting at i * ENEMY_TRAIL_LENGTH.
+    A split_y below zero means the missile is not a MIRV.
+    """
 
-        # Check if reached target or off screen
-        if (self.current_pos.y >= SCREEN_HEIGHT or
-            self.current_pos.x < 0 or
-            self.current_pos.x > SCREEN_WIDTH):
-            self.active = False
+    def __init__(self):
+        self.x: List[float] = []
+        self.y: List[float] = []
+        self.vx: List[float] = []
+        self.vy: List[float] = []
+        self.speed: List[float] = []
+        self.split_y: List[float] = []
+        self.trail_x: List[float] = []
+        self.trail_y: List[float] = []
+        self.trail_head: List[int] = []
+        self.trail_len: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def spawn(self, speed_multiplier: float = 1.0, mirv: bool = False) -> None:
+        """Launch a missile from the top of the screen at a city or battery."""
+        x = random.uniform(50, SCREEN_WIDTH - 50)
+        split_y = random.uniform(MIRV_SPLIT_MIN_Y, MIRV_SPLIT_MAX_Y) if mirv else -1.0
+        self.launch(x, 0, choose_target(), ENEMY_MISSILE_BASE_SPEED * speed_multiplier, split_y)
+
+    def launch(self, x: float, y: float, target: Vector2, speed: float, split_y: float = -1.0) -> None:
+        """Add a missile heading from (x, y) toward target."""
+        velocity = Vector2(target.x - x, target.y - y).normalize() * speed
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(velocity.x)
+        self.vy.append(velocity.y)
+        self.speed.append(speed)
+        self.split_y.append(split_y)
+        self.trail_x.extend([0.0] * ENEMY_TRAIL_LENGTH)
+        self.trail_y.extend([0.0] * ENEMY_TRAIL_LENGTH)
+        self.trail_head.append(0)
+        self.trail_len.append(0)
+
+    def remove(self, i: int) -> None:
+        """Swap-remove missile i."""
+        last = len(self.x) - 1
+        if i != last:
+            for array in (self.x, self.y, self.vx, self.vy, self.speed,
+                          self.split_y, self.trail_head, self.trail_len):
+                array[i] = array[last]
+            t = ENEMY_TRAIL_LENGTH
+            self.trail_x[i * t:(i + 1) * t] = self.trail_x[last * t:]
+            self.trail_y[i * t:(i + 1) * t] = self.trail_y[last * t:]
+
+        for array in (self.x, self.y, self.vx, self.vy, self.speed,
+                      self.split_y, self.trail_head, self.trail_len):
+            array.pop()
+        del self.trail_x[last * ENEMY_TRAIL_LENGTH:]
+        del self.trail_y[last * ENEMY_TRAIL_LENGTH:]
+
+    def update(self) -> List[Tuple[float, float]]:
+        """Move every missile and split MIRVs. Returns where missiles hit the ground."""
+        t = ENEMY_TRAIL_LENGTH
+        xs, ys = self.x, self.y
+        landed = []
+        splits = []
+
+        # Backwards, so a swap-removed slot is filled by an already-updated missile
+        for i in range(len(xs) - 1, -1, -1):
+            # Store trail point
+            head = self.trail_head[i]
+            self.trail_x[i * t + head] = xs[i]
+            self.trail_y[i * t + head] = ys[i]
+            self.trail_head[i] = (head + 1) % t
+            if self.trail_len[i] < t:
+                self.trail_len[i] += 1
+
+            xs[i] += self.vx[i]
+            ys[i] += self.vy[i]
+
+            # Check if reached target or off screen
+            if ys[i] >= SCREEN_HEIGHT or xs[i] < 0 or xs[i] > SCREEN_WIDTH:
+                landed.append((xs[i], ys[i]))
+                self.remove(i)
+            elif 0 <= self.split_y[i] <= ys[i]:
+                splits.append((xs[i], ys[i], self.speed[i]))
+                self.remove(i)
+
+        for x, y, speed in splits:
+            for _ in range(MIRV_WARHEADS):
+                self.launch(x, y, choose_target(), speed)
+
+        return landed
 
     def draw(self, surface: pygame.Surface) -> None:
-        if not self.active or len(self.trail_points) < 2:
-            return
+        t = ENEMY_TRAIL_LENGTH
+        for i in range(len(self.x)):
+            count = self.trail_len[i]
+            if count < 2:
+                continue
 
-        # Draw trail
-        if len(self.trail_points) >= 2:
-            points = [(int(x), int(y)) for x, y in self.trail_points]
+            # Draw trail, oldest point first
+            base = i * t
+            start = self.trail_head[i] - count
+            points = [(int(self.trail_x[base + (start + k) % t]), int(self.trail_y[base + (start + k) % t]))
+                      for k in range(count)]
             pygame.draw.lines(surface, COLOR_RED, False, points, 2)
 
-        # Draw missile head
-        head = (int(self.current_pos.x), int(self.current_pos.y))
-        pygame.draw.circle(surface, COLOR_WHITE, head, 4)
-        pygame.draw.circle(surface, COLOR_RED, head, 2)
-
-    def get_position(self) -> Vector2:
-        return self.current_pos
+            # Draw missile head
+            head = (int(self.x[i]), int(self.y[i]))
+            pygame.draw.circle(surface, COLOR_WHITE, head, 4)
+            pygame.draw.circle(surface, COLOR_RED, head, 2)
 
 
 # Global game state for enemy missile target selection
@@ -364,13 +496,16 @@ class Game:
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 32)
 
+        self.explosion_grid = SpatialGrid()
+        self.missile_grid = SpatialGrid()
+
         self.reset_game()
 
     def reset_game(self) -> None:
         """Reset game to initial state."""
         self.cities: List[City] = []
         self.batteries: List[Battery] = []
-        self.enemy_missiles: List[EnemyMissile] = []
+        self.enemy_missiles = EnemyMissiles()
         self.interceptor_missiles: List[InterceptorMissile] = []
         self.explosions: List[Explosion] = []
         self.score = 0
@@ -520,7 +655,8 @@ class Game:
                 spawn_interval = max(30, ENEMY_MISSILE_SPAWN_BASE - self.wave_number * 5)
                 if self.enemies_spawned == 0 or random.randint(0, spawn_interval) < 10:
                     speed_multiplier = 1.0 + self.wave_number * 0.1
-                    self.enemy_missiles.append(EnemyMissile(speed_multiplier))
+                    mirv_chance = (self.wave_number - MIRV_START_WAVE + 1) * MIRV_CHANCE_PER_WAVE
+                    self.enemy_missiles.spawn(speed_multiplier, random.random() < mirv_chance)
                     self.enemies_spawned += 1
             elif len(self.enemy_missiles) == 0:
                 # Wave complete
@@ -535,54 +671,90 @@ class Game:
                 self.interceptor_missiles.remove(interceptor)
 
         # Update explosions
-        for explosion in self.explosions[:]:
+        for explosion in self.explosions:
             explosion.update()
-            if not explosion.active:
-                self.explosions.remove(explosion)
+        self.explosions = [explosion for explosion in self.explosions if explosion.active]
 
         # Update enemy missiles
-        for enemy in self.enemy_missiles[:]:
-            enemy.update()
-
-            if not enemy.active:
-                # Check if it hit something
-                enemy_pos = enemy.get_position()
-                hit_city = False
-                hit_battery = False
-
-                # Check city collisions
-                for city in self.cities:
-                    if city.alive and city.get_rect().collidepoint(enemy_pos.x, enemy_pos.y):
-                        city.alive = False
-                        hit_city = True
-                        self.explosions.append(Explosion(city.x + city.width / 2,
-                                                         city.y + city.height / 2))
-                        break
-
-                # Check battery collisions
-                if not hit_city:
-                    for battery in self.batteries:
-                        if battery.active:
-                            bat_rect = pygame.Rect(battery.x, battery.y - 15,
-                                                 battery.width, battery.height + 15)
-                            if bat_rect.collidepoint(enemy_pos.x, enemy_pos.y):
-                                battery.active = False
-                                hit_battery = True
-                                self.explosions.append(Explosion(battery.x + battery.width / 2,
-                                                                 battery.y))
-                                break
-
-                self.enemy_missiles.remove(enemy)
-                continue
+        for x, y in self.enemy_missiles.update():
+            # Check if it hit something
+            hit_city = False
+
+            # Check city collisions
+            for city in self.cities:
+                if city.alive and city.get_rect().collidepoint(x, y):
+                    city.alive = False
+                    hit_city = True
+                    self.explosions.append(Explosion(city.x + city.width / 2,
+                                                     city.y + city.height / 2))
+                    break
+
+            # Check battery collisions
+            if not hit_city:
+                for battery in self.batteries:
+                    if battery.active:
+                        bat_rect = pygame.Rect(battery.x, battery.y - 15,
+                                             battery.width, battery.height + 15)
+                        if bat_rect.collidepoint(x, y):
+                            battery.active = False
+                            self.explosions.append(Explosion(battery.x + battery.width / 2,
+                                                             battery.y))
+                            break
+
+        self.resolve_intercepts()
+
+    def resolve_intercepts(self) -> None:
+        """Destroy missiles inside explosions, chaining their blasts in one pass.
+
+        Every destroyed missile detonates where it was. Its blast is checked
+        right away against the remaining missiles (bucketed by cell), so a
+        whole chain reaction settles within the frame it started.
+        """
+        missiles = self.enemy_missiles
+        count = len(missiles)
+        if count == 0 or not self.explosions:
+            return
 
-            # Check explosion collisions
-            for explosion in self.explosions:
-                if explosion.active and explosion.affects_position(enemy.get_position()):
-                    self.score += SCORE_INTERCEPT
-                    self.wave_score += SCORE_INTERCEPT
-                    self.enemy_missiles.remove(enemy)
+        xs, ys = missiles.x, missiles.y
+        grid = self.explosion_grid
+        grid.clear()
+        for explosion in self.explosions:
+            grid.insert(explosion, explosion.x, explosion.y, explosion.radius)
+
+        destroyed = [False] * count
+        pending = []
+        for i in range(count):
+            for explosion in grid.query(xs[i], ys[i]):
+                if explosion.affects_point(xs[i], ys[i]):
+                    destroyed[i] = True
+                    pending.append(i)
                     break
 
+        if not pending:
+            return
+
+        missile_grid = self.missile_grid
+        missile_grid.clear()
+        for i in range(count):
+            if not destroyed[i]:
+                missile_grid.insert(i, xs[i], ys[i])
+
+        while pending:
+            i = pending.pop()
+            self.score += SCORE_INTERCEPT
+            self.wave_score += SCORE_INTERCEPT
+
+            blast = Explosion(xs[i], ys[i])
+            self.explosions.append(blast)
+            for j in missile_grid.query(blast.x, blast.y, blast.radius):
+                if not destroyed[j] and blast.affects_point(xs[j], ys[j]):
+                    destroyed[j] = True
+                    pending.append(j)
+
+        for i in range(count - 1, -1, -1):
+            if destroyed[i]:
+                missiles.remove(i)
+
     def end_wave(self) -> None:
         """End current wave and calculate bonuses."""
         self.wave_in_progress = False
@@ -619,8 +791,7 @@ class Game:
             battery.draw(self.screen)
 
         # Draw enemy missiles
-        for enemy in self.enemy_missiles:
-            enemy.draw(self.screen)
+        self.enemy_missiles.draw(self.screen)
 
         # Draw interceptors
         for interceptor in self.interceptor_missiles:
@@ -751,8 +922,51 @@ class Game:
         pygame.quit()
 
 
+def run_stress_test(mirvs: int = STRESS_MIRVS, frames: int = STRESS_FRAMES) -> None:
+    """Late-wave benchmark: a sky full of MIRVs and interceptor chain reactions."""
+    random.seed(0)
+    game = Game()
+    game.start_wave()
+    game.wave_number = WAVE_COUNT
+    game.enemies_spawned = game.enemies_per_wave
+
+    for _ in range(mirvs):
+        game.enemy_missiles.spawn(1.0 + WAVE_COUNT * 0.1, mirv=True)
+
+    total = 0.0
+    worst = 0.0
+    peak = 0
+    for frame in range(frames):
+        # Cities stay up, and an interceptor bursts in the split zone now and then
+        for city in game.cities:
+            city.alive = True
+        if frame % 20 == 0:
+            game.explosions.append(Explosion(random.uniform(0, SCREEN_WIDTH),
+                                             random.uniform(MIRV_SPLIT_MAX_Y, SCREEN_HEIGHT - 100)))
+        if len(game.enemy_missiles) < mirvs:
+            game.enemy_missiles.spawn(1.0 + WAVE_COUNT * 0.1, mirv=True)
+
+        start = time.perf_counter()
+        game.update()
+        game.draw()
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        worst = max(worst, elapsed)
+        peak = max(peak, len(game.enemy_missiles))
+
+    avg_ms = total / frames * 1000
+    print(f"{frames} frames, peak {peak} missiles, score {game.score}")
+    print(f"avg {avg_ms:.2f} ms/frame ({1000 / avg_ms:.0f} FPS), worst {worst * 1000:.2f} ms")
+    pygame.quit()
+
+
 def main():
     """Entry point for the game."""
+    if "--stress" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        run_stress_test()
+        return
+
     game = Game()
     game.run()
 
@@ -22,7 +22,7 @@ class Player:
         self.alive = True
         self.has_key = False
 
-    def update(self, keys, walls, platforms):
+    def update(self, keys, level):
         """Update player position and handle input."""
         if not self.alive:
             return
@@ -48,20 +48,17 @@ class Player:
             self.vel_y = MAX_FALL_SPEED
 
         # Move and collide
-        self._move_and_collide(walls, platforms)
+        self._move_and_collide(level)
 
         # Check if fell in pit
         if self.rect.y > 700:
             self.alive = False
 
-    def _move_and_collide(self, walls, platforms):
-        """Handle movement with collision detection."""
-        # All solid surfaces
-        all_solids = walls + platforms
-
+    def _move_and_collide(self, level):
+        """Handle movement with collision detection against the level's tile grid."""
         # Horizontal
         self.rect.x += self.vel_x
-        for solid in all_solids:
+        for solid in level.get_solids_overlapping(self.rect):
             if self.rect.colliderect(solid):
                 if self.vel_x > 0:
                     self.rect.right = solid.left
@@ -71,7 +68,7 @@ class Player:
         # Vertical
         self.rect.y += self.vel_y
         self.on_ground = False
-        for solid in all_solids:
+        for solid in level.get_solids_overlapping(self.rect):
             if self.rect.colliderect(solid):
                 if self.vel_y > 0:
                     self.rect.bottom = solid.top
@@ -76,15 +76,9 @@ class Game:
             self.level.update_walls(current_time)
             self.next_wall_shift = current_time + 10000
 
-        # Get all collision objects
-        walls = self.level.get_wall_rects() + self.level.get_shifting_wall_rects()
-        visible_platforms = self.level.get_platform_rects()
-        invisible_platforms = self.level.get_all_invisible_platform_rects()
-        all_platforms = visible_platforms + invisible_platforms
-
-        # Update player
+        # Update player against the level's collision grid
         keys = pygame.key.get_pressed()
-        self.player.update(keys, walls, all_platforms)
+        self.player.update(keys, self.level)
 
         # Update ghosts
         ghost_watch_states = []
@@ -5,7 +5,12 @@ from config import TILE_SIZE
 
 
 class Level:
-    """Manages level layout, shifting walls, and invisible platforms."""
+    """Manages level layout, shifting walls, and invisible platforms.
+
+    Solid tiles are indexed in flat occupancy grids, one per shifting wall
+    phase, so collision and neighborhood queries only visit the tiles around
+    the query rect. Tile rects are built once and shared by every query.
+    """
 
     def __init__(self):
         self.walls = []
@@ -17,6 +22,7 @@ class Level:
         self.wall_shift_patterns = []
 
         self._build_level()
+        self._build_grid()
 
     def _build_level(self):
         """Construct the ghost house level layout."""
@@ -128,6 +134,46 @@ class Level:
                     rects.append((x * TILE_SIZE, y1 * TILE_SIZE))
         return rects
 
+    def _build_grid(self):
+        """Index every tile in occupancy grids and prebuild the shared rects."""
+        phase_tiles = [self._convert_layout_to_rects(p) for p in self.wall_shift_patterns]
+        static_tiles = self.walls + self.platforms + self.invisible_platforms
+        all_tiles = static_tiles + [tile for tiles in phase_tiles for tile in tiles]
+        self.cols = max(x for x, _ in all_tiles) // TILE_SIZE + 1
+        self.rows = max(y for _, y in all_tiles) // TILE_SIZE + 1
+
+        self.tile_rects = [pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                           for row in range(self.rows) for col in range(self.cols)]
+
+        static = bytearray(self.cols * self.rows)
+        for x, y in static_tiles:
+            static[self._cell(x, y)] = 1
+
+        # One combined solid layer and wall rect list per shift phase
+        self.phase_solids = []
+        self.phase_wall_rects = []
+        for tiles in phase_tiles:
+            solid = bytearray(static)
+            for x, y in tiles:
+                solid[self._cell(x, y)] = 1
+            self.phase_solids.append(solid)
+            self.phase_wall_rects.append([self.tile_rects[self._cell(x, y)] for x, y in tiles])
+
+        self.invisible = bytearray(self.cols * self.rows)
+        for x, y in self.invisible_platforms:
+            self.invisible[self._cell(x, y)] = 1
+
+        self.wall_rects = [self.tile_rects[self._cell(x, y)] for x, y in self.walls]
+        self.platform_rects = [self.tile_rects[self._cell(x, y)] for x, y in self.platforms]
+        self.invisible_rects = [self.tile_rects[self._cell(x, y)] for x, y in self.invisible_platforms]
+
+        self.solid = self.phase_solids[self.shift_phase]
+        self.shifting_wall_rects = self.phase_wall_rects[self.shift_phase]
+
+    def _cell(self, x, y):
+        """Flat grid index of the tile at pixel position (x, y)."""
+        return (y // TILE_SIZE) * self.cols + x // TILE_SIZE
+
     def update_walls(self, current_time):
         """Update shifting walls based on time."""
         phase_index = (current_time // 10000) % len(self.wall_shift_patterns)
@@ -135,35 +181,59 @@ class Level:
             self.shift_phase = phase_index
             pattern = self.wall_shift_patterns[phase_index]
             self.shifting_walls = self._convert_layout_to_rects(pattern)
+            self.solid = self.phase_solids[phase_index]
+            self.shifting_wall_rects = self.phase_wall_rects[phase_index]
 
     def get_wall_rects(self):
         """Get all wall rects as pygame.Rect objects."""
-        return [pygame.Rect(x, y, TILE_SIZE, TILE_SIZE) for x, y in self.walls]
+        return self.wall_rects
 
     def get_shifting_wall_rects(self):
         """Get shifting wall rects."""
-        return [pygame.Rect(x, y, TILE_SIZE, TILE_SIZE) for x, y in self.shifting_walls]
+        return self.shifting_wall_rects
 
     def get_platform_rects(self):
         """Get visible platform rects."""
-        return [pygame.Rect(x, y, TILE_SIZE, TILE_SIZE) for x, y in self.platforms]
+        return self.platform_rects
+
+    def get_solids_overlapping(self, rect):
+        """Get the solid tile rects that rect overlaps in the current phase."""
+        col_lo = max(0, rect.left // TILE_SIZE)
+        col_hi = min(self.cols - 1, (rect.right - 1) // TILE_SIZE)
+        row_lo = max(0, rect.top // TILE_SIZE)
+        row_hi = min(self.rows - 1, (rect.bottom - 1) // TILE_SIZE)
+
+        solids = []
+        for row in range(row_lo, row_hi + 1):
+            base = row * self.cols
+            for cell in range(base + col_lo, base + col_hi + 1):
+                if self.solid[cell]:
+                    solids.append(self.tile_rects[cell])
+        return solids
 
     def get_nearby_invisible_platforms(self, player_rect, radius_tiles):
         """Get invisible platforms within radius of player."""
-        nearby = []
-        player_center = player_rect.center
+        cx, cy = player_rect.center
         radius = radius_tiles * TILE_SIZE
+        half = TILE_SIZE // 2
 
-        for x, y in self.invisible_platforms:
-            plat_rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-            plat_center = plat_rect.center
-            dist = ((plat_center[0] - player_center[0]) ** 2 +
-                   (plat_center[1] - player_center[1]) ** 2) ** 0.5
-            if dist <= radius:
-                nearby.append(plat_rect)
+        # Only tiles whose centers can fall inside the radius are checked
+        col_lo = max(0, (cx - radius - half) // TILE_SIZE)
+        col_hi = min(self.cols - 1, (cx + radius - half) // TILE_SIZE)
+        row_lo = max(0, (cy - radius - half) // TILE_SIZE)
+        row_hi = min(self.rows - 1, (cy + radius - half) // TILE_SIZE)
 
+        nearby = []
+        for row in range(row_lo, row_hi + 1):
+            dy = row * TILE_SIZE + half - cy
+            base = row * self.cols
+            for col in range(col_lo, col_hi + 1):
+                if self.invisible[base + col]:
+                    dx = col * TILE_SIZE + half - cx
+                    if dx * dx + dy * dy <= radius * radius:
+                        nearby.append(self.tile_rects[base + col])
         return nearby
 
     def get_all_invisible_platform_rects(self):
         """Get all invisible platform rects (for collision)."""
-        return [pygame.Rect(x, y, TILE_SIZE, TILE_SIZE) for x, y in self.invisible_platforms]
+        return self.invisible_rects
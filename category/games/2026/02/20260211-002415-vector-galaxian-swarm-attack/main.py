@@ -3,12 +3,14 @@ Vector Galaxian Swarm Attack
 Defend the starship against tactical alien swarms in this high-intensity vector shooter.
 """
 
+import os
+import sys
+import time
 import pygame
 import random
 import math
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
 
 
 # Constants
@@ -56,6 +58,15 @@ ENEMY_SPACING_X = 50
 ENEMY_SPACING_Y = 45
 FORMATION_START_X = (SCREEN_WIDTH - COLUMNS * ENEMY_SPACING_X) // 2 + 25
 FORMATION_START_Y = 80
+FORMATION_SWAY = 5
+
+# Dive paths
+DIVE_CURVE_SAMPLES = 64  # Bezier samples used to measure arc length
+DIVE_LUT_SIZE = 64  # Equal arc-length steps stored per dive
+
+# Stress mode
+STRESS_ROWS = 12
+STRESS_FRAMES = 600
 
 
 class EnemyType(Enum):
@@ -70,10 +81,50 @@ class DiveState(Enum):
     RETURNING = 2
 
 
-@dataclass
-class BezierPoint:
-    x: float
-    y: float
+class DivePath:
+    """Quadratic Bezier dive curve baked into an arc-length lookup table.
+
+    Points are stored at equal distances along the curve, so advancing the
+    progress by a fixed amount moves the enemy at a constant speed.
+    """
+
+    def __init__(self, p0: Tuple[float, float], p1: Tuple[float, float], p2: Tuple[float, float]):
+        (x0, y0), (x1, y1), (x2, y2) = p0, p1, p2
+
+        # Sample the curve and accumulate its length
+        sample_x = []
+        sample_y = []
+        lengths = [0.0]
+        for i in range(DIVE_CURVE_SAMPLES + 1):
+            t = i / DIVE_CURVE_SAMPLES
+            u = 1 - t
+            sample_x.append(u * u * x0 + 2 * u * t * x1 + t * t * x2)
+            sample_y.append(u * u * y0 + 2 * u * t * y1 + t * t * y2)
+            if i > 0:
+                lengths.append(lengths[-1] + math.hypot(sample_x[i] - sample_x[i - 1],
+                                                        sample_y[i] - sample_y[i - 1]))
+        self.length = lengths[-1]
+
+        # Resample at equal arc-length steps
+        self.xs = [x0]
+        self.ys = [y0]
+        seg = 1
+        for k in range(1, DIVE_LUT_SIZE + 1):
+            target = self.length * k / DIVE_LUT_SIZE
+            while seg < DIVE_CURVE_SAMPLES and lengths[seg] < target:
+                seg += 1
+            span = lengths[seg] - lengths[seg - 1]
+            f = (target - lengths[seg - 1]) / span if span > 0 else 0.0
+            self.xs.append(sample_x[seg - 1] + (sample_x[seg] - sample_x[seg - 1]) * f)
+            self.ys.append(sample_y[seg - 1] + (sample_y[seg] - sample_y[seg - 1]) * f)
+
+    def point_at(self, progress: float) -> Tuple[float, float]:
+        """Position at a fraction of the path's arc length."""
+        pos = max(0.0, min(1.0, progress)) * DIVE_LUT_SIZE
+        i = min(int(pos), DIVE_LUT_SIZE - 1)
+        f = pos - i
+        return (self.xs[i] + (self.xs[i + 1] - self.xs[i]) * f,
+                self.ys[i] + (self.ys[i + 1] - self.ys[i]) * f)
 
 
 class Enemy:
@@ -101,8 +152,8 @@ class Enemy:
         self.velocity_x = 0.0
         self.velocity_y = 0.0
 
-        # Bezier curve for diving
-        self.control_points: List[BezierPoint] = []
+        # Baked bezier curve for diving
+        self.dive_path: Optional[DivePath] = None
         self.dive_speed = 0.01
 
         # Shooting
@@ -118,6 +169,8 @@ class Enemy:
         # Escort tracking (for flagship)
         self.escort_leader: Optional['Enemy'] = None
         self.escort_offset: Tuple[float, float] = (0, 0)
+        self.escorts: List['Enemy'] = []
+        self.alive = True
 
     def _get_width(self) -> int:
         if self.type == EnemyType.FLAGSHIP:
@@ -145,19 +198,21 @@ class Enemy:
         self.dive_state = DiveState.DIVING
         self.dive_progress = 0.0
 
+        self.escorts = []
+
         # Setup bezier curve points
         # Start at current position
-        start = BezierPoint(self.x, self.y)
+        start = (self.x, self.y)
 
         # Control point for curve (creates diving arc)
         control_x = self.x + (target_x - self.x) * 0.3
         control_y = self.y + (SCREEN_HEIGHT - self.y) * 0.5
-        control = BezierPoint(control_x, control_y)
+        control = (control_x, control_y)
 
         # End point (below player)
-        end = BezierPoint(target_x, target_y)
+        end = (target_x, target_y)
 
-        self.control_points = [start, control, end]
+        self.dive_path = DivePath(start, control, end)
 
         # Dive speed based on enemy type
         base_speed = 0.015
@@ -174,11 +229,16 @@ class Enemy:
         self.escort_offset = (offset_x, offset_y)
         self.dive_state = DiveState.DIVING
         self.dive_progress = leader.dive_progress
-        self.control_points = leader.control_points
+        self.dive_path = leader.dive_path
         self.dive_speed = leader.dive_speed
+        leader.escorts.append(self)
+
+    def update(self, dt: float, player_x: float, player_y: float,
+               formation_xs: List[float]) -> Optional['EnemyBullet']:
+        """Update enemy state and return bullet if fired.
 
-    def update(self, dt: float, player_x: float, player_y: float) -> Optional['EnemyBullet']:
-        """Update enemy state and return bullet if fired."""
+        formation_xs holds this frame's swayed x position of each column.
+        """
         bullet = None
 
         # Update shoot timer
@@ -191,8 +251,7 @@ class Enemy:
 
         if self.dive_state == DiveState.IN_FORMATION:
             # Sway in formation
-            sway_offset = math.sin(pygame.time.get_ticks() * 0.001) * 5
-            self.x = self.formation_x + sway_offset
+            self.x = formation_xs[self.grid_x]
             self.y = self.formation_y
 
             # Update dive timer
@@ -206,7 +265,8 @@ class Enemy:
 
         elif self.dive_state == DiveState.DIVING:
             # Follow escort leader if applicable
-            if self.escort_leader and self.escort_leader.dive_state == DiveState.DIVING:
+            leader = self.escort_leader
+            if leader and leader.alive and leader.dive_state == DiveState.DIVING:
                 self.dive_progress = self.escort_leader.dive_progress
             else:
                 self.dive_progress += self.dive_speed
@@ -217,9 +277,7 @@ class Enemy:
                 # Dive complete, return to formation
                 self.dive_state = DiveState.RETURNING
             else:
-                pos = self._bezier_point(self.dive_progress)
-                self.x = pos.x
-                self.y = pos.y
+                self.x, self.y = self.dive_path.point_at(self.dive_progress)
 
                 # Add escort offset
                 if self.escort_leader:
@@ -245,19 +303,6 @@ class Enemy:
 
         return bullet
 
-    def _bezier_point(self, t: float) -> BezierPoint:
-        """Calculate point on quadratic bezier curve."""
-        if len(self.control_points) != 3:
-            return BezierPoint(self.x, self.y)
-
-        p0, p1, p2 = self.control_points
-
-        # Quadratic bezier formula
-        x = (1 - t) ** 2 * p0.x + 2 * (1 - t) * t * p1.x + t ** 2 * p2.x
-        y = (1 - t) ** 2 * p0.y + 2 * (1 - t) * t * p1.y + t ** 2 * p2.y
-
-        return BezierPoint(x, y)
-
     def _shoot_at_player(self, player_x: float, player_y: float) -> 'EnemyBullet':
         """Calculate bullet trajectory toward player."""
         dx = player_x - self.x
@@ -533,7 +578,10 @@ class Game:
 
     def __init__(self):
         pygame.init()
-        pygame.mixer.init()
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            pass  # No audio device; play silently
 
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Vector Galaxian Swarm Attack")
@@ -547,6 +595,10 @@ class Game:
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
 
+        # Formation column positions; swayed copies are refreshed every frame
+        self.column_xs = [FORMATION_START_X + col * ENEMY_SPACING_X for col in range(COLUMNS)]
+        self.formation_xs = list(self.column_xs)
+
         self.reset_game()
 
     def reset_game(self) -> None:
@@ -679,49 +731,35 @@ class Game:
         if random.random() < 0.003:  # Approximately twice per 10 seconds at 60 FPS
             self._trigger_flagship_dive()
 
-        # Update enemies
+        # Update formation positions from a single sway offset
+        sway = math.sin(pygame.time.get_ticks() * 0.001) * FORMATION_SWAY
+        formation_xs = self.formation_xs
+        for col, x in enumerate(self.column_xs):
+            formation_xs[col] = x + sway
+
+        # Update enemies and bucket them by column for bullet checks
         player_rect = self.player.get_rect()
+        columns: Dict[int, List[Enemy]] = {}
 
-        for enemy in self.enemies[:]:
-            bullet = enemy.update(dt, self.player.x, self.player.y)
+        for enemy in self.enemies:
+            bullet = enemy.update(dt, self.player.x, self.player.y, formation_xs)
 
             if bullet:
                 self.enemy_bullets.append(bullet)
 
-            enemy_rect = enemy.get_rect()
+            columns.setdefault(self._column_of(enemy.x), []).append(enemy)
 
-            # Check collision with player bullets
-            for player_bullet in self.player_bullets[:]:
-                if player_bullet.active and enemy_rect.colliderect(player_bullet.get_rect()):
-                    # Check for flagship escort bonus
-                    score_add = enemy.get_score_value()
-                    is_escort = enemy.escort_leader is not None
-                    leader_destroyed = False
+        # Check collision with player bullets
+        for player_bullet in self.player_bullets:
+            if player_bullet.active:
+                self._check_bullet_hit(player_bullet, columns)
 
-                    if is_escort and enemy.escort_leader in self.enemies:
-                        # Escort destroyed, check if leader still alive
-                        pass
-                    elif enemy.type == EnemyType.FLAGSHIP:
-                        # Check if any escorts are active
-                        active_escorts = [e for e in self.enemies
-                                        if e.escort_leader == enemy]
-                        if len(active_escorts) >= 2:
-                            # Flagship with escorts destroyed = bonus
-                            score_add += FLAGSHIP_ESCORT_BONUS
-                            leader_destroyed = True
-
-                    self.score += score_add
-                    self.explosions.append(Explosion(enemy.x, enemy.y,
-                                                    enemy.type == EnemyType.FLAGSHIP))
-                    self.enemies.remove(enemy)
-                    player_bullet.active = False
-                    break
-
-            # Check collision with player
-            if enemy not in self.enemies:
-                continue
-
-            if enemy_rect.colliderect(player_rect):
+        if any(not enemy.alive for enemy in self.enemies):
+            self.enemies = [enemy for enemy in self.enemies if enemy.alive]
+
+        # Check collision with player
+        for enemy in self.enemies:
+            if enemy.get_rect().colliderect(player_rect):
                 if self.player.hit():
                     self.lives -= 1
                     self.explosions.append(Explosion(self.player.x, self.player.y, True))
@@ -754,6 +792,37 @@ class Game:
                     self._init_enemies()
                     self.wave_clear_timer = 0
 
+    def _column_of(self, x: float) -> int:
+        """Formation column nearest to an x position (may be off the grid)."""
+        return int((x - FORMATION_START_X + ENEMY_SPACING_X / 2) // ENEMY_SPACING_X)
+
+    def _check_bullet_hit(self, player_bullet: PlayerBullet, columns: Dict[int, List[Enemy]]) -> None:
+        """Destroy the first enemy hit by a bullet, searching only nearby columns."""
+        bullet_rect = player_bullet.get_rect()
+        col = self._column_of(player_bullet.x)
+
+        for c in (col - 1, col, col + 1):
+            for enemy in columns.get(c, ()):
+                if not enemy.alive or not enemy.get_rect().colliderect(bullet_rect):
+                    continue
+
+                # Check for flagship escort bonus
+                score_add = enemy.get_score_value()
+                if enemy.type == EnemyType.FLAGSHIP:
+                    # Check if any escorts are active
+                    active_escorts = [e for e in enemy.escorts
+                                      if e.alive and e.escort_leader is enemy]
+                    if len(active_escorts) >= 2:
+                        # Flagship with escorts destroyed = bonus
+                        score_add += FLAGSHIP_ESCORT_BONUS
+
+                self.score += score_add
+                self.explosions.append(Explosion(enemy.x, enemy.y,
+                                                enemy.type == EnemyType.FLAGSHIP))
+                enemy.alive = False
+                player_bullet.active = False
+                return
+
     def draw(self) -> None:
         """Draw all game elements."""
         self.screen.fill(COLOR_BLACK)
@@ -851,8 +920,49 @@ class Game:
         pygame.quit()
 
 
+def run_stress_test(rows: int = STRESS_ROWS, frames: int = STRESS_FRAMES) -> None:
+    """Time update() with an enlarged swarm, constant fire and frequent escort dives."""
+    random.seed(0)
+    game = Game()
+    game.enemies = []
+    for row in range(rows):
+        enemy_type = (EnemyType.FLAGSHIP, EnemyType.EMISSARY, EnemyType.DRONE)[min(2, row * 3 // rows)]
+        for col in range(COLUMNS):
+            game.enemies.append(Enemy(enemy_type, col, row))
+    start_count = len(game.enemies)
+
+    total = 0.0
+    worst = 0.0
+    for frame in range(frames):
+        # Keep the player alive, firing and sweeping, and launch escort dives often
+        game.player.invulnerable_timer = 1.0
+        game.player.x = SCREEN_WIDTH / 2 + math.sin(frame * 0.03) * 250
+        if frame % 4 == 0:
+            game.player_bullets.append(PlayerBullet(game.player.x, game.player.y))
+        if frame % 30 == 0:
+            game._trigger_flagship_dive()
+
+        start = time.perf_counter()
+        game.update(1 / FPS)
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        worst = max(worst, elapsed)
+
+    avg_ms = total / frames * 1000
+    diving = sum(1 for e in game.enemies if e.dive_state != DiveState.IN_FORMATION)
+    print(f"{start_count} enemies at start, {len(game.enemies)} left, {diving} diving at end")
+    print(f"update avg {avg_ms:.3f} ms/frame, worst {worst * 1000:.3f} ms")
+    pygame.quit()
+
+
 def main():
     """Entry point for the game."""
+    if "--stress" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        run_stress_test()
+        return
+
     game = Game()
     game.run()
 
@@ -65,6 +65,18 @@ SCORE_PER_SEGMENT = 10
 GAME_OVER_PENALTY = -100
 
 # AI Agent Interface
+NEARBY_SEGMENTS_BEHIND = 5  # Grid cells observed behind the player
+NEARBY_SEGMENTS_AHEAD = 10  # Grid cells observed from the player's cell forward
+SEGMENT_STATE_VALUES = {"gone": 0, "stable": 1, "decaying": 2}
+
+# Scalar fields at the start of get_state(as_array=True), in order
+STATE_VECTOR_FIELDS = (
+    "player_x", "player_y", "velocity_x", "velocity_y", "on_ground", "stamina",
+    "nearest_fireball_x", "nearest_fireball_y", "nearest_cheep_x", "nearest_cheep_y",
+    "speed_multiplier", "distance_traveled",
+)
+STATE_VECTOR_SIZE = len(STATE_VECTOR_FIELDS) + NEARBY_SEGMENTS_BEHIND + NEARBY_SEGMENTS_AHEAD
+
 STATE_SPACE = {
     "player_x": "float - player x position relative to bridge",
     "player_y": "float - player y position",
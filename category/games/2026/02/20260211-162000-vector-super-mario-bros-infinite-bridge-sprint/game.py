@@ -2,7 +2,8 @@
 
 import pygame
 import random
-import math
+from collections import deque
+import numpy as np
 from config import *
 from entities import BridgeSegment, Player, Fireball, CheepCheep
 
@@ -31,7 +32,8 @@ class BridgeSprintGame:
 
         # Entities
         self.player = None
-        self.bridge_segments = []
+        self.bridge_segments = deque()  # Contiguous run of segments in grid order
+        self.first_grid_x = 0  # Grid index of bridge_segments[0]
         self.fireballs = []
         self.cheeps = []
 
@@ -50,7 +52,8 @@ class BridgeSprintGame:
         self.player = Player(PLAYER_START_X, PLAYER_START_Y)
 
         # Create initial bridge
-        self.bridge_segments = []
+        self.bridge_segments = deque()
+        self.first_grid_x = 0
         for i in range(VISIBLE_SEGMENTS + 5):
             x = i * SEGMENT_WIDTH
             segment = BridgeSegment(x, BRIDGE_Y)
@@ -72,6 +75,20 @@ class BridgeSprintGame:
 
         self.bridge_segments.append(segment)
 
+    def segment_at(self, grid_x):
+        """Get the bridge segment at a grid index, or None if it is not stored."""
+        index = grid_x - self.first_grid_x
+        if 0 <= index < len(self.bridge_segments):
+            return self.bridge_segments[index]
+        return None
+
+    def prune_segments(self):
+        """Drop segments that have fallen behind the camera."""
+        cutoff = self.offset_x - SEGMENT_WIDTH * 2
+        while self.bridge_segments and self.bridge_segments[0].x <= cutoff:
+            self.bridge_segments.popleft()
+            self.first_grid_x += 1
+
     def spawn_enemy(self):
         """Spawn fireballs and cheep cheeps."""
         # Spawn fireball
@@ -127,14 +144,10 @@ class BridgeSprintGame:
         """Get bridge segments near the player for AI observation."""
         nearby = []
         player_grid_x = int(self.player.x // SEGMENT_WIDTH)
-        for offset in range(-5, 10):
-            grid_x = player_grid_x + offset
-            for segment in self.bridge_segments:
-                seg_grid_x = int(segment.x // SEGMENT_WIDTH)
-                if seg_grid_x == grid_x:
-                    state_val = 0 if segment.state == "gone" else (1 if segment.state == "stable" else 2)
-                    nearby.append(state_val)
-                    break
+        for offset in range(-NEARBY_SEGMENTS_BEHIND, NEARBY_SEGMENTS_AHEAD):
+            segment = self.segment_at(player_grid_x + offset)
+            if segment is not None:
+                nearby.append(SEGMENT_STATE_VALUES[segment.state])
         return nearby
 
     def get_nearest_enemy(self, enemies):
@@ -144,7 +157,7 @@ class BridgeSprintGame:
 
         for enemy in enemies:
             if enemy.active:
-                dist = math.sqrt((enemy.x - self.player.x)**2 + (enemy.y - self.player.y)**2)
+                dist = (enemy.x - self.player.x) ** 2 + (enemy.y - self.player.y) ** 2
                 if dist < nearest_dist:
                     nearest_dist = dist
                     nearest_x = (enemy.x - self.offset_x) / SCREEN_WIDTH
@@ -154,12 +167,40 @@ class BridgeSprintGame:
             return 1.0, 1.0
         return nearest_x, nearest_y
 
-    def get_state(self):
-        """Get current game state for AI agent."""
-        nearby_segments = self.get_nearby_segments()
+    def get_state(self, as_array=False):
+        """Get current game state for AI agent.
+
+        With as_array=True the state is a float32 vector of STATE_VECTOR_SIZE
+        values laid out as STATE_VECTOR_FIELDS, followed by one entry per grid
+        cell from NEARBY_SEGMENTS_BEHIND behind the player to
+        NEARBY_SEGMENTS_AHEAD ahead. Cells with no stored segment read as gone.
+        """
         fb_x, fb_y = self.get_nearest_enemy(self.fireballs)
         cheep_x, cheep_y = self.get_nearest_enemy(self.cheeps)
 
+        if as_array:
+            values = [
+                (self.player.x - self.offset_x) / SCREEN_WIDTH,
+                self.player.y / SCREEN_HEIGHT,
+                self.player.vel_x / MOVE_SPEED,
+                self.player.vel_y / JUMP_FORCE,
+                self.player.on_ground,
+                self.player.stamina / STAMINA_MAX,
+                fb_x,
+                fb_y,
+                cheep_x,
+                cheep_y,
+                self.speed_multiplier,
+                self.distance_traveled / 1000,
+            ]
+            player_grid_x = int(self.player.x // SEGMENT_WIDTH)
+            for offset in range(-NEARBY_SEGMENTS_BEHIND, NEARBY_SEGMENTS_AHEAD):
+                segment = self.segment_at(player_grid_x + offset)
+                values.append(0 if segment is None else SEGMENT_STATE_VALUES[segment.state])
+            return np.array(values, dtype=np.float32)
+
+        nearby_segments = self.get_nearby_segments()
+
         return {
             "player_x": (self.player.x - self.offset_x) / SCREEN_WIDTH,
             "player_y": self.player.y / SCREEN_HEIGHT,
@@ -205,16 +246,18 @@ class BridgeSprintGame:
         for segment in self.bridge_segments:
             segment.update()
 
-        # Trigger decay for segments player has passed
+        # Trigger decay for segments player has passed, which are all at
+        # the front of the deque
         player_grid_x = int(self.player.x // SEGMENT_WIDTH)
-        for segment in self.bridge_segments:
-            seg_grid_x = int(segment.x // SEGMENT_WIDTH)
-            if seg_grid_x < player_grid_x - 2 and segment.state == "stable":
+        passed = min(len(self.bridge_segments), player_grid_x - 2 - self.first_grid_x)
+        for i in range(passed):
+            segment = self.bridge_segments[i]
+            if segment.state == "stable":
                 if random.random() < 0.3:
                     segment.trigger_decay()
 
         # Remove old segments and generate new ones
-        self.bridge_segments = [s for s in self.bridge_segments if s.x > self.offset_x - SEGMENT_WIDTH * 2]
+        self.prune_segments()
         while len(self.bridge_segments) < VISIBLE_SEGMENTS + 5:
             self.generate_bridge_segment()
 
@@ -34,6 +34,7 @@ POOKA_MOVE_DELAY = 15  # Frames between Pooka moves
 FYGAR_MOVE_DELAY = 18  # Frames between Fygar moves
 FYGAR_BREATH_RANGE = 4  # Range of Fygar fire breath
 FYGAR_BREATH_COOLDOWN = 180  # Frames between fire breaths
+GHOST_SOIL_COST = 3  # Path cost of a soil cell for ghost-mode Pookas
 
 # Rock settings
 FALL_DELAY = 30  # Frames before rock starts falling
@@ -161,6 +161,7 @@ class Grid:
         self.cols = cols
         self.rows = rows
         self.cells = [[0 for _ in range(rows)] for _ in range(cols)]
+        self.version = 0  # Bumped on every dig so path caches can tell the layout changed
         self.rocks: list[Rock] = []
         self._initialize_level()
 
@@ -210,6 +211,7 @@ class Grid:
     def dig(self, x: int, y: int) -> bool:
         if self.is_soil(x, y):
             self.cells[x][y] = 1
+            self.version += 1
             return True
         return False
 
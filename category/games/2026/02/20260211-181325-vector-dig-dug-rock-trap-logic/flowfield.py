@@ -0,0 +1,110 @@
+"""Flow fields that route enemies toward the player for Dig Dug Rock Trap Logic."""
+
+import heapq
+from collections import deque
+from typing import List, Optional, Tuple
+
+from config import *
+
+
+class FlowField:
+    """Distance maps to the player with a precomputed next step per cell.
+
+    The tunnel field is a BFS over dug cells. The ghost field is a Dijkstra
+    over every cell where entering soil costs GHOST_SOIL_COST. Both are only
+    rebuilt when the player changes cell or the grid is dug, so every enemy
+    reads its next step in O(1).
+    """
+
+    def __init__(self, cols: int, rows: int):
+        self.cols = cols
+        self.rows = rows
+        size = cols * rows
+        self.tunnel_dist: List[int] = [-1] * size
+        self.tunnel_next: List[Optional[Tuple[int, int]]] = [None] * size
+        self.ghost_dist: List[int] = [-1] * size
+        self.ghost_next: List[Optional[Tuple[int, int]]] = [None] * size
+        self.target: Optional[Tuple[int, int]] = None
+        self.grid_version = -1
+
+        # Neighbor cell indices, built once
+        self.neighbors: List[List[int]] = []
+        for x in range(cols):
+            for y in range(rows):
+                cells = []
+                for dx, dy in DIRECTIONS.values():
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < cols and 0 <= ny < rows:
+                        cells.append(nx * rows + ny)
+                self.neighbors.append(cells)
+
+    def update(self, grid, target_x: int, target_y: int):
+        """Rebuild both fields if the player moved or the grid was dug."""
+        target = (target_x, target_y)
+        if target == self.target and grid.version == self.grid_version:
+            return
+
+        self.target = target
+        self.grid_version = grid.version
+        self._build_tunnel_field(grid, target_x * self.rows + target_y)
+        self._build_ghost_field(grid, target_x * self.rows + target_y)
+
+    def _cell(self, idx: int) -> Tuple[int, int]:
+        return divmod(idx, self.rows)
+
+    def _build_tunnel_field(self, grid, source: int):
+        """BFS outward from the player through tunnel cells."""
+        dist = [-1] * (self.cols * self.rows)
+        next_step: List[Optional[Tuple[int, int]]] = [None] * (self.cols * self.rows)
+        rows = self.rows
+        cells = grid.cells
+
+        dist[source] = 0
+        queue = deque([source])
+        while queue:
+            idx = queue.popleft()
+            step = self._cell(idx)
+            for n in self.neighbors[idx]:
+                if dist[n] != -1 or cells[n // rows][n % rows] != CELL_TUNNEL:
+                    continue
+                dist[n] = dist[idx] + 1
+                next_step[n] = step
+                queue.append(n)
+
+        self.tunnel_dist = dist
+        self.tunnel_next = next_step
+
+    def _build_ghost_field(self, grid, source: int):
+        """Dijkstra outward from the player where soil cells cost extra to enter."""
+        dist = [-1] * (self.cols * self.rows)
+        next_step: List[Optional[Tuple[int, int]]] = [None] * (self.cols * self.rows)
+        rows = self.rows
+        cells = grid.cells
+
+        dist[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, idx = heapq.heappop(heap)
+            if d > dist[idx]:
+                continue
+            x, y = self._cell(idx)
+            # Cost of stepping from a neighbor into this cell
+            cost = 1 if cells[x][y] == CELL_TUNNEL else GHOST_SOIL_COST
+            for n in self.neighbors[idx]:
+                nd = d + cost
+                if dist[n] == -1 or nd < dist[n]:
+                    dist[n] = nd
+                    next_step[n] = (x, y)
+                    heapq.heappush(heap, (nd, n))
+
+        self.ghost_dist = dist
+        self.ghost_next = next_step
+
+    def next_step(self, x: int, y: int, ghost: bool = False) -> Optional[Tuple[int, int]]:
+        """Next cell toward the player, or None if unreachable or already there."""
+        idx = x * self.rows + y
+        return self.ghost_next[idx] if ghost else self.tunnel_next[idx]
+
+    def tunnel_distance(self, x: int, y: int) -> int:
+        """Tunnel steps to the player, or -1 if not connected by tunnel."""
+        return self.tunnel_dist[x * self.rows + y]
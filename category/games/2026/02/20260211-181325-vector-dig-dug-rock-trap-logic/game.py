@@ -7,6 +7,7 @@ from typing import Optional, List, Dict, Any
 
 from config import *
 from entities import *
+from flowfield import FlowField
 
 
 class Game:
@@ -23,6 +24,7 @@ class Game:
     def reset(self):
         """Reset the game to initial state."""
         self.grid = Grid(GRID_COLS, GRID_ROWS)
+        self.flow_field = FlowField(GRID_COLS, GRID_ROWS)
         self.player = Player(GRID_COLS // 2, GRID_ROWS // 2)
         self.enemies: List[Enemy] = []
         self._spawn_enemies()
@@ -231,6 +233,8 @@ class Game:
 
     def update_enemies(self):
         """Update enemy AI."""
+        self.flow_field.update(self.grid, self.player.pos.x, self.player.pos.y)
+
         for enemy in self.enemies:
             if not enemy.alive:
                 continue
@@ -244,55 +248,34 @@ class Game:
             if not enemy.can_move():
                 continue
 
-            # Simple chase AI
-            dx = 0
-            dy = 0
-
-            if enemy.pos.x < self.player.pos.x:
-                dx = 1
-            elif enemy.pos.x > self.player.pos.x:
-                dx = -1
-
-            if enemy.pos.y < self.player.pos.y:
-                dy = 1
-            elif enemy.pos.y > self.player.pos.y:
-                dy = -1
-
-            # Prefer axis with larger distance
-            if abs(self.player.pos.x - enemy.pos.x) > abs(self.player.pos.y - enemy.pos.y):
-                dy = 0
-            else:
-                dx = 0
+            is_pooka = isinstance(enemy, Pooka)
 
-            new_x = enemy.pos.x + dx
-            new_y = enemy.pos.y + dy
+            # Ghosts solidify once they reach a tunnel connected to the player
+            if is_pooka and enemy.ghost_mode and self.flow_field.tunnel_distance(enemy.pos.x, enemy.pos.y) > 0:
+                enemy.ghost_mode = False
 
-            # Check if can move
-            can_move = False
+            # Follow the flow field: tunnels only, or through soil in ghost mode
+            step = self.flow_field.next_step(enemy.pos.x, enemy.pos.y, is_pooka and enemy.ghost_mode)
+            can_move = step is not None
 
-            # Can move in tunnels
-            if self.grid.is_tunnel(new_x, new_y):
-                can_move = True
-            # Pookas can move through soil in ghost mode
-            elif isinstance(enemy, Pooka) and enemy.ghost_mode:
-                can_move = True
+            if can_move and is_pooka and enemy.ghost_mode and self.grid.is_soil(*step):
                 # Randomly exit ghost mode
                 if random.random() < 0.02:
                     enemy.ghost_mode = False
 
             # Randomly enter ghost mode if stuck
-            if not can_move and isinstance(enemy, Pooka) and not enemy.ghost_mode:
+            if not can_move and is_pooka and not enemy.ghost_mode:
                 if random.random() < 0.01:
                     enemy.ghost_mode = True
-                    can_move = True
+                    step = self.flow_field.next_step(enemy.pos.x, enemy.pos.y, True)
+                    can_move = step is not None
 
             # Check for rock collision
-            if can_move and self.grid.is_occupied_by_rock(new_x, new_y):
+            if can_move and self.grid.is_occupied_by_rock(*step):
                 can_move = False
 
             if can_move:
-                enemy.pos.x = new_x
-                enemy.pos.y = new_y
+                enemy.pos.x, enemy.pos.y = step
                 enemy.reset_move_counter()
 
             # Fygar fire breath
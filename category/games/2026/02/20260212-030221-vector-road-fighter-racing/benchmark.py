@@ -0,0 +1,53 @@
+"""Throughput benchmark for driving Road Fighter Racing through step_ai."""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from game import Game
+
+BENCH_STEPS = 20000
+BENCH_SEED = 1234
+
+# (label, headless, action_repeat)
+MODES = [
+    ("rendered", False, 1),
+    ("headless", True, 1),
+    ("headless x4", True, 4),
+]
+
+
+def run_mode(headless: bool, action_repeat: int, steps: int, seed: int) -> tuple:
+    """Run a seeded random policy and return (steps, frames, episodes, seconds)."""
+    game = Game(headless=headless, seed=seed, action_repeat=action_repeat)
+    policy = random.Random(seed)
+    game.start_episode()
+
+    frames = 0
+    episodes = 1
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, _, done = game.step_ai(policy.choice((0, 1, 2, 2, 2, 4)))
+        game.draw()
+        if done:
+            frames += game.frame
+            game.start_episode()
+            episodes += 1
+    elapsed = time.perf_counter() - start
+    return steps, frames + game.frame, episodes, elapsed
+
+
+def main():
+    """Print steps/second for rendered and headless play."""
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else BENCH_STEPS
+    for label, headless, action_repeat in MODES:
+        done_steps, frames, episodes, elapsed = run_mode(headless, action_repeat, steps, BENCH_SEED)
+        print(f"{label:12s} {done_steps / elapsed:10.0f} steps/s  "
+              f"{frames / elapsed:10.0f} frames/s  ({episodes} episodes)")
+
+
+if __name__ == "__main__":
+    main()
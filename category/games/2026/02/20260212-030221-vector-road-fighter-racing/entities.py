@@ -92,12 +92,13 @@ class Player:
 
 
 class Enemy:
-    def __init__(self, distance: float, erratic: bool = False):
+    def __init__(self, distance: float, erratic: bool = False, rng: Optional[random.Random] = None):
+        self.rng = rng if rng is not None else random
         self.distance = distance
-        self.lane = random.randint(0, NUM_LANES - 1)
-        self.speed = random.uniform(ENEMY_SPEED_MIN, ENEMY_SPEED_MAX)
+        self.lane = self.rng.randint(0, NUM_LANES - 1)
+        self.speed = self.rng.uniform(ENEMY_SPEED_MIN, ENEMY_SPEED_MAX)
         self.erratic = erratic
-        self.change_lane_timer = random.randint(60, 180)
+        self.change_lane_timer = self.rng.randint(60, 180)
         self.width = ENEMY_WIDTH
         self.height = ENEMY_HEIGHT
 
@@ -125,11 +126,11 @@ class Enemy:
         if self.erratic:
             self.change_lane_timer -= 1
             if self.change_lane_timer <= 0:
-                direction = random.choice([-1, 1])
+                direction = self.rng.choice([-1, 1])
                 new_lane = self.lane + direction
                 if 0 <= new_lane < NUM_LANES:
                     self.lane = new_lane
-                self.change_lane_timer = random.randint(60, 180)
+                self.change_lane_timer = self.rng.randint(60, 180)
 
     def is_visible(self, player_distance: float) -> bool:
         y = self.get_screen_y(player_distance)
@@ -137,9 +138,9 @@ class Enemy:
 
 
 class FuelTank:
-    def __init__(self, distance: float):
+    def __init__(self, distance: float, rng: Optional[random.Random] = None):
         self.distance = distance
-        self.lane = random.randint(0, NUM_LANES - 1)
+        self.lane = (rng if rng is not None else random).randint(0, NUM_LANES - 1)
         self.width = FUEL_WIDTH
         self.height = FUEL_HEIGHT
         self.collected = False
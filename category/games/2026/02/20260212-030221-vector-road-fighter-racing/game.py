@@ -3,27 +3,40 @@
 import pygame
 import random
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from config import *
 from entities import Player, Enemy, FuelTank
 
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("Road Fighter Racing")
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-        self.tiny_font = pygame.font.Font(None, 18)
+    def __init__(self, headless: bool = False, seed: Optional[int] = None, action_repeat: int = 1):
+        """Create the game.
+
+        A headless game opens no window and loads no fonts, and draw() does
+        nothing, so step_ai runs as fast as the simulation allows. Enemy and
+        fuel spawns draw from a private RNG seeded with seed.
+        """
+        self.headless = headless
+        self.action_repeat = action_repeat
+        self.rng = random.Random(seed)
+
+        if not headless:
+            pygame.init()
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+            pygame.display.set_caption("Road Fighter Racing")
+            self.clock = pygame.time.Clock()
+            self.font = pygame.font.Font(None, 36)
+            self.small_font = pygame.font.Font(None, 24)
+            self.tiny_font = pygame.font.Font(None, 18)
 
         self.reset()
         self.game_state = STATE_MENU
 
-    def reset(self):
-        """Reset the game to initial state."""
+    def reset(self, seed: Optional[int] = None):
+        """Reset the game to initial state, reseeding the spawn RNG if a seed is given."""
+        if seed is not None:
+            self.rng.seed(seed)
         self.player = Player()
         self.enemies: List[Enemy] = []
         self.fuel_tanks: List[FuelTank] = []
@@ -32,6 +45,7 @@ class Game:
         self.fuel_spawn_timer = 0
         self.road_offset = 0.0
         self.difficulty = 1.0
+        self.frame = 0
 
     def get_observation(self) -> Dict[str, Any]:
         """Get current game state for AI agents."""
@@ -67,8 +81,33 @@ class Game:
             "game_state": self.game_state
         }
 
-    def step_ai(self, action: int) -> tuple:
-        """Execute AI action and return (observation, reward, done)."""
+    def start_episode(self, seed: Optional[int] = None) -> Dict[str, Any]:
+        """Reset straight into play, skipping the menu, and return the first observation."""
+        self.reset(seed)
+        self.game_state = STATE_PLAYING
+        return self.get_observation()
+
+    def step_ai(self, action: int, action_repeat: Optional[int] = None) -> tuple:
+        """Execute AI action and return (observation, reward, done).
+
+        The action is held for action_repeat frames (the game's default when
+        None), except that a lane change is only applied on the first frame.
+        Rewards are summed and stepping stops early once the episode ends.
+        """
+        repeat = self.action_repeat if action_repeat is None else action_repeat
+        reward = 0.0
+        done = False
+        for frame in range(repeat):
+            held = action if frame == 0 or action in (2, 3) else 4
+            reward += self._step_frame(held)
+            done = self.game_state in [STATE_GAME_OVER, STATE_WIN]
+            if done:
+                break
+
+        return self.get_observation(), reward, done
+
+    def _step_frame(self, action: int) -> float:
+        """Apply an action for one frame and return its reward."""
         prev_distance = self.player.distance
         prev_fuel = self.player.fuel
         prev_crashing = self.player.crashing
@@ -91,13 +130,11 @@ class Game:
         if self.player.crashing and not prev_crashing:
             reward -= CRASH_PENALTY
 
-        done = self.game_state in [STATE_GAME_OVER, STATE_WIN]
-
-        return self.get_observation(), reward, done
+        return reward
 
     def _spawn_enemy(self):
         """Spawn a new enemy ahead of the player."""
-        spawn_distance = self.player.distance + WINDOW_HEIGHT + random.randint(50, 200)
+        spawn_distance = self.player.distance + WINDOW_HEIGHT + self.rng.randint(50, 200)
 
         # Check if spawn position is clear
         for enemy in self.enemies:
@@ -106,14 +143,14 @@ class Game:
 
         # Difficulty increases over time
         erratic_chance = 0.1 + (self.player.distance / TARGET_DISTANCE) * 0.3
-        erratic = random.random() < erratic_chance
+        erratic = self.rng.random() < erratic_chance
 
-        self.enemies.append(Enemy(spawn_distance, erratic))
+        self.enemies.append(Enemy(spawn_distance, erratic, self.rng))
 
     def _spawn_fuel(self):
         """Spawn a fuel tank ahead of the player."""
-        spawn_distance = self.player.distance + WINDOW_HEIGHT + random.randint(100, 300)
-        self.fuel_tanks.append(FuelTank(spawn_distance))
+        spawn_distance = self.player.distance + WINDOW_HEIGHT + self.rng.randint(100, 300)
+        self.fuel_tanks.append(FuelTank(spawn_distance, self.rng))
 
     def _check_collisions(self):
         """Check for collisions between entities."""
@@ -140,6 +177,7 @@ class Game:
         if self.game_state != STATE_PLAYING:
             return
 
+        self.frame += 1
         self.player.update()
 
         # Update road offset for scrolling effect
@@ -350,6 +388,9 @@ class Game:
 
     def draw(self):
         """Render the game."""
+        if self.headless:
+            return
+
         if self.game_state == STATE_MENU:
             self.draw_menu()
         else:
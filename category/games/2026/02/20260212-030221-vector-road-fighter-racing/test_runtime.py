@@ -3,161 +3,6 @@
 import sys
 import os
 
-# Mock pygame for headless testing
-class MockPygame:
-    QUIT = 1
-    KEYDOWN = 2
-    K_ESCAPE = 27
-    K_SPACE = 32
-    K_LEFT = 276
-    K_RIGHT = 275
-    K_UP = 273
-    K_DOWN = 274
-    K_r = 114
-    SRCALPHA = 0
-
-    def __init__(self):
-        self.initialized = False
-        self.screen_surface = None
-        self.display_set = False
-        self.clock_created = False
-        self.fonts_created = 0
-
-    def init(self):
-        self.initialized = True
-        return None
-
-    class display:
-        @staticmethod
-        def set_mode(size):
-            return MockSurface(size)
-
-        @staticmethod
-        def set_caption(title):
-            pass
-
-        @staticmethod
-        def flip():
-            pass
-
-    def display_set_mode(self, size):
-        self.display_set = True
-        return MockSurface(size)
-
-    def display_set_caption(self, title):
-        pass
-
-    def time_get_ticks(self):
-        return 0
-
-    def time_Clock(self):
-        self.clock_created = True
-        return MockClock()
-
-    def font_Font(self, name, size):
-        self.fonts_created += 1
-        return MockFont()
-
-    def event_get(self):
-        return []
-
-    def key_get_pressed(self):
-        return {}
-
-    def display_flip(self):
-        pass
-
-    def quit(self):
-        pass
-
-    class time:
-        @staticmethod
-        def get_ticks():
-            return 0
-
-        @staticmethod
-        def Clock():
-            return MockClock()
-
-    class font:
-        @staticmethod
-        def Font(name, size):
-            return MockFont()
-
-    def time_get_ticks(self):
-        return 0
-
-    def time_Clock(self):
-        self.clock_created = True
-        return MockClock()
-
-    def draw_line(self, surface, color, start, end, width):
-        pass
-
-    def draw_rect(self, surface, color, rect, width=0):
-        pass
-
-    def Surface(self, size, flags=0):
-        return MockSurface(size)
-
-
-class MockSurface:
-    def __init__(self, size):
-        self.size = size
-        self.width = size[0]
-        self.height = size[1]
-
-    def fill(self, color):
-        pass
-
-    def blit(self, source, dest):
-        pass
-
-
-class MockClock:
-    def tick(self, fps):
-        return 16
-
-
-class MockFont:
-    def __init__(self):
-        self.size = 24
-
-    def render(self, text, antialias, color):
-        return MockSurface((len(text) * 10, self.size))
-
-    def get_width(self):
-        return 100
-
-    def get_height(self):
-        return 20
-
-
-class MockRect:
-    def __init__(self, x, y, w, h):
-        self.x, self.y, self.w, self.h = x, y, w, h
-        self.width = w
-        self.height = h
-
-    def colliderect(self, other):
-        return False
-
-
-# Replace pygame module
-sys.modules['pygame'] = MockPygame()
-sys.modules['pygame'].QUIT = 1
-sys.modules['pygame'].KEYDOWN = 2
-sys.modules['pygame'].K_ESCAPE = 27
-sys.modules['pygame'].K_SPACE = 32
-sys.modules['pygame'].K_LEFT = 276
-sys.modules['pygame'].K_RIGHT = 275
-sys.modules['pygame'].K_UP = 273
-sys.modules['pygame'].K_DOWN = 274
-sys.modules['pygame'].K_r = 114
-sys.modules['pygame'].SRCALPHA = 0
-sys.modules['pygame'].Rect = MockRect
-
-# Now import the game modules
 from config import *
 from entities import Player, Enemy, FuelTank
 from game import Game
@@ -173,7 +18,7 @@ def analyze_game():
 
     # Test 1: Import and initialization
     try:
-        game = Game()
+        game = Game(headless=True)
         results["tests"].append({
             "name": "Game Initialization",
             "status": "PASSED",
@@ -310,7 +155,7 @@ def analyze_game():
 
     # Test 5: Game state management
     try:
-        game = Game()
+        game = Game(headless=True)
         tests_passed = 0
         tests_total = 0
 
@@ -410,6 +255,51 @@ def analyze_game():
             "error": str(e)
         })
 
+    # Test 8: Headless fast-forward
+    try:
+        tests_passed = 0
+        tests_total = 0
+
+        def rollout(seed):
+            game = Game(headless=True, seed=seed, action_repeat=4)
+            game.start_episode()
+            trace = []
+            for step in range(500):
+                obs, reward, done = game.step_ai(step % 5)
+                trace.append((game.frame, game.player.lane, round(reward, 6), len(obs["enemies"])))
+                if done:
+                    game.start_episode()
+            return trace
+
+        first = rollout(7)
+
+        tests_total += 1
+        if first == rollout(7):  # Same seed replays identically
+            tests_passed += 1
+
+        tests_total += 1
+        if first[0][0] == 4:  # One step advances action_repeat frames
+            tests_passed += 1
+
+        game = Game(headless=True)
+        game.start_episode()
+        game.draw()
+        tests_total += 1
+        if game.game_state == STATE_PLAYING and not hasattr(game, "screen"):
+            tests_passed += 1
+
+        results["tests"].append({
+            "name": "Headless Fast-Forward",
+            "status": "PASSED" if tests_passed == tests_total else "FAILED",
+            "details": f"{tests_passed}/{tests_total} sub-tests passed"
+        })
+    except Exception as e:
+        results["tests"].append({
+            "name": "Headless Fast-Forward",
+            "status": "FAILED",
+            "error": str(e)
+        })
+
     # Calculate overall status
     passed = sum(1 for t in results["tests"] if t.get("status") == "PASSED")
     total = len(results["tests"])
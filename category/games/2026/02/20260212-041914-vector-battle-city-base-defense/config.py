@@ -45,6 +45,7 @@ ENEMY_BULLET_SPEED = 3.0
 ENEMY_MAX_BULLETS = 1
 ENEMY_COOLDOWN = 60
 ENEMY_TOTAL_COUNT = 10
+ENEMY_MAX_ACTIVE = 4
 ENEMY_SPAWN_INTERVAL = 180
 ENEMY_MOVE_CHANGE_INTERVAL = 60
 
@@ -74,3 +75,15 @@ REWARD_HIT_BRICK = 10
 REWARD_DESTROY_ENEMY = 100
 REWARD_LOSE_LIFE = -5
 REWARD_BASE_DESTROYED = -500
+
+# Observation modes: nested Python dict, or preallocated NumPy arrays
+OBS_MODE_DICT = "dict"
+OBS_MODE_ARRAY = "array"
+
+# Fixed array observation layout
+OBS_MAX_ENEMIES = ENEMY_MAX_ACTIVE
+OBS_MAX_BULLETS = PLAYER_MAX_BULLETS + ENEMY_MAX_ACTIVE * ENEMY_MAX_BULLETS
+OBS_PLAYER_FEATURES = 6
+OBS_ENEMY_FEATURES = 6
+OBS_BULLET_FEATURES = 6
+OBS_STATUS_FEATURES = 4
@@ -7,10 +7,11 @@ from typing import List, Dict, Any, Optional
 
 from config import *
 from entities import *
+from observation import ObservationBuffer
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, observation_mode: str = OBS_MODE_DICT):
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Battle City Base Defense")
@@ -18,6 +19,8 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.tiny_font = pygame.font.Font(None, 18)
+        self.observation_mode = observation_mode
+        self.observation = ObservationBuffer()
 
         self.reset()
         self.game_state = STATE_MENU
@@ -33,9 +36,17 @@ class Game:
         self.enemies_spawned = 0
         self.enemies_destroyed = 0
         self.wave = 1
+        self.observation.reset(self.grid)
 
     def get_observation(self) -> Dict[str, Any]:
-        """Get current game state for AI agents."""
+        """Get current game state for AI agents.
+
+        In OBS_MODE_ARRAY the preallocated buffers are filled in place and
+        returned without copying; see ObservationBuffer.fill for the layout.
+        """
+        if self.observation_mode == OBS_MODE_ARRAY:
+            return self.observation.fill(self)
+
         grid_obs = []
         for x in range(GRID_COLS):
             row = []
@@ -136,6 +147,7 @@ class Game:
                 bullets_to_remove.append(bullet)
                 if self.grid.is_destructible(grid_x, grid_y):
                     self.grid.destroy_tile(grid_x, grid_y)
+                    self.observation.set_tile(grid_x, grid_y, Grid.EMPTY)
                     self.score += REWARD_HIT_BRICK
                 continue
 
@@ -203,7 +215,7 @@ class Game:
         if self.enemies_spawned >= ENEMY_TOTAL_COUNT:
             return
 
-        if len(self.enemies) >= 4:
+        if len(self.enemies) >= ENEMY_MAX_ACTIVE:
             return
 
         # Check if spawn position is clear
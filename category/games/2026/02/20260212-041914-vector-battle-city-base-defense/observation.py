@@ -0,0 +1,97 @@
+"""Fixed-layout NumPy observation buffers for Battle City Base Defense."""
+
+from typing import Dict
+
+import numpy as np
+
+from config import *
+from entities import Grid
+
+
+class ObservationBuffer:
+    """Preallocated observation arrays filled in place on every step.
+
+    The tile plane is copied from the grid once per reset and then patched
+    only when a tile is destroyed. ``fill`` returns the same dict of arrays
+    each time, so callers that keep an observation must copy it.
+    """
+
+    def __init__(self):
+        self.tiles = np.zeros((GRID_COLS, GRID_ROWS), dtype=np.uint8)
+        self.player = np.zeros(OBS_PLAYER_FEATURES, dtype=np.float32)
+        self.enemies = np.zeros((OBS_MAX_ENEMIES, OBS_ENEMY_FEATURES), dtype=np.float32)
+        self.bullets = np.zeros((OBS_MAX_BULLETS, OBS_BULLET_FEATURES), dtype=np.float32)
+        self.status = np.zeros(OBS_STATUS_FEATURES, dtype=np.float32)
+        self.arrays: Dict[str, np.ndarray] = {
+            "tiles": self.tiles,
+            "player": self.player,
+            "enemies": self.enemies,
+            "bullets": self.bullets,
+            "status": self.status,
+        }
+
+    def reset(self, grid: Grid):
+        """Copy the full tile layout from a freshly built grid."""
+        self.tiles[:, :] = grid.tiles
+
+    def set_tile(self, grid_x: int, grid_y: int, tile: int):
+        """Patch a single tile after it changes on the grid."""
+        self.tiles[grid_x, grid_y] = tile
+
+    def fill(self, game) -> Dict[str, np.ndarray]:
+        """Write the dynamic game state into the buffers and return them.
+
+        Layouts (positions normalized to the playfield):
+          player:  x, y, dir_x, dir_y, lives, invincible
+          enemies: present, x, y, type, dir_x, dir_y
+          bullets: present, x, y, dir_x, dir_y, is_player
+          status:  base_alive, score, enemies_remaining, playing
+        """
+        width = GRID_COLS * CELL_SIZE
+        height = GRID_ROWS * CELL_SIZE
+
+        player = game.player
+        self.player[:] = ((player.x - GRID_OFFSET_X) / width,
+                          (player.y - GRID_OFFSET_Y) / height,
+                          player.direction[0], player.direction[1],
+                          player.lives, player.invincible > 0)
+
+        enemies = self.enemies
+        bullets = self.bullets
+        n_enemies = 0
+        n_bullets = 0
+
+        for bullet in player.bullets:
+            if n_bullets == OBS_MAX_BULLETS:
+                break
+            bullets[n_bullets] = (1.0,
+                                  (bullet.x - GRID_OFFSET_X) / width,
+                                  (bullet.y - GRID_OFFSET_Y) / height,
+                                  bullet.direction[0], bullet.direction[1], 1.0)
+            n_bullets += 1
+
+        for enemy in game.enemies[:OBS_MAX_ENEMIES]:
+            enemies[n_enemies] = (1.0,
+                                  (enemy.x - GRID_OFFSET_X) / width,
+                                  (enemy.y - GRID_OFFSET_Y) / height,
+                                  enemy.enemy_type, enemy.direction[0], enemy.direction[1])
+            n_enemies += 1
+
+            for bullet in enemy.bullets:
+                if n_bullets == OBS_MAX_BULLETS:
+                    break
+                bullets[n_bullets] = (1.0,
+                                      (bullet.x - GRID_OFFSET_X) / width,
+                                      (bullet.y - GRID_OFFSET_Y) / height,
+                                      bullet.direction[0], bullet.direction[1], 0.0)
+                n_bullets += 1
+
+        # Clear rows left over from entities that no longer exist
+        enemies[n_enemies:] = 0.0
+        bullets[n_bullets:] = 0.0
+
+        self.status[:] = (game.base.alive, game.score,
+                          ENEMY_TOTAL_COUNT - game.enemies_destroyed,
+                          game.game_state == STATE_PLAYING)
+
+        return self.arrays
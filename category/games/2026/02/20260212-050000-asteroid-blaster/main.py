@@ -1,8 +1,13 @@
+import os
+import sys
+import time
 import pygame
 import random
 import math
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from particles import ParticleSystem
 
 # Screen dimensions
 SCREEN_WIDTH = 800
@@ -17,18 +22,114 @@ CYAN = (80, 255, 255)
 YELLOW = (255, 255, 80)
 ORANGE = (255, 165, 80)
 GRAY = (128, 128, 128)
+PARTICLE_COLORS = [WHITE, YELLOW, ORANGE, RED]
 
 # Game constants
 PLAYER_SIZE = 20
 PLAYER_SPEED = 5
 BULLET_SPEED = 10
 BULLET_LIFETIME = 60
+BULLET_RADIUS = 3
 ASTEROID_MIN_SIZE = 15
 ASTEROID_MAX_SIZE = 50
 ASTEROID_MIN_SPEED = 1
 ASTEROID_MAX_SPEED = 3
 SPAWN_INTERVAL = 120  # Frames between asteroid spawns
 
+# Entity pool capacities
+MAX_BULLETS = 4096
+MAX_ASTEROIDS = 8192
+MAX_PARTICLES = 16384
+
+# Broadphase cell size (slightly larger than the biggest asteroid radius)
+COLLISION_CELL_SIZE = 64
+
+# Stress mode: entity counts to benchmark and frames per count
+STRESS_COUNTS = (250, 500, 1000, 2000, 4000)
+STRESS_FRAMES = 120
+
+
+class EntityPool:
+    """Fixed-capacity entity storage with O(1) swap-remove.
+
+    Removal moves the last entity into the freed slot, so order is not
+    preserved. Appends beyond capacity are dropped.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.items: List = [None] * capacity
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator:
+        return iter(self.items[:self.count])
+
+    def append(self, item) -> bool:
+        if self.count >= self.capacity:
+            return False
+        self.items[self.count] = item
+        self.count += 1
+        return True
+
+    def extend(self, items) -> None:
+        for item in items:
+            self.append(item)
+
+    def swap_remove(self, index: int) -> None:
+        last = self.count - 1
+        self.items[index] = self.items[last]
+        self.items[last] = None
+        self.count = last
+
+    def retain(self, keep: Callable) -> None:
+        """Swap-remove every entity for which keep() is false."""
+        items = self.items
+        for i in range(self.count - 1, -1, -1):
+            if not keep(items[i]):
+                self.swap_remove(i)
+
+
+class SpatialHash:
+    """Uniform-grid broadphase, rebuilt every frame."""
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List] = {}
+
+    def clear(self) -> None:
+        self.cells.clear()
+
+    def insert(self, item, x: float, y: float, radius: float) -> None:
+        """Add an item to every cell its bounding box overlaps."""
+        cs = self.cell_size
+        cells = self.cells
+        for cx in range(int((x - radius) // cs), int((x + radius) // cs) + 1):
+            for cy in range(int((y - radius) // cs), int((y + radius) // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    bucket.append(item)
+
+    def query(self, x: float, y: float, radius: float) -> List:
+        """Items in the cells a circle overlaps (may contain duplicates)."""
+        cs = self.cell_size
+        x0, x1 = int((x - radius) // cs), int((x + radius) // cs)
+        y0, y1 = int((y - radius) // cs), int((y + radius) // cs)
+        if x0 == x1 and y0 == y1:
+            return self.cells.get((x0, y0), [])
+
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
 
 @dataclass
 class Vector:
@@ -63,7 +164,7 @@ class Bullet:
             self.active = False
 
     def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.circle(surface, YELLOW, (int(self.x), int(self.y)), 3)
+        pygame.draw.circle(surface, YELLOW, (int(self.x), int(self.y)), BULLET_RADIUS)
 
 
 class Asteroid:
@@ -92,6 +193,7 @@ class Asteroid:
         self.angle = random.uniform(0, math.pi * 2)
         self.rotation = 0
         self.rotation_speed = random.uniform(-0.05, 0.05)
+        self.active = True
 
         # Calculate velocity towards center (with some randomness)
         center_x, center_y = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2
@@ -274,33 +376,6 @@ class Player:
             pygame.draw.polygon(surface, ORANGE, flame_points)
 
 
-class Particle:
-    def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-3, 3)
-        self.vy = random.uniform(-3, 3)
-        self.lifetime = random.randint(20, 40)
-        self.max_lifetime = self.lifetime
-        self.size = random.randint(2, 5)
-        self.color = random.choice([WHITE, YELLOW, ORANGE, RED])
-
-    def update(self) -> None:
-        self.x += self.vx
-        self.y += self.vy
-        self.vx *= 0.98
-        self.vy *= 0.98
-        self.lifetime -= 1
-
-    def draw(self, surface: pygame.Surface) -> None:
-        if self.lifetime > 0:
-            alpha = self.lifetime / self.max_lifetime
-            size = int(self.size * alpha)
-            if size > 0:
-                color = tuple(int(c * alpha) for c in self.color)
-                pygame.draw.circle(surface, color, (int(self.x), int(self.y)), size)
-
-
 class Game:
     def __init__(self):
         pygame.init()
@@ -310,28 +385,29 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         self.large_font = pygame.font.Font(None, 72)
 
+        self.collision_grid = SpatialHash(COLLISION_CELL_SIZE)
+
         self.reset_game()
         self.state = 'menu'  # menu, playing, game_over
 
     def reset_game(self):
         self.player = Player()
-        self.bullets: List[Bullet] = []
-        self.asteroids: List[Asteroid] = []
-        self.particles: List[Particle] = []
+        self.bullets = EntityPool(MAX_BULLETS)
+        self.asteroids = EntityPool(MAX_ASTEROIDS)
+        self.particles = ParticleSystem(MAX_PARTICLES, drag=0.98, shrink=True, fade_alpha=False)
         self.score = 0
         self.spawn_timer = 0
         self.level = 1
 
     def create_explosion(self, x: float, y: float, count: int = 15) -> None:
-        for _ in range(count):
-            self.particles.append(Particle(x, y))
+        self.particles.emit(x, y, count, PARTICLE_COLORS, life=(20, 40), size=(2, 5), spread=3)
 
     def check_collision(self, obj1_x: float, obj1_y: float, obj1_radius: float,
                        obj2_x: float, obj2_y: float, obj2_radius: float) -> bool:
         dx = obj1_x - obj2_x
         dy = obj1_y - obj2_y
-        distance = math.sqrt(dx * dx + dy * dy)
-        return distance < obj1_radius + obj2_radius
+        radii = obj1_radius + obj2_radius
+        return dx * dx + dy * dy < radii * radii
 
     def update(self) -> None:
         if self.state == 'menu':
@@ -347,30 +423,31 @@ class Game:
             self.asteroids.append(Asteroid())
 
         # Update bullets
-        for bullet in self.bullets[:]:
+        for bullet in self.bullets:
             bullet.update()
-            if not bullet.active:
-                self.bullets.remove(bullet)
+        self.bullets.retain(lambda b: b.active)
 
         # Update asteroids
-        for asteroid in self.asteroids[:]:
+        for asteroid in self.asteroids:
             asteroid.update()
-            if asteroid.is_off_screen():
-                self.asteroids.remove(asteroid)
+        self.asteroids.retain(lambda a: not a.is_off_screen())
 
         # Update particles
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
+
+        # Broadphase: bucket asteroids by position
+        grid = self.collision_grid
+        grid.clear()
+        for asteroid in self.asteroids:
+            grid.insert(asteroid, asteroid.x, asteroid.y, asteroid.size)
 
         # Bullet-asteroid collisions
-        for bullet in self.bullets[:]:
-            for asteroid in self.asteroids[:]:
-                if self.check_collision(bullet.x, bullet.y, 3,
-                                      asteroid.x, asteroid.y, asteroid.size):
-                    self.bullets.remove(bullet)
-                    self.asteroids.remove(asteroid)
+        for bullet in self.bullets:
+            for asteroid in grid.query(bullet.x, bullet.y, BULLET_RADIUS):
+                if asteroid.active and self.check_collision(bullet.x, bullet.y, BULLET_RADIUS,
+                                                            asteroid.x, asteroid.y, asteroid.size):
+                    bullet.active = False
+                    asteroid.active = False
                     self.create_explosion(asteroid.x, asteroid.y)
 
                     # Score based on size
@@ -384,15 +461,18 @@ class Game:
 
         # Player-asteroid collisions
         if self.player.active:
-            for asteroid in self.asteroids[:]:
-                if self.check_collision(self.player.x, self.player.y, PLAYER_SIZE * 0.7,
-                                      asteroid.x, asteroid.y, asteroid.size):
+            for asteroid in grid.query(self.player.x, self.player.y, PLAYER_SIZE * 0.7):
+                if asteroid.active and self.check_collision(self.player.x, self.player.y, PLAYER_SIZE * 0.7,
+                                                            asteroid.x, asteroid.y, asteroid.size):
                     if self.player.hit():
                         self.create_explosion(self.player.x, self.player.y, 30)
-                        self.asteroids.remove(asteroid)
+                        asteroid.active = False
                         if self.player.lives <= 0:
                             self.state = 'game_over'
 
+        self.bullets.retain(lambda b: b.active)
+        self.asteroids.retain(lambda a: a.active)
+
         # Level up
         if self.score > self.level * 1000:
             self.level += 1
@@ -427,8 +507,7 @@ class Game:
 
     def draw_game(self) -> None:
         # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        self.particles.draw(self.screen)
 
         # Draw asteroids
         for asteroid in self.asteroids:
@@ -511,7 +590,50 @@ class Game:
         pygame.quit()
 
 
+def run_stress_test(counts: Tuple[int, ...] = STRESS_COUNTS, frames: int = STRESS_FRAMES) -> None:
+    """Bullet-hell benchmark: time update() with N asteroids and N bullets alive.
+
+    Both populations are topped back up to N before every frame. A flat
+    per-entity cost across rows means collision cost scales linearly.
+    """
+    game = Game()
+    game.state = 'playing'
+
+    print(f"{'entities':>10} {'ms/frame':>10} {'us/entity':>10} {'max ms':>10}")
+    for count in counts:
+        random.seed(count)
+        game.reset_game()
+        game.player.invulnerable = frames + 1
+        total = 0.0
+        worst = 0.0
+
+        for _ in range(frames):
+            while len(game.asteroids) < count:
+                game.asteroids.append(Asteroid(random.uniform(0, SCREEN_WIDTH),
+                                               random.uniform(0, SCREEN_HEIGHT)))
+            while len(game.bullets) < count:
+                game.bullets.append(Bullet(random.uniform(0, SCREEN_WIDTH),
+                                           random.uniform(0, SCREEN_HEIGHT),
+                                           random.uniform(0, math.pi * 2)))
+
+            start = time.perf_counter()
+            game.update()
+            elapsed = time.perf_counter() - start
+            total += elapsed
+            worst = max(worst, elapsed)
+
+        avg_ms = total / frames * 1000
+        print(f"{count:>10} {avg_ms:>10.2f} {avg_ms * 1000 / (count * 2):>10.2f} {worst * 1000:>10.2f}")
+
+    pygame.quit()
+
+
 def main():
+    if "--stress" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        run_stress_test()
+        return
+
     game = Game()
     game.run()
 
@@ -56,9 +56,13 @@ PLATFORM_WIDTHS = {
 }
 PLATFORM_HEIGHT = GRID_SIZE - 10
 
+# Game clock: each frame advances the game by FRAME_MS
+FRAME_MS = 1000 / FPS
+
 # Turtle settings
 TURTLE_SUBMERGE_CYCLE = 3000  # ms (3 seconds)
 TURTLE_SUBMERGE_DURATION = 1000  # ms (1 second submerged)
+TURTLE_CYCLE_TICKS = (TURTLE_SUBMERGE_CYCLE + TURTLE_SUBMERGE_DURATION) * FPS // 1000
 TURTLE_SIZE = GRID_SIZE - 14
 
 # Lane configuration: (row, speed, platform_type, size, spacing)
@@ -1,5 +1,7 @@
 """Game entities for Vector Frogger: Logs and Turtles."""
 
+import copy
+from bisect import bisect_right
 import pygame
 from config import *
 
@@ -182,8 +184,12 @@ class Turtle:
             self.x = SCREEN_WIDTH + self.width
 
         # Update submersion cycle
+        self.is_submerged = self.submerged_at(current_time)
+
+    def submerged_at(self, current_time):
+        """Check if the turtle is under water at current_time ms."""
         cycle_time = (current_time + self.cycle_offset) % (TURTLE_SUBMERGE_CYCLE + TURTLE_SUBMERGE_DURATION)
-        self.is_submerged = cycle_time >= TURTLE_SUBMERGE_CYCLE
+        return cycle_time >= TURTLE_SUBMERGE_CYCLE
 
     def draw(self, surface):
         """Draw the turtle."""
@@ -262,8 +268,30 @@ class Platform:
         return getattr(self.entity, 'is_submerged', False)
 
 
+def spans_contain(spans, x):
+    """Check if the frog centred at x has its rect's left edge within spans."""
+    starts, ends = spans
+    left = int(x - FROG_SIZE // 2 + 4)  # Truncated like the frog's Rect
+    i = bisect_right(starts, left) - 1
+    return i >= 0 and left <= ends[i]
+
+
 class Lane:
-    """A horizontal lane containing platforms."""
+    """A horizontal lane containing platforms.
+
+    Lanes compile a periodic timeline of where the frog can stand. Every
+    platform moves at the same constant speed and wraps, so once each has
+    wrapped once the platform spans repeat every `period` ticks. Turtles
+    surface and dive on their own TURTLE_CYCLE_TICKS cycle. For each motion
+    phase and combination of submerged turtles the lane keeps the sorted,
+    merged ranges of frog rect left edges that overlap a surfaced platform,
+    so "is x safe at tick t" is one binary search.
+
+    The timeline is filled in on demand: platform copies are stepped and
+    ranges merged only as far as lookups reach. The game asks for one tick
+    per frame, so a rebuild costs a frame next to nothing and the planner
+    pays for the ticks it searches.
+    """
 
     def __init__(self, row, speed, platform_type, size, spacing):
         self.row = row
@@ -279,20 +307,120 @@ class Lane:
             cycle_offset = i * 500 if platform_type == 'turtle' else 0
             self.platforms.append(Platform(platform_type, row, x, size, speed, cycle_offset))
 
-    def update(self, speed_multiplier=1.0, current_time=0):
-        """Update all platforms in lane."""
+        # Which turtles are under water on each tick of their cycle
+        self.submerged_masks = []
+        for tick in range(TURTLE_CYCLE_TICKS):
+            mask = 0
+            for i, platform in enumerate(self.platforms):
+                if platform.platform_type == 'turtle' and platform.entity.submerged_at(tick * FRAME_MS):
+                    mask |= 1 << i
+            self.submerged_masks.append(mask)
+
+        # Standable timeline, rebuilt whenever the speed multiplier changes
+        self.tick = 0
+        self.start_tick = 0
+        self.multiplier = None
+        self.cycle_start = 0
+        self.period = 1
+        self.rects = []
+        self.spans = {}
+        self.sim = None
+        self.laps = None
+        self.build_timeline(1.0)
+
+    def build_timeline(self, speed_multiplier, game_tick=0):
+        """Restart the standable timeline from the current positions onward.
+
+        game_tick is the game's tick count now, which sets the turtles'
+        place in their submerge cycle.
+        """
+        self.multiplier = speed_multiplier
+        self.start_tick = game_tick
+        self.tick = 0
+
+        self.sim = [copy.copy(platform.entity) for platform in self.platforms]
+        self.rects = [[entity.get_rect() for entity in self.sim]]
+        self.spans = {}
+        if self.base_speed * speed_multiplier == 0:
+            self.cycle_start = 0
+            self.period = 1
+            self.sim = None
+        else:
+            self.cycle_start = None
+            self.period = None
+            self.laps = [[] for _ in self.sim]
+
+    def _float_until(self, tick):
+        """Step the platform copies until tick is recorded or the lap cycle is known."""
+        # Once a platform has come back round the screen it laps with a
+        # fixed period, so the river repeats from the last first lap on.
+        # Float the copies down the lane, noting the tick of each lap.
+        while self.sim is not None and len(self.rects) <= tick:
+            for entity, entity_laps in zip(self.sim, self.laps):
+                before = entity.x
+                entity.update(self.multiplier)
+                if (entity.x - before) * entity.speed < 0:
+                    entity_laps.append(len(self.rects))
+            self.rects.append([entity.get_rect() for entity in self.sim])
+
+            if all(len(entity_laps) >= 2 for entity_laps in self.laps):
+                self.cycle_start = max(entity_laps[0] for entity_laps in self.laps)
+                self.period = self.laps[0][1] - self.laps[0][0]
+                del self.rects[self.cycle_start + self.period:]
+                self.sim = self.laps = None
+
+    def phase(self, tick):
+        """Timeline row for a tick counted from the last rebuild."""
+        self._float_until(tick)
+        if self.cycle_start is None or tick < self.cycle_start:
+            return tick
+        return self.cycle_start + (tick - self.cycle_start) % self.period
+
+    def standable_spans(self, tick):
+        """Sorted (starts, ends) of frog rect left edges on surfaced platforms at tick."""
+        mask = self.submerged_masks[(self.start_tick + tick) % TURTLE_CYCLE_TICKS]
+        key = (self.phase(tick), mask)
+        if key not in self.spans:
+            self.spans[key] = self._merge_spans(self.rects[key[0]], mask)
+        return self.spans[key]
+
+    @staticmethod
+    def _merge_spans(rects, mask):
+        """Merge the frog rect left edges that overlap each platform not in mask."""
+        frog_width = FROG_SIZE - 8
+        ranges = sorted((rect.left - frog_width + 1, rect.right - 1, i)
+                        for i, rect in enumerate(rects))
+        starts, ends = [], []
+        for start, end, i in ranges:
+            if (mask >> i) & 1:
+                continue
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        return starts, ends
+
+    def is_standable(self, x, tick=None):
+        """Check if the frog centred at x is on a surfaced platform at tick."""
+        if tick is None:
+            tick = self.tick
+        return spans_contain(self.standable_spans(tick), x)
+
+    def update(self, speed_multiplier=1.0, game_tick=0):
+        """Update all platforms in lane to game_tick."""
+        if speed_multiplier != self.multiplier:
+            self.build_timeline(speed_multiplier, game_tick - 1)
+        current_time = game_tick * FRAME_MS
         for platform in self.platforms:
             platform.update(speed_multiplier, current_time)
+        self.tick += 1
+
+        # Keep the copies level with the live tick, so a lane the frog has
+        # not looked at for a while does not catch up a whole lap at once
+        self._float_until(self.tick)
 
     def draw(self, surface):
         """Draw all platforms in lane."""
         for platform in self.platforms:
             platform.draw(surface)
-
-    def check_collision(self, frog_rect):
-        """Check if frog collides with any surface platform."""
-        for platform in self.platforms:
-            if platform.get_rect().colliderect(frog_rect):
-                if not platform.is_submerged:
-                    return platform
-        return None
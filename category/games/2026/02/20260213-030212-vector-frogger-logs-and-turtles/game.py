@@ -3,6 +3,7 @@
 import pygame
 from config import *
 from entities import Frog, Lane
+from planner import plan_crossing
 
 
 class Game:
@@ -23,6 +24,7 @@ class Game:
         """Reset the entire game state."""
         self.frog = Frog()
         self.lanes = []
+        self.tick = 0
         self.score = 0
         self.level = 1
         self.lives = 3
@@ -77,16 +79,16 @@ class Game:
         if self.game_over:
             return
 
-        current_time = pygame.time.get_ticks()
+        self.tick += 1
         self.frog.update()
 
         # Update lanes with speed multiplier based on level
-        speed_multiplier = 1.0 + (self.level - 1) * SPEED_INCREMENT / BASE_SPEED
+        speed_multiplier = self._speed_multiplier()
         for lane in self.lanes:
-            lane.update(speed_multiplier, current_time)
+            lane.update(speed_multiplier, self.tick)
 
         # Check collisions and game logic
-        self._check_river_collision(current_time)
+        self._check_river_collision()
 
         # Check if frog reached goal
         if self.frog.grid_y == GOAL_ROW:
@@ -99,9 +101,12 @@ class Game:
         # Time penalty
         self.score += TIME_PENALTY // FPS
 
-    def _check_river_collision(self, current_time):
+    def _speed_multiplier(self):
+        """Platform speed multiplier for the current level."""
+        return 1.0 + (self.level - 1) * SPEED_INCREMENT / BASE_SPEED
+
+    def _check_river_collision(self):
         """Check frog collisions with platforms in river."""
-        frog_rect = self.frog.get_rect()
         frog_row = self.frog.grid_y
 
         # Check if in river zone
@@ -109,13 +114,11 @@ class Game:
             on_platform = False
             for lane in self.lanes:
                 if lane.row == frog_row:
-                    platform = lane.check_collision(frog_rect)
-                    if platform:
+                    if lane.is_standable(self.frog.x):
                         on_platform = True
                         self.frog.on_platform = True
                         # Move frog with platform (speed adjusted by level)
-                        speed_multiplier = 1.0 + (self.level - 1) * SPEED_INCREMENT / BASE_SPEED
-                        self.frog.platform_speed = platform.speed * speed_multiplier
+                        self.frog.platform_speed = lane.base_speed * self._speed_multiplier()
                         break
 
             if not on_platform:
@@ -138,6 +141,10 @@ class Game:
         self.frog.reset()
         self.forward_scored = False
 
+    def plan_river_crossing(self):
+        """Get per-frame actions for the fastest safe crossing from the frog to the goal."""
+        return plan_crossing(self.lanes, self.frog, self._speed_multiplier())
+
     def _death(self):
         """Handle frog death."""
         self.lives -= 1
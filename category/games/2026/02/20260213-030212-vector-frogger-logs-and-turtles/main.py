@@ -1,11 +1,95 @@
 """Entry point for Vector Frogger: Logs and Turtles."""
 
+import os
+import random
+import sys
+import time
 import pygame
+from config import FRAME_MS
 from game import Game
 
+CHECK_SEED = 0
+CHECK_CROSSINGS = 30
+CHECK_MAX_LEVEL = 8
+
+ACTION_KEYS = {
+    'UP': pygame.K_UP,
+    'DOWN': pygame.K_DOWN,
+    'LEFT': pygame.K_LEFT,
+    'RIGHT': pygame.K_RIGHT,
+}
+
+
+def replay_plan(game, plan):
+    """Feed a plan to the game as key presses.
+
+    Returns (crossed without a death, slowest frame in ms).
+    """
+    lives, crossings = game.lives, game.successful_crossings
+    worst = 0.0
+    for action in plan:
+        if action != 'NOOP':
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=ACTION_KEYS[action]))
+        start = time.perf_counter()
+        game.handle_input()
+        game.update()
+        worst = max(worst, (time.perf_counter() - start) * 1000)
+        if game.lives != lives:
+            return False, worst
+    return game.successful_crossings == crossings + 1, worst
+
+
+def run_check(crossings=CHECK_CROSSINGS):
+    """Replay planned crossings, then time the first frame after each level change."""
+    rng = random.Random(CHECK_SEED)
+    game = Game()
+    failures = 0
+
+    planned = replayed = 0
+    plan_time = 0.0
+    worst_frame = 0.0
+    for _ in range(crossings):
+        game.reset_game()
+        game.level = rng.randint(1, CHECK_MAX_LEVEL)
+        for _ in range(rng.randint(0, 400)):
+            game.update()
+
+        start = time.perf_counter()
+        plan = game.plan_river_crossing()
+        plan_time += time.perf_counter() - start
+        if plan is None:
+            continue
+        planned += 1
+        crossed, worst = replay_plan(game, plan)
+        if crossed:
+            replayed += 1
+        worst_frame = max(worst_frame, worst)
+    failures += planned - replayed
+    print(f"replay: {replayed}/{planned} planned crossings reach the goal, "
+          f"planning avg {plan_time / crossings * 1000:.0f} ms, slowest frame {worst_frame:.2f} ms")
+
+    # Lanes rebuild their timelines on the first frame at a new speed
+    game.reset_game()
+    for level in range(2, CHECK_MAX_LEVEL + 1):
+        game.level = level
+        start = time.perf_counter()
+        game.update()
+        elapsed = (time.perf_counter() - start) * 1000
+        if elapsed > FRAME_MS:
+            failures += 1
+        print(f"level {level}: level-up frame {elapsed:.2f} ms (budget {FRAME_MS:.1f} ms)")
+
+    pygame.quit()
+    return failures == 0
+
 
 def main():
     """Launch the game."""
+    if "--check" in sys.argv:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        sys.exit(0 if run_check() else 1)
+
     pygame.init()
     game = Game()
     game.run()
@@ -0,0 +1,154 @@
+"""Fastest river crossing search over lane standable timelines."""
+
+import heapq
+from config import *
+from entities import spans_contain
+
+ACTION_MOVES = {
+    'UP': (0, -1),
+    'DOWN': (0, 1),
+    'LEFT': (-1, 0),
+    'RIGHT': (1, 0),
+}
+
+# Give up on plans that take longer than this many ticks
+MAX_PLAN_TICKS = 1800
+
+# Frog positions within this many pixels of each other count as one state
+PLAN_X_RESOLUTION = 4
+
+
+def plan_crossing(lanes, frog, speed_multiplier, goal_row=GOAL_ROW, max_ticks=MAX_PLAN_TICKS):
+    """
+    Find the fastest way from the frog's current position to goal_row.
+
+    Searches (row, x, tick) with A*, ordered by tick plus a lower bound of
+    one cooldown per row left to hop, so the first plan to reach goal_row
+    arrives earliest. Each tick mirrors one game frame: input may hop the
+    frog to the centre of a neighbouring cell, the frog drifts with the
+    platform it stood on last frame, the lanes advance, and the frog must
+    then be on a surfaced platform in river rows and on screen. A hop locks
+    the frog for FROG_MOVE_COOLDOWN ticks, and every one of those ticks must
+    be safe.
+
+    Frog positions are real numbers, so exact states almost never meet
+    again. States are merged on the row, the frog's position in
+    PLAN_X_RESOLUTION pixel steps and every lane's timeline phase and turtle
+    cycle tick, and only the first of each is expanded. The kept states are
+    followed exactly, so the plan is always safe to replay; the merging can
+    cost a few ticks against the true fastest crossing.
+
+    Args:
+        lanes: river lanes with standable timelines, counted from their current tick
+        frog: the frog, whose position and move cooldown are the start state
+        speed_multiplier: platform speed multiplier the lanes were built with
+        goal_row: row to reach, searched rows lie between it and START_ROW
+        max_ticks: search horizon
+
+    Returns:
+        List of per-frame actions ('UP', 'DOWN', 'LEFT', 'RIGHT', 'NOOP'),
+        or None if no safe crossing exists within max_ticks.
+    """
+    by_row = {lane.row: lane for lane in lanes}
+    drift = {lane.row: lane.base_speed * speed_multiplier for lane in lanes}
+    top, bottom = min(START_ROW, goal_row), max(START_ROW, goal_row)
+
+    spans = {}
+
+    def is_safe(x, row, tick):
+        if x < 0 or x > SCREEN_WIDTH:
+            return False
+        if row not in by_row:
+            return True
+        key = (row, tick)
+        if key not in spans:
+            lane = by_row[row]
+            spans[key] = lane.standable_spans(lane.tick + tick)
+        return spans_contain(spans[key], x)
+
+    phases = {}
+
+    def state_key(row, x, tick):
+        if tick not in phases:
+            phases[tick] = tuple((lane.phase(lane.tick + tick),
+                                  (lane.start_tick + lane.tick + tick) % TURTLE_CYCLE_TICKS)
+                                 for lane in lanes)
+        return row, int(x) // PLAN_X_RESOLUTION, phases[tick]
+
+    def ticks_left(row):
+        # A cooldown per row, except the final hop which ends the plan at once
+        rows = abs(row - goal_row)
+        return (rows - 1) * FROG_MOVE_COOLDOWN + 1
+
+    # Sit out a pending cooldown riding the current platform
+    x, row = frog.x, frog.grid_y
+    for tick in range(1, frog.move_cooldown + 1):
+        x += drift.get(row, 0)
+        if not is_safe(x, row, tick):
+            return None
+
+    # Open states are ready to move; ties go to the later, deeper state
+    start = (row, x, frog.move_cooldown)
+    parents = {start: None}
+    heap = [(start[2] + ticks_left(row), -start[2], row, x)]
+    expanded = set()
+
+    def push(state, next_state, action):
+        if next_state in parents or next_state[2] > max_ticks:
+            return
+        if state_key(*next_state) in expanded:
+            return
+        parents[next_state] = (state, action)
+        row, x, t = next_state
+        heapq.heappush(heap, (t + ticks_left(row), -t, row, x))
+
+    while heap:
+        _, t, row, x = heapq.heappop(heap)
+        t = -t
+        state = (row, x, t)
+        key = state_key(row, x, t)
+        if key in expanded:
+            continue
+        expanded.add(key)
+        ride = drift.get(row, 0)
+
+        # Stay put for one frame
+        if is_safe(x + ride, row, t + 1):
+            push(state, (row, x + ride, t + 1), 'NOOP')
+
+        # Hop to a cell centre, then ride out the cooldown in the new row
+        for action, (dx, dy) in ACTION_MOVES.items():
+            new_col, new_row = int(x // GRID_SIZE) + dx, row + dy
+            if not (0 <= new_col < COLS and top <= new_row <= bottom):
+                continue
+            new_x = new_col * GRID_SIZE + GRID_SIZE // 2 + ride
+            if new_row == goal_row:
+                parents[(new_row, new_x, t + 1)] = (state, action)
+                return _actions_to(parents, (new_row, new_x, t + 1))
+
+            tick = t + 1
+            while is_safe(new_x, new_row, tick):
+                if tick == t + FROG_MOVE_COOLDOWN:
+                    push(state, (new_row, new_x, tick), action)
+                    break
+                tick += 1
+                new_x += drift.get(new_row, 0)
+
+    return None
+
+
+def _actions_to(parents, state):
+    """Expand the parent chain into one action per frame."""
+    actions = []
+    hop = True  # The final hop into the goal row ends the plan at once
+    while parents[state] is not None:
+        prev, action = parents[state]
+        if action != 'NOOP' and not hop:
+            actions.extend(['NOOP'] * (FROG_MOVE_COOLDOWN - 1))
+        hop = False
+        actions.append(action)
+        state = prev
+    actions.reverse()
+
+    # A pending cooldown is waited out before the first move
+    return ['NOOP'] * state[2] + actions
@@ -0,0 +1,133 @@
+"""Grid index and same-color union-find for Vector Balloon Pop Puzzle."""
+
+
+class BalloonGrid:
+    """2D index of balloon slots with same-color components in a union-find.
+
+    Slots are addressed as ``slots[col][row]``. Removals only flag the grid
+    as unsettled; ``settle`` floats the survivors up (also closing any gaps
+    left by generation) and the union-find is rebuilt lazily the next time
+    a component is queried.
+    """
+
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.slots = [[None] * rows for _ in range(cols)]
+        self.count = 0
+        self.needs_settle = False
+        self.parent = list(range(cols * rows))
+        self.size = [1] * (cols * rows)
+        self.members = {}
+        self.components_stale = True
+
+    def in_bounds(self, col, row):
+        """Check whether a slot lies on the grid."""
+        return 0 <= col < self.cols and 0 <= row < self.rows
+
+    def get(self, col, row):
+        """Get the balloon in a slot, or None."""
+        if not self.in_bounds(col, row):
+            return None
+        return self.slots[col][row]
+
+    def place(self, balloon):
+        """Put a balloon into the slot given by its col/row."""
+        if self.slots[balloon.col][balloon.row] is None:
+            self.count += 1
+        self.slots[balloon.col][balloon.row] = balloon
+        self.components_stale = True
+
+    def remove(self, balloon):
+        """Clear a balloon's slot and flag the grid for settling."""
+        if self.slots[balloon.col][balloon.row] is balloon:
+            self.slots[balloon.col][balloon.row] = None
+            self.count -= 1
+            self.needs_settle = True
+            self.components_stale = True
+
+    def column(self, col):
+        """Get the balloons in a column, top to bottom."""
+        return [b for b in self.slots[col] if b is not None]
+
+    def settle(self):
+        """Float balloons up to close gaps and return those that moved."""
+        moved = []
+        for col in range(self.cols):
+            column = self.column(col)
+            slots = self.slots[col]
+            for row in range(self.rows):
+                slots[row] = None
+            for new_row, balloon in enumerate(column):
+                slots[new_row] = balloon
+                if balloon.row != new_row:
+                    balloon.row = new_row
+                    moved.append(balloon)
+        self.needs_settle = False
+        return moved
+
+    def _find(self, idx):
+        """Find the component root with path halving."""
+        parent = self.parent
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    def _union(self, a, b):
+        """Merge two components by size."""
+        ra, rb = self._find(a), self._find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+
+    def _rebuild_components(self):
+        """Rebuild same-color components from the current slots."""
+        rows = self.rows
+        self.parent = list(range(self.cols * rows))
+        self.size = [1] * (self.cols * rows)
+
+        for col in range(self.cols):
+            slots = self.slots[col]
+            right = self.slots[col + 1] if col + 1 < self.cols else None
+            for row in range(rows):
+                balloon = slots[row]
+                if balloon is None:
+                    continue
+                idx = col * rows + row
+                below = slots[row + 1] if row + 1 < rows else None
+                if below is not None and below.color_idx == balloon.color_idx:
+                    self._union(idx, idx + 1)
+                if right is not None:
+                    neighbor = right[row]
+                    if neighbor is not None and neighbor.color_idx == balloon.color_idx:
+                        self._union(idx, idx + rows)
+
+        self.members = {}
+        for col in range(self.cols):
+            for row in range(rows):
+                balloon = self.slots[col][row]
+                if balloon is not None:
+                    root = self._find(col * rows + row)
+                    self.members.setdefault(root, []).append(balloon)
+
+        self.components_stale = False
+
+    def component(self, col, row):
+        """Get all balloons connected to a slot by the same color."""
+        if self.get(col, row) is None:
+            return []
+        if self.components_stale:
+            self._rebuild_components()
+        return self.members[self._find(col * self.rows + row)]
+
+    def component_size(self, col, row):
+        """Get the size of the same-color component containing a slot."""
+        if self.get(col, row) is None:
+            return 0
+        if self.components_stale:
+            self._rebuild_components()
+        return self.size[self._find(col * self.rows + row)]
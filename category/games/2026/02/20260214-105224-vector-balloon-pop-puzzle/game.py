@@ -4,6 +4,7 @@ import math
 import random
 import pygame
 from config import *
+from board import BalloonGrid
 
 
 class Balloon:
@@ -138,6 +139,7 @@ class Game:
     def reset_game(self):
         """Reset game to initial state."""
         self.balloons = []
+        self.grid = BalloonGrid(GRID_COLS, GRID_ROWS)
         self.darts = []
         self.launcher = Launcher()
         self.score = 0
@@ -153,46 +155,21 @@ class Game:
             for col in range(GRID_COLS):
                 if random.random() < 0.85:  # 85% fill rate
                     color_idx = random.randint(0, len(BALLOON_COLORS) - 1)
-                    self.balloons.append(Balloon(col, row, color_idx))
+                    balloon = Balloon(col, row, color_idx)
+                    self.balloons.append(balloon)
+                    self.grid.place(balloon)
 
     def get_balloon_at(self, col, row):
         """Get balloon at grid position."""
-        for balloon in self.balloons:
-            if not balloon.popping and balloon.col == col and balloon.row == row:
-                return balloon
-        return None
-
-    def get_neighbors(self, balloon):
-        """Get adjacent balloons of the same color."""
-        neighbors = []
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-
-        for dx, dy in directions:
-            neighbor = self.get_balloon_at(balloon.col + dx, balloon.row + dy)
-            if neighbor and neighbor.color_idx == balloon.color_idx:
-                neighbors.append(neighbor)
-
-        return neighbors
+        return self.grid.get(col, row)
 
     def find_chain(self, start_balloon):
         """Find all connected balloons of the same color."""
-        visited = set()
-        queue = [start_balloon]
-        chain = []
+        return list(self.grid.component(start_balloon.col, start_balloon.row))
 
-        while queue:
-            balloon = queue.pop(0)
-            if balloon in visited:
-                continue
-
-            visited.add(balloon)
-            chain.append(balloon)
-
-            for neighbor in self.get_neighbors(balloon):
-                if neighbor not in visited:
-                    queue.append(neighbor)
-
-        return chain
+    def get_chain_size(self, col, row):
+        """Get the size of the chain a hit at a grid position would pop."""
+        return self.grid.component_size(col, row)
 
     def pop_chain(self, chain):
         """Pop a chain of balloons and update score."""
@@ -203,34 +180,67 @@ class Game:
             if not balloon.popping:
                 balloon.popping = True
                 self.pop_queue.append(balloon)
+                self.grid.remove(balloon)
+
+    def find_balloon_near(self, x, y, radius):
+        """Find a balloon overlapping a circle, checking only nearby columns."""
+        reach = CELL_SIZE // 2 + radius
+        first_col = max(0, (int(x) - reach - GRID_START_X) // CELL_SIZE)
+        last_col = min(GRID_COLS - 1, (int(x) + reach - GRID_START_X) // CELL_SIZE)
+
+        for col in range(first_col, last_col + 1):
+            bx = GRID_START_X + col * CELL_SIZE + CELL_SIZE // 2
+            dx_sq = (x - bx) ** 2
+            for balloon in self.grid.slots[col]:
+                if balloon is None:
+                    continue
+                hit_distance = balloon.radius + radius
+                if dx_sq + (y - balloon.y) ** 2 < hit_distance * hit_distance:
+                    return balloon
+
+        return None
 
     def check_dart_collision(self, dart):
         """Check if dart hits any balloon."""
-        for balloon in self.balloons:
-            if balloon.popping:
-                continue
+        return self.find_balloon_near(dart.x, dart.y, dart.radius)
+
+    def trace_shot(self, x, angle):
+        """Get the balloon a dart fired from the given position and angle would hit."""
+        dart = Dart(x + math.cos(angle) * LAUNCHER_HEIGHT // 2,
+                    LAUNCHER_Y - math.sin(angle) * LAUNCHER_HEIGHT // 2,
+                    angle)
+        while True:
+            dart.update()
+            if not dart.active:
+                return None
+            balloon = self.find_balloon_near(dart.x, dart.y, dart.radius)
+            if balloon:
+                return balloon
 
-            bx = GRID_START_X + balloon.col * CELL_SIZE + CELL_SIZE // 2
-            by = balloon.y
+    def find_best_shot(self, x=None, steps=64):
+        """Search launcher angles for the shot that pops the largest chain.
 
-            distance = math.sqrt((dart.x - bx) ** 2 + (dart.y - by) ** 2)
+        Returns (angle, balloon, chain_size); balloon is None if no angle hits.
+        """
+        if x is None:
+            x = self.launcher.x
 
-            if distance < balloon.radius + dart.radius:
-                return balloon
+        best = (math.pi / 2, None, 0)
+        for i in range(steps + 1):
+            angle = math.pi / 4 + (math.pi / 2) * i / steps
+            balloon = self.trace_shot(x, angle)
+            if balloon is None:
+                continue
+            size = self.get_chain_size(balloon.col, balloon.row)
+            if size > best[2]:
+                best = (angle, balloon, size)
 
-        return None
+        return best
 
     def update_balloon_positions(self):
         """Update balloon positions after pops (floating up)."""
-        for col in range(GRID_COLS):
-            balloons_in_col = sorted(
-                [b for b in self.balloons if not b.popping and b.col == col],
-                key=lambda b: b.row
-            )
-
-            for new_row, balloon in enumerate(balloons_in_col):
-                balloon.row = new_row
-                balloon.target_y = GRID_START_Y + new_row * CELL_SIZE + CELL_SIZE // 2
+        for balloon in self.grid.settle():
+            balloon.target_y = GRID_START_Y + balloon.row * CELL_SIZE + CELL_SIZE // 2
 
     def handle_input(self):
         """Handle keyboard input."""
@@ -288,12 +298,11 @@ class Game:
             balloon.move_towards_target()
 
         # Check if update needed after pops
-        if self.pop_queue:
+        if self.grid.needs_settle:
             self.update_balloon_positions()
 
         # Check win/lose conditions
-        active_balloons = [b for b in self.balloons if not b.popping]
-        if not active_balloons:
+        if self.grid.count == 0:
             self.game_over = True
             self.won = True
         elif self.darts_remaining == 0 and not self.darts:
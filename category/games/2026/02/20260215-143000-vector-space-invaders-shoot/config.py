@@ -30,6 +30,9 @@ ALIEN_MOVE_SPEED_START = 1
 BUNKER_WIDTH = 60
 BUNKER_HEIGHT = 40
 NUM_BUNKERS = 4
+BUNKER_CRATER_RADIUS = 6
+
+PARTICLE_CAPACITY = 4096
 
 ALIEN_SHOOT_CHANCE = 0.002
 ALIEN_BULLET_SPEED = 4
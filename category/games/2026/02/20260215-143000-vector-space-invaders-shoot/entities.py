@@ -1,5 +1,4 @@
 import pygame
-import random
 from config import *
 
 class Player:
@@ -49,27 +48,22 @@ class Bullet:
         return pygame.Rect(self.x, self.y, self.width, self.height)
 
 class Alien:
-    def __init__(self, x, y, row):
-        self.x = x
-        self.y = y
+    """A formation slot; its position comes from the formation origin."""
+
+    def __init__(self, row, col):
         self.width = ALIEN_WIDTH
         self.height = ALIEN_HEIGHT
         self.row = row
+        self.col = col
         self.color = ALIEN_COLORS[min(row // 2, 2)]
-        self.alive = True
         self.frame = 0
 
-    def draw(self, screen):
-        if not self.alive:
-            return
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+    def draw(self, screen, x, y):
+        pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
         eye_color = (0, 0, 0)
-        pygame.draw.rect(screen, eye_color, (self.x + 8, self.y + 8, 4, 4))
-        pygame.draw.rect(screen, eye_color, (self.x + self.width - 12, self.y + 8, 4, 4))
-        pygame.draw.rect(screen, eye_color, (self.x + 10, self.y + 16, 10, 3))
-
-    def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        pygame.draw.rect(screen, eye_color, (x + 8, y + 8, 4, 4))
+        pygame.draw.rect(screen, eye_color, (x + self.width - 12, y + 8, 4, 4))
+        pygame.draw.rect(screen, eye_color, (x + 10, y + 16, 10, 3))
 
     def get_points(self):
         if self.row < 1:
@@ -79,48 +73,48 @@ class Alien:
         return POINTS_BOTTOM_ROW
 
 class Bunker:
+    """Cover that erodes pixel by pixel, stored as a pygame bitmask."""
+
+    crater = None
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.width = BUNKER_WIDTH
         self.height = BUNKER_HEIGHT
-        self.health = 4
+        self.mask = pygame.Mask((self.width, self.height), fill=True)
+        self.pixels = self.mask.count()
+        self.surface = None
 
-    def draw(self, screen):
-        alpha = int(255 * (self.health / 4))
-        color = (*BUNKER_COLOR,)
-        size = int(self.width * (self.health / 4))
-        offset = (self.width - size) // 2
-        pygame.draw.rect(screen, color, (self.x + offset, self.y, size, self.height))
-
-    def get_rect(self):
-        size = int(self.width * (self.health / 4))
-        offset = (self.width - size) // 2
-        return pygame.Rect(self.x + offset, self.y, size, self.height)
+        if Bunker.crater is None:
+            size = BUNKER_CRATER_RADIUS * 2 + 1
+            crater_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(crater_surface, (255, 255, 255), (BUNKER_CRATER_RADIUS, BUNKER_CRATER_RADIUS),
+                               BUNKER_CRATER_RADIUS)
+            Bunker.crater = pygame.mask.from_surface(crater_surface)
 
-    def hit(self):
-        self.health -= 1
-        return self.health <= 0
+    def is_intact(self):
+        return self.pixels > 0
 
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.vx = (random.random() - 0.5) * 6
-        self.vy = (random.random() - 0.5) * 6
-        self.life = 30
-        self.color = color
-        self.size = 3
+    def draw(self, screen):
+        if self.surface is None:
+            self.surface = self.mask.to_surface(setcolor=BUNKER_COLOR, unsetcolor=(0, 0, 0, 0))
+        screen.blit(self.surface, (self.x, self.y))
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= 1
-        self.size = max(1, self.size - 0.1)
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
 
-    def draw(self, screen):
-        if self.life > 0:
-            alpha = int(255 * (self.life / 30))
-            surf = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*self.color, alpha), (int(self.size), int(self.size)), int(self.size))
-            screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
+    def hit_test(self, rect):
+        """Return the first solid pixel under rect in bunker coordinates, or None."""
+        if not self.pixels or not rect.colliderect(self.get_rect()):
+            return None
+        bullet_mask = pygame.Mask(rect.size, fill=True)
+        return self.mask.overlap(bullet_mask, (rect.x - self.x, rect.y - self.y))
+
+    def hit(self, point):
+        """Blast a crater around a bunker-local point. Returns True once nothing is left."""
+        px, py = point
+        self.mask.erase(Bunker.crater, (px - BUNKER_CRATER_RADIUS, py - BUNKER_CRATER_RADIUS))
+        self.pixels = self.mask.count()
+        self.surface = None
+        return self.pixels == 0
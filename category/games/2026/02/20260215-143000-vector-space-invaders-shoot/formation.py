@@ -0,0 +1,95 @@
+import pygame
+from config import *
+from entities import Alien
+
+
+class Formation:
+    """The alien grid, positioned by a single origin with alive bitmasks.
+
+    Bit ``col`` of ``row_masks[row]`` and bit ``row`` of ``col_masks[col]``
+    are set while that alien lives. Bullet hits are resolved arithmetically
+    from the origin, so the per-frame cost does not grow with the grid.
+    """
+
+    def __init__(self, rows=ALIEN_ROWS, cols=ALIEN_COLS):
+        self.rows = rows
+        self.cols = cols
+        self.cell_w = ALIEN_WIDTH + ALIEN_PADDING
+        self.cell_h = ALIEN_HEIGHT + ALIEN_PADDING
+
+        total_width = cols * self.cell_w - ALIEN_PADDING
+        self.origin_x = (SCREEN_WIDTH - total_width) // 2
+        self.origin_y = ALIEN_START_Y
+
+        self.aliens = [[Alien(row, col) for col in range(cols)] for row in range(rows)]
+        self.row_masks = [(1 << cols) - 1] * rows
+        self.col_masks = [(1 << rows) - 1] * cols
+        self.lowest_row = [rows - 1] * cols
+        self.alive_cols = (1 << cols) - 1
+        self.alive_rows = (1 << rows) - 1
+        self.count = rows * cols
+
+    def alien_x(self, col):
+        return self.origin_x + col * self.cell_w
+
+    def alien_y(self, row):
+        return self.origin_y + row * self.cell_h
+
+    def is_alive(self, row, col):
+        return (self.row_masks[row] >> col) & 1 == 1
+
+    def bounds(self):
+        """Left x, right x and bottom y of the living aliens, or None if empty."""
+        if self.count == 0:
+            return None
+        cols = self.alive_cols
+        left = (cols & -cols).bit_length() - 1
+        right = cols.bit_length() - 1
+        bottom = self.alive_rows.bit_length() - 1
+        return (self.alien_x(left),
+                self.alien_x(right) + ALIEN_WIDTH,
+                self.alien_y(bottom) + ALIEN_HEIGHT)
+
+    def kill(self, row, col):
+        """Clear an alien from the masks and return it."""
+        self.row_masks[row] &= ~(1 << col)
+        self.col_masks[col] &= ~(1 << row)
+        self.lowest_row[col] = self.col_masks[col].bit_length() - 1
+        if not self.col_masks[col]:
+            self.alive_cols &= ~(1 << col)
+        if not self.row_masks[row]:
+            self.alive_rows &= ~(1 << row)
+        self.count -= 1
+        return self.aliens[row][col]
+
+    def hit_test(self, rect):
+        """Return (row, col) of the first living alien overlapping rect, or None."""
+        ox, oy = self.origin_x, self.origin_y
+        col_lo = max(0, int((rect.x - ALIEN_WIDTH - ox) // self.cell_w))
+        col_hi = min(self.cols - 1, int((rect.right - ox) // self.cell_w))
+        row_lo = max(0, int((rect.y - ALIEN_HEIGHT - oy) // self.cell_h))
+        row_hi = min(self.rows - 1, int((rect.bottom - oy) // self.cell_h))
+
+        for row in range(row_lo, row_hi + 1):
+            row_mask = self.row_masks[row]
+            if not row_mask:
+                continue
+            for col in range(col_lo, col_hi + 1):
+                if (row_mask >> col) & 1 and rect.colliderect(
+                        pygame.Rect(self.alien_x(col), self.alien_y(row), ALIEN_WIDTH, ALIEN_HEIGHT)):
+                    return row, col
+        return None
+
+    def shooters(self):
+        """(row, col) of the lowest living alien in every non-empty column."""
+        return [(row, col) for col, row in enumerate(self.lowest_row) if row >= 0]
+
+    def draw(self, screen):
+        for row, row_mask in enumerate(self.row_masks):
+            y = self.alien_y(row)
+            col = 0
+            while row_mask:
+                if row_mask & 1:
+                    self.aliens[row][col].draw(screen, self.alien_x(col), y)
+                row_mask >>= 1
+                col += 1
@@ -1,6 +1,8 @@
 import pygame
 import random
-from entities import Player, Bullet, Alien, Bunker, Particle
+from entities import Player, Bullet, Bunker
+from formation import Formation
+from particles import ParticleSystem
 from config import *
 
 class Game:
@@ -24,9 +26,8 @@ class Game:
         self.won = False
         self.bullets = []
         self.alien_bullets = []
-        self.aliens = []
         self.bunkers = []
-        self.particles = []
+        self.particles = ParticleSystem(PARTICLE_CAPACITY, shrink=True, min_size=1)
         self.alien_direction = 1
         self.alien_speed = ALIEN_MOVE_SPEED_START
         self.alien_move_timer = 0
@@ -35,15 +36,7 @@ class Game:
         self.create_bunkers()
 
     def create_aliens(self):
-        self.aliens = []
-        total_width = ALIEN_COLS * (ALIEN_WIDTH + ALIEN_PADDING) - ALIEN_PADDING
-        start_x = (SCREEN_WIDTH - total_width) // 2
-
-        for row in range(ALIEN_ROWS):
-            for col in range(ALIEN_COLS):
-                x = start_x + col * (ALIEN_WIDTH + ALIEN_PADDING)
-                y = ALIEN_START_Y + row * (ALIEN_HEIGHT + ALIEN_PADDING)
-                self.aliens.append(Alien(x, y, row))
+        self.formation = Formation()
 
     def create_bunkers(self):
         self.bunkers = []
@@ -83,22 +76,13 @@ class Game:
 
     def alien_shoot(self):
         if random.random() < ALIEN_SHOOT_CHANCE * (1 + self.level * 0.2):
-            bottom_aliens = self.get_bottom_aliens()
-            if bottom_aliens:
-                alien = random.choice(bottom_aliens)
-                bullet_x = alien.x + alien.width // 2 - BULLET_WIDTH // 2
-                bullet_y = alien.y + alien.height
+            shooters = self.formation.shooters()
+            if shooters:
+                row, col = random.choice(shooters)
+                bullet_x = self.formation.alien_x(col) + ALIEN_WIDTH // 2 - BULLET_WIDTH // 2
+                bullet_y = self.formation.alien_y(row) + ALIEN_HEIGHT
                 self.alien_bullets.append(Bullet(bullet_x, bullet_y, ALIEN_BULLET_SPEED, (255, 100, 100)))
 
-    def get_bottom_aliens(self):
-        bottom_by_col = {}
-        for alien in self.aliens:
-            if alien.alive:
-                col = alien.x // (ALIEN_WIDTH + ALIEN_PADDING)
-                if col not in bottom_by_col or alien.y > bottom_by_col[col].y:
-                    bottom_by_col[col] = alien
-        return list(bottom_by_col.values())
-
     def update(self):
         if self.game_over or self.won:
             return
@@ -127,18 +111,17 @@ class Game:
 
             bullet_rect = bullet.get_rect()
 
-            for alien in self.aliens:
-                if alien.alive and bullet_rect.colliderect(alien.get_rect()):
-                    alien.alive = False
-                    bullet.active = False
-                    self.score += alien.get_points()
-                    self.create_explosion(alien.x + alien.width // 2, alien.y + alien.height // 2, alien.color)
-                    break
+            hit = self.formation.hit_test(bullet_rect)
+            if hit:
+                row, col = hit
+                alien = self.formation.kill(row, col)
+                bullet.active = False
+                self.score += alien.get_points()
+                self.create_explosion(self.formation.alien_x(col) + ALIEN_WIDTH // 2,
+                                      self.formation.alien_y(row) + ALIEN_HEIGHT // 2, alien.color)
 
-            for bunker in self.bunkers:
-                if bunker.health > 0 and bullet_rect.colliderect(bunker.get_rect()):
-                    bullet.active = False
-                    break
+            if bullet.active:
+                self.hit_bunkers(bullet, bullet_rect)
 
             if not bullet.active:
                 self.bullets.remove(bullet)
@@ -158,71 +141,60 @@ class Game:
                 self.alien_bullets.remove(bullet)
                 continue
 
-            for bunker in self.bunkers:
-                if bunker.health > 0 and bullet_rect.colliderect(bunker.get_rect()):
-                    if bunker.hit():
-                        self.create_explosion(bunker.x + bunker.width // 2, bunker.y + bunker.height // 2, BUNKER_COLOR)
-                    bullet.active = False
-                    break
+            self.hit_bunkers(bullet, bullet_rect)
 
             if not bullet.active:
                 self.alien_bullets.remove(bullet)
 
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.life <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
 
-        alive_aliens = [a for a in self.aliens if a.alive]
-        if not alive_aliens:
+        if self.formation.count == 0:
             self.level += 1
             self.alien_speed += 0.5
             self.alien_move_delay = max(5, 30 - self.level * 2)
             self.create_aliens()
 
-        for alien in alive_aliens:
-            if alien.y + alien.height >= self.player.y:
-                self.game_over = True
+        if self.formation.bounds()[2] >= self.player.y:
+            self.game_over = True
 
-    def move_aliens(self):
-        should_move_down = False
-        should_reverse = False
+    def hit_bunkers(self, bullet, bullet_rect):
+        """Erode the first bunker a bullet touches and stop the bullet."""
+        for bunker in self.bunkers:
+            point = bunker.hit_test(bullet_rect)
+            if point:
+                if bunker.hit(point):
+                    self.create_explosion(bunker.x + bunker.width // 2, bunker.y + bunker.height // 2, BUNKER_COLOR)
+                bullet.active = False
+                return
 
-        for alien in self.aliens:
-            if not alien.alive:
-                continue
-            new_x = alien.x + self.alien_direction * self.alien_speed * 10
-            if new_x <= 0 or new_x + alien.width >= SCREEN_WIDTH:
-                should_reverse = True
-                should_move_down = True
-                break
+    def move_aliens(self):
+        bounds = self.formation.bounds()
+        if bounds is None:
+            return
 
-        if should_reverse:
+        # The whole formation moves together, so only its edges need checking
+        left, right, _ = bounds
+        step = self.alien_direction * self.alien_speed * 10
+        if left + step <= 0 or right + step >= SCREEN_WIDTH:
             self.alien_direction *= -1
+            self.formation.origin_y += ALIEN_DROP_DISTANCE
+        else:
+            self.formation.origin_x += step
 
-        for alien in self.aliens:
-            if alien.alive:
-                if should_move_down:
-                    alien.y += ALIEN_DROP_DISTANCE
-                else:
-                    alien.x += self.alien_direction * self.alien_speed * 10
-
-                if alien.y + alien.height >= self.player.y:
-                    self.game_over = True
+        if self.formation.bounds()[2] >= self.player.y:
+            self.game_over = True
 
     def create_explosion(self, x, y, color):
-        for _ in range(10):
-            self.particles.append(Particle(x, y, color))
+        self.particles.emit(x, y, 10, [color], life=(30, 30), size=(3, 3), spread=3)
 
     def draw(self):
         self.screen.fill(BACKGROUND_COLOR)
 
         for bunker in self.bunkers:
-            if bunker.health > 0:
+            if bunker.is_intact():
                 bunker.draw(self.screen)
 
-        for alien in self.aliens:
-            alien.draw(self.screen)
+        self.formation.draw(self.screen)
 
         for bullet in self.bullets:
             bullet.draw(self.screen)
@@ -230,8 +202,7 @@ class Game:
         for bullet in self.alien_bullets:
             bullet.draw(self.screen)
 
-        for particle in self.particles:
-            particle.draw(self.screen)
+        self.particles.draw(self.screen)
 
         if self.player.alive:
             self.player.draw(self.screen)
@@ -0,0 +1,142 @@
+"""Pooled particle system with NumPy struct-of-arrays storage."""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+# Brightness steps used to cache faded dot sprites
+FADE_LEVELS = 16
+
+
+class ParticleSystem:
+    """Fixed-capacity particles integrated and culled with vectorized NumPy.
+
+    Live particles always occupy the first ``count`` rows of every array.
+    Dead ones are dropped by compacting the arrays in one masked copy, and
+    emits beyond capacity are discarded. Colors are stored as indices into a
+    small palette so each (color, size, fade level) dot is rendered once and
+    reused, and the whole system is drawn with a single ``Surface.blits``.
+    """
+
+    def __init__(self, capacity: int, drag: float = 1.0, shrink: bool = False,
+                 min_size: int = 0, fade_alpha: bool = True, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.drag = drag
+        self.shrink = shrink
+        self.min_size = min_size
+        self.fade_alpha = fade_alpha
+        self.rng = np.random.default_rng(seed)
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+        self.count = 0
+
+        self.palette: List[Tuple[int, int, int]] = []
+        self.palette_index: Dict[Tuple[int, int, int], int] = {}
+        self.sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def _color_id(self, color: Tuple[int, int, int]) -> int:
+        color = tuple(color)
+        idx = self.palette_index.get(color)
+        if idx is None:
+            idx = len(self.palette)
+            self.palette.append(color)
+            self.palette_index[color] = idx
+        return idx
+
+    def emit(self, x: float, y: float, count: int, colors: Sequence[Tuple[int, int, int]],
+             life: Tuple[int, int] = (20, 40), size: Tuple[int, int] = (2, 5),
+             spread: float = 3.0, speed: Optional[Tuple[float, float]] = None) -> None:
+        """Spawn a burst at (x, y).
+
+        Velocities are uniform in a +/-spread box, or uniform in direction
+        with a speed in ``speed`` when given. Life and size are inclusive
+        integer ranges; each particle picks one of ``colors`` at random.
+        """
+        start = self.count
+        n = min(count, self.capacity - start)
+        if n <= 0:
+            return
+        end = start + n
+        rng = self.rng
+
+        self.pos[start:end] = (x, y)
+        if speed is None:
+            self.vel[start:end] = rng.uniform(-spread, spread, (n, 2))
+        else:
+            angle = rng.uniform(0, 2 * np.pi, n)
+            magnitude = rng.uniform(speed[0], speed[1], n)
+            self.vel[start:end, 0] = np.cos(angle) * magnitude
+            self.vel[start:end, 1] = np.sin(angle) * magnitude
+
+        lifetimes = rng.integers(life[0], life[1] + 1, n)
+        self.life[start:end] = lifetimes
+        self.max_life[start:end] = lifetimes
+        self.size[start:end] = rng.integers(size[0], size[1] + 1, n)
+
+        ids = np.array([self._color_id(c) for c in colors], dtype=np.uint8)
+        self.color[start:end] = ids[rng.integers(0, len(ids), n)]
+        self.count = end
+
+    def update(self) -> None:
+        """Integrate every live particle and compact out the dead ones."""
+        n = self.count
+        if n == 0:
+            return
+
+        self.pos[:n] += self.vel[:n]
+        if self.drag != 1.0:
+            self.vel[:n] *= self.drag
+        self.life[:n] -= 1
+
+        alive = self.life[:n] > 0
+        kept = int(np.count_nonzero(alive))
+        if kept < n:
+            for array in (self.pos, self.vel, self.life, self.max_life, self.size, self.color):
+                array[:kept] = array[:n][alive]
+            self.count = kept
+
+    def _sprite(self, color_id: int, radius: int, level: int) -> pygame.Surface:
+        key = (color_id, radius, level)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            color = self.palette[color_id]
+            fade = level / FADE_LEVELS
+            if self.fade_alpha:
+                rgba = (*color, int(255 * fade))
+            else:
+                rgba = (*(int(c * fade) for c in color), 255)
+            sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, rgba, (radius, radius), radius)
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Blit every live particle from the sprite cache in one call."""
+        n = self.count
+        if n == 0:
+            return
+
+        frac = self.life[:n] / self.max_life[:n]
+        levels = np.ceil(frac * FADE_LEVELS).astype(np.int32)
+        radii = self.size[:n] * frac if self.shrink else self.size[:n]
+        radii = np.maximum(radii.astype(np.int32), self.min_size)
+        xs = self.pos[:n, 0].astype(np.int32) - radii
+        ys = self.pos[:n, 1].astype(np.int32) - radii
+
+        sprite = self._sprite
+        surface.blits([(sprite(c, r, lvl), (x, y))
+                       for c, r, lvl, x, y in zip(self.color[:n].tolist(), radii.tolist(),
+                                                   levels.tolist(), xs.tolist(), ys.tolist())
+                       if r > 0], False)